@@ -15,14 +15,14 @@ from util.sql_targets import sql_files_to_tables
 from util.run_history import init_run_history
 
 from core.args import parse_args, parse_params_override
-from core.dryrun import dryrun_check, write_dryrun_report
+from core.dryrun import dryrun_check, dryrun_parse, write_dryrun_report
 
 from oracle.sql_loader import collect_sql_files
 from transform.csv_to_excel import csv_to_excel
 
 from duckdb_ops.load_csv import load_csv_to_duckdb
 from duckdb_ops.load_parquet import load_parquet_to_duckdb
-from duckdb_ops.union_views import create_union_views
+from duckdb_ops.union_views import create_union_views, create_union_tables, create_union_parquet
 
 from stats.slow_sql import write_slow_sql_top10
 
@@ -107,11 +107,13 @@ def main():
     # -----------------------------------------------------
     if args.source == "oracle":
         from oracle.client import init_oracle_client as init_client
+        from oracle.client import get_oracle_conn as get_conn
         from oracle.export_csv import export_oracle_to_csv as export_csv
         from oracle.export_parquet_stream import export_oracle_to_parquet_stream as export_parquet
 
     elif args.source == "vertica":
         from vertica.client import init_vertica_client as init_client
+        from vertica.client import get_vertica_conn as get_conn
         from vertica.export_csv import export_vertica_to_csv as export_csv
         from vertica.export_parquet_stream import export_vertica_to_parquet_stream as export_parquet
 
@@ -145,14 +147,27 @@ def main():
         for host in run_hosts:
             sql_files = collect_sql_files(args.source, host, sql_subdirs)
 
-            rows.extend(
-                dryrun_check(
+            host_rows = dryrun_check(
+                host,
+                sql_files,
+                params,
+                batch_ts,
+            )
+
+            # 문법 / 권한 / 결과 컬럼을 source 에서 parse 로 확인 (실행하지 않음)
+            if args.dryrun_parse:
+                dryrun_parse(
+                    host_rows,
+                    args.source,
                     host,
+                    hosts_cfg[host],
                     sql_files,
                     params,
-                    batch_ts,
+                    get_conn,
+                    workers=args.dryrun_workers,
                 )
-            )
+
+            rows.extend(host_rows)
 
         write_dryrun_report(rows, batch_ts)
 
@@ -239,7 +254,12 @@ def main():
         # -------------------------------------------------
         logging.info("DuckDB LOAD start | schema=%s | tables=%d", schema, len(target_tables))
         if export_format == "parquet":
-            load_parquet_to_duckdb(DUCKDB_FILE, schema, target_tables)
+            load_parquet_to_duckdb(
+                DUCKDB_FILE,
+                schema,
+                target_tables,
+                bulk=args.parquet_bulk_load,
+            )
         else:
             load_csv_to_duckdb(
                 DUCKDB_FILE,
@@ -263,11 +283,26 @@ def main():
     for host in run_hosts:
         schema = hosts_cfg[host].get("duckdb_schema", host)
 
-        create_union_views(
-            DUCKDB_FILE,
-            schema,
-            tables_by_host[host],
-        )
+        if args.union_mode == "table":
+            create_union_tables(
+                DUCKDB_FILE,
+                schema,
+                tables_by_host[host],
+                refresh=args.union_refresh,
+            )
+        elif args.union_mode == "parquet":
+            create_union_parquet(
+                DUCKDB_FILE,
+                schema,
+                tables_by_host[host],
+                refresh=args.union_refresh,
+            )
+        else:
+            create_union_views(
+                DUCKDB_FILE,
+                schema,
+                tables_by_host[host],
+            )
 
     write_slow_sql_top10(batch_date)
 
@@ -0,0 +1,428 @@
+# benchmarks/run_bench.py
+"""
+export / load hot path 벤치마크 (실 Oracle / Vertica 불필요)
+
+  python -m benchmarks.run_bench                       # 전체, 200,000 rows
+  python -m benchmarks.run_bench --rows 1000000 --cases export_csv,load_duckdb
+  python -m benchmarks.run_bench --compare benchmarks/results/bench_20260101_120000.json
+
+결과: benchmarks/results/bench_<ts>.json (case 별 rows/sec, elapsed, peak RSS)
+--compare 지정 시 이전 결과 대비 rows/sec 변화율 출력
+"""
+import argparse
+import csv
+import gc
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from benchmarks.synthetic import SyntheticConnection, DEFAULT_TYPES, parse_types  # noqa: E402
+
+RESULT_DIR = BASE_DIR / "benchmarks" / "results"
+
+logger = logging.getLogger("bench")
+
+
+# =========================================================
+# peak RSS 측정
+# =========================================================
+class RssSampler(threading.Thread):
+    """
+    case 실행 중 RSS 최대값 sampling (psutil 없으면 ru_maxrss 로 대체)
+    """
+
+    def __init__(self, interval: float = 0.01):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self._stopped = threading.Event()
+        try:
+            import psutil
+            self._proc = psutil.Process()
+        except ImportError:
+            self._proc = None
+
+    def rss(self) -> int:
+        if self._proc is not None:
+            return self._proc.memory_info().rss
+        import resource
+        kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return kb if sys.platform == "darwin" else kb * 1024
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, self.rss())
+
+    def stop(self) -> int:
+        self._stopped.set()
+        self.join()
+        self.peak = max(self.peak, self.rss())
+        return self.peak
+
+
+# =========================================================
+# Bench context (case 간 공유: 생성한 CSV 를 load case 입력으로 재사용)
+# =========================================================
+class Bench:
+
+    def __init__(self, work_dir: Path, rows: int, types: list[str]):
+        self.work_dir = work_dir
+        self.rows = rows
+        self.types = types
+        self.files: dict[str, Path] = {}
+
+    def conn(self):
+        return SyntheticConnection(self.rows, self.types)
+
+    def export_csv(self, compression: str) -> Path:
+        from v2.adapters.sources.oracle_source import export_sql_to_csv
+
+        ext = "csv.gz" if compression == "gzip" else "csv"
+        out = self.work_dir / f"BENCH__{compression}.{ext}"
+        n = export_sql_to_csv(
+            conn=self.conn(),
+            sql_text="SELECT * FROM BENCH",
+            out_file=out,
+            logger=logger,
+            compression=compression,
+            manifest={"sql_hash": "bench", "params": {}},
+        )
+        assert n == self.rows, n
+        self.files[compression] = out
+        return out
+
+    def csv_file(self) -> Path:
+        if "none" not in self.files:
+            self.export_csv("none")
+        return self.files["none"]
+
+
+# =========================================================
+# cases: 각 함수는 처리 단위 수(rows / params / parts) 반환
+# =========================================================
+def case_export_csv(b: Bench) -> int:
+    b.export_csv("none")
+    return b.rows
+
+
+def case_export_csv_gzip(b: Bench) -> int:
+    b.export_csv("gzip")
+    return b.rows
+
+
+def case_export_parquet(b: Bench) -> int:
+    """
+    v1 export_parquet_stream 과 같은 경로: description → registry 타입 → arrow → ParquetWriter
+    """
+    import pyarrow.parquet as pq
+    from util.manifest import HashingWriter
+    from util.schema_registry import columns_from_description, arrow_schema, rows_to_arrow
+
+    cur = b.conn().cursor()
+    cur.execute("SELECT * FROM BENCH")
+    columns = columns_from_description(cur.description)
+    schema = arrow_schema({"columns": columns}, [c["name"] for c in columns])
+
+    out = b.work_dir / "BENCH.parquet"
+    total = 0
+    sink = HashingWriter(open(out, "wb"))
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    try:
+        while True:
+            rows = cur.fetchmany(100_000)
+            if not rows:
+                break
+            writer.write_table(rows_to_arrow(rows, schema))
+            total += len(rows)
+    finally:
+        writer.close()
+        sink.close()
+
+    return total
+
+
+def case_load_duckdb(b: Bench) -> int:
+    from v2.adapters.targets.duckdb_target import connect, load_csv, _ensure_history
+
+    csv_file = b.csv_file()
+    db = b.work_dir / "bench.duckdb"
+    db.unlink(missing_ok=True)
+
+    con = connect(db)
+    try:
+        _ensure_history(con)
+        return load_csv(con, "bench", "BENCH", csv_file, "bench", "retry")
+    finally:
+        con.close()
+
+
+def case_load_sqlite(b: Bench) -> int:
+    from v2.adapters.targets.sqlite_target import connect, load_csv, _ensure_history
+
+    csv_file = b.csv_file()
+    db = b.work_dir / "bench.sqlite"
+    db.unlink(missing_ok=True)
+
+    con = connect(db)
+    try:
+        _ensure_history(con)
+        return load_csv(con, "bench", "BENCH", csv_file, "bench", "retry")
+    finally:
+        con.close()
+
+
+def case_load_oracle_convert(b: Bench) -> int:
+    """
+    Oracle target 은 DB 가 필요하므로 executemany 직전의 typed bind 변환만 측정
+    """
+    from decimal import Decimal
+    from v2.adapters.targets.oracle_target import _convert_batch, _CONVERTERS
+
+    kinds = {"int": "int64", "float": "float64", "date": "date", "ts": "timestamp"}
+    typed = []
+    for t in b.types:
+        if t == "decimal":
+            typed.append([t, "decimal(18,2)", Decimal, None])
+        elif t in kinds:
+            typed.append([t, kinds[t], _CONVERTERS[kinds[t]], None])
+        else:
+            typed.append([t, "string", None, None])
+
+    total = 0
+    with open(b.csv_file(), "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        batch = []
+        for row in reader:
+            batch.append(row)
+            if len(batch) >= 1000:
+                total += len(_convert_batch(batch, typed, "BENCH"))
+                batch = []
+        if batch:
+            total += len(_convert_batch(batch, typed, "BENCH"))
+
+    return total
+
+
+def case_param_expand(b: Bench) -> int:
+    from v2.stages.export_stage import expand_params
+    from util.param_expand import expand_param_value
+
+    params = {
+        "clsYymm": "200001:202512",
+        "grp": ",".join(f"G{i:02d}" for i in range(20)),
+        "region": "A,B,C",
+    }
+
+    total = 0
+    for _ in range(20):
+        total += len(expand_params(params))
+        total += len(expand_param_value("200001:202512"))
+    return total
+
+
+def case_render_sql(b: Bench) -> int:
+    from v2.stages.export_stage import expand_params, _render_sql, sanitize_sql
+    from oracle.sql_utils import apply_params
+
+    template = (
+        "SELECT a.*, b.name\n"
+        "  FROM fact_${clsYymm} a\n"
+        "  JOIN dim b ON b.id = a.id\n"
+        " WHERE a.cls_yymm = :clsYymm\n"
+        "   AND a.grp = '{#grp}'\n"
+        "   AND a.region = :region\n"
+        "   AND a.ts >= TO_DATE('2020-01-01 00:00:00', 'YYYY-MM-DD HH24:MI:SS');\n"
+    )
+    param_sets = expand_params({
+        "clsYymm": "200001:202512",
+        "grp": ",".join(f"G{i:02d}" for i in range(20)),
+        "region": "A,B,C",
+    })
+
+    for p in param_sets:
+        sanitize_sql(_render_sql(template, p))
+        apply_params(template, p)
+
+    return len(param_sets) * 2
+
+
+UNION_TABLES, UNION_PARTS = 5, 60
+
+
+def prepare_union_views(b: Bench):
+    import duckdb
+
+    db = b.work_dir / "union.duckdb"
+    if db.exists():
+        return
+
+    con = duckdb.connect(str(db))
+    con.execute('CREATE SCHEMA IF NOT EXISTS "bench"')
+    for t in range(UNION_TABLES):
+        for p in range(UNION_PARTS):
+            con.execute(
+                f'CREATE TABLE "bench"."T{t}__clsYymm={200001 + p}" AS '
+                f"SELECT range AS id, 'x' AS v FROM range(100)"
+            )
+    con.close()
+
+
+def case_union_views(b: Bench) -> int:
+    from duckdb_ops.union_views import create_union_views
+
+    create_union_views(b.work_dir / "union.duckdb", "bench",
+                       {f"T{t}" for t in range(UNION_TABLES)})
+    return UNION_TABLES * UNION_PARTS
+
+
+CASES = {
+    "export_csv": case_export_csv,
+    "export_csv_gzip": case_export_csv_gzip,
+    "export_parquet": case_export_parquet,
+    "load_duckdb": case_load_duckdb,
+    "load_sqlite": case_load_sqlite,
+    "load_oracle_convert": case_load_oracle_convert,
+    "param_expand": case_param_expand,
+    "render_sql": case_render_sql,
+    "union_views": case_union_views,
+}
+
+# 측정 전 준비 (시간 / RSS 측정 제외)
+PREPARE = {
+    "load_duckdb": Bench.csv_file,
+    "load_sqlite": Bench.csv_file,
+    "load_oracle_convert": Bench.csv_file,
+    "union_views": prepare_union_views,
+}
+
+
+# =========================================================
+# runner
+# =========================================================
+def run_case(name: str, b: Bench, repeat: int) -> dict:
+    best = None
+
+    if name in PREPARE:
+        PREPARE[name](b)
+
+    for _ in range(repeat):
+        gc.collect()
+        sampler = RssSampler()
+        base_rss = sampler.rss()
+        sampler.start()
+
+        start = time.perf_counter()
+        units = CASES[name](b)
+        elapsed = time.perf_counter() - start
+
+        peak = sampler.stop()
+
+        if best is None or elapsed < best["elapsed_sec"]:
+            best = {
+                "units": units,
+                "elapsed_sec": round(elapsed, 4),
+                "units_per_sec": round(units / elapsed, 1) if elapsed > 0 else None,
+                "peak_rss_mb": round(peak / (1024 * 1024), 1),
+                "rss_delta_mb": round(max(peak - base_rss, 0) / (1024 * 1024), 1),
+            }
+
+    best["repeat"] = repeat
+    return best
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+            stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(current: dict, prev_path: Path):
+    with open(prev_path, "r", encoding="utf-8") as f:
+        prev = json.load(f)
+
+    print(f"\ncompare vs {prev_path.name} (commit={prev['meta'].get('commit') or '-'})")
+    print(f"{'case':<22}{'prev/s':>14}{'now/s':>14}{'diff':>9}{'rss(MB)':>10}")
+    for name, r in current["results"].items():
+        p = prev.get("results", {}).get(name)
+        if not p or not p.get("units_per_sec") or not r.get("units_per_sec"):
+            print(f"{name:<22}{'-':>14}{r.get('units_per_sec') or 0:>14,.0f}{'-':>9}{r['peak_rss_mb']:>10}")
+            continue
+        diff = (r["units_per_sec"] / p["units_per_sec"] - 1) * 100
+        print(f"{name:<22}{p['units_per_sec']:>14,.0f}{r['units_per_sec']:>14,.0f}"
+              f"{diff:>+8.1f}%{r['peak_rss_mb']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="batch_runner hot path benchmarks")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=None, help="column 수 (types 반복 확장)")
+    parser.add_argument("--types", default=DEFAULT_TYPES,
+                        help="int,float,str,date,ts,decimal 조합 (default: %(default)s)")
+    parser.add_argument("--cases", default="all", help=f"comma list: {','.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 후 최단 시간 기록")
+    parser.add_argument("--out", default=None, help="결과 JSON 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s | %(message)s")
+
+    names = list(CASES) if args.cases == "all" else [c.strip() for c in args.cases.split(",")]
+    unknown = [c for c in names if c not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {unknown}")
+
+    types = parse_types(args.types, args.cols)
+
+    result = {
+        "meta": {
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rows": args.rows,
+            "types": types,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        b = Bench(Path(tmp), args.rows, types)
+
+        print(f"{'case':<22}{'units':>10}{'sec':>10}{'units/s':>14}{'rss(MB)':>10}")
+        for name in names:
+            r = run_case(name, b, args.repeat)
+            result["results"][name] = r
+            print(f"{name:<22}{r['units']:>10,}{r['elapsed_sec']:>10.3f}"
+                  f"{r['units_per_sec'] or 0:>14,.0f}{r['peak_rss_mb']:>10}")
+
+    out = Path(args.out) if args.out else (
+        RESULT_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"\nresult: {out}")
+
+    if args.compare:
+        compare(result, Path(args.compare))
+
+
+if __name__ == "__main__":
+    main()
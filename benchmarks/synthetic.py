@@ -0,0 +1,118 @@
+# benchmarks/synthetic.py
+import random
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+# =========================================================
+# 실 DB 없이 export 경로를 돌리기 위한 DB-API stand-in
+#   SyntheticConnection().cursor() → execute / description / fetchmany
+# description type_code 는 DuckDB 식 문자열 → columns_from_description 이 그대로 해석
+# =========================================================
+
+TYPE_CODES = {
+    "int": "BIGINT",
+    "float": "DOUBLE",
+    "str": "VARCHAR",
+    "date": "DATE",
+    "ts": "TIMESTAMP",
+    "decimal": "DECIMAL(18,2)",
+}
+
+DEFAULT_TYPES = "int,str,float,date,decimal,str,int,ts"
+
+
+def parse_types(spec: str, cols: int | None = None) -> list[str]:
+    """
+    "int,str,float" → cols 개수만큼 반복 확장
+    """
+    base = [t.strip() for t in spec.split(",") if t.strip()]
+    for t in base:
+        if t not in TYPE_CODES:
+            raise ValueError(f"Unknown column type: {t} (use {', '.join(TYPE_CODES)})")
+    if not cols:
+        return base
+    return [base[i % len(base)] for i in range(cols)]
+
+
+def _column_values(kind: str, n: int, rnd: random.Random) -> list:
+    """
+    컬럼 1개 분량 값 생성 (row 단위 생성보다 빠름 → 측정 대상 코드 비중 확보)
+    """
+    if kind == "int":
+        return [rnd.randrange(1, 10_000_000) for _ in range(n)]
+    if kind == "float":
+        return [rnd.random() * 1e6 for _ in range(n)]
+    if kind == "str":
+        return [f"NAME_{rnd.randrange(100_000):05d}" for _ in range(n)]
+    if kind == "date":
+        d0 = date(2020, 1, 1)
+        return [d0 + timedelta(days=rnd.randrange(2000)) for _ in range(n)]
+    if kind == "ts":
+        t0 = datetime(2020, 1, 1)
+        return [t0 + timedelta(seconds=rnd.randrange(10**8)) for _ in range(n)]
+    if kind == "decimal":
+        return [Decimal(rnd.randrange(10**8)) / 100 for _ in range(n)]
+    raise ValueError(kind)
+
+
+def make_rows(types: list[str], n: int, seed: int = 42) -> list[tuple]:
+    rnd = random.Random(seed)
+    cols = [_column_values(t, n, rnd) for t in types]
+    return list(zip(*cols))
+
+
+class SyntheticCursor:
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.arraysize = 100
+        self.description = None
+        self._pos = 0
+
+    def execute(self, sql, params=None):
+        self.description = [
+            (f"C{i + 1:02d}_{t.upper()}", TYPE_CODES[t], None, None, None, None, True)
+            for i, t in enumerate(self._conn.types)
+        ]
+        self._pos = 0
+        return self
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize
+        if self._pos >= self._conn.rows:
+            return []
+
+        n = min(size, self._conn.rows - self._pos)
+        block = self._conn.block
+        start = self._pos % len(block)
+
+        # 미리 만든 block 을 순환 (생성 비용이 측정에 섞이지 않도록)
+        out = block[start:start + n]
+        while len(out) < n:
+            out += block[:n - len(out)]
+
+        self._pos += n
+        return out
+
+    def close(self):
+        pass
+
+
+class SyntheticConnection:
+    """
+    rows 개 row 를 돌려주는 가짜 connection (block_rows 단위로 미리 생성한 row 재사용)
+    """
+
+    def __init__(self, rows: int, types: list[str], block_rows: int = 50_000, seed: int = 42):
+        self.rows = rows
+        self.types = types
+        self.block = make_rows(types, min(rows, block_rows) or 1, seed)
+
+    def cursor(self):
+        return SyntheticCursor(self)
+
+    def cancel(self):
+        pass
+
+    def close(self):
+        pass
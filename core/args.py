@@ -7,6 +7,13 @@ def parse_args():
     parser.add_argument("--mode", type=str.upper, choices=["DRYRUN", "ALL", "RETRY"], default="DRYRUN")
     parser.add_argument("--source", choices=["oracle", "vertica"], default="oracle", help="Source database type")
     
+    parser.add_argument(
+        "--dryrun-parse",
+        action="store_true",
+        help="DRYRUN: parse/describe each rendered SQL on the source (no execution) and record result columns",
+    )
+    parser.add_argument("--dryrun-workers", type=int, default=4, help="DRYRUN parse concurrency (connections per host)")
+
     parser.add_argument("--hosts", help="Comma-separated host list (override env.yml)")
     parser.add_argument("--params", help="Comma-separated params, e.g. clsYymm=202501,fromYymm=202401")
 
@@ -50,6 +57,27 @@ def parse_args():
         help="Skip DuckDB postwork SQL execution",
     )
     
+    parser.add_argument(
+        "--parquet-bulk-load",
+        action="store_true",
+        help="Load all pending parquet files of a table with one read_parquet([...]) (format=parquet)",
+    )
+    parser.add_argument(
+        "--union-mode",
+        choices=["view", "table", "parquet"],
+        default="view",
+        help=(
+            "How suffix tables are combined per logical table: "
+            "view (UNION ALL view), table (partitioned physical table), "
+            "parquet (hive-partitioned parquet dataset + view)"
+        ),
+    )
+    parser.add_argument(
+        "--union-refresh",
+        action="store_true",
+        help="Rebuild all partitions for --union-mode table/parquet",
+    )
+
     parser.add_argument(
     "--duckdb-sql-filter",
     help="Run only matching DuckDB SQL files (comma separated)",
@@ -1,6 +1,12 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-from oracle.sql_utils import extract_params
-from util.paths import LOG_DIR
+from oracle.sql_utils import extract_params, normalize_sql, apply_params
+from util.param_expand import expand_param_value
+from util.paths import LOG_DIR, SQL_DIR
+from util.schema_registry import columns_from_description, register_export_schema
 
 def dryrun_check(host_name, sql_files, params, batch_ts):
     rows = []
@@ -33,3 +39,96 @@ def dryrun_check(host_name, sql_files, params, batch_ts):
 def write_dryrun_report(rows, batch_ts):
     out = LOG_DIR / f"dryrun_report_{batch_ts}.csv"
     pd.DataFrame(rows).to_csv(out, index=False, encoding="utf-8-sig")
+
+
+# =========================================================
+# server-side parse (DRYRUN --dryrun-parse)
+#   oracle : cursor.parse() → 실행 없이 문법 / 권한 / 컬럼 확인
+#   그 외  : SELECT * FROM (<sql>) LIMIT 0 → row 없이 description 만
+#   결과 컬럼은 schema registry 에 기록 (parquet writer 타입 기준으로 사용)
+# =========================================================
+def describe_sql(conn, sql: str, source: str):
+    cur = conn.cursor()
+    try:
+        if source == "oracle" and hasattr(cur, "parse"):
+            cur.parse(sql)
+        else:
+            cur.execute(f"SELECT * FROM (\n{sql}\n) dryrun_q LIMIT 0")
+        return cur.description
+    finally:
+        cur.close()
+
+
+def dryrun_parse(rows, source, host_name, host_cfg, sql_files, params, get_conn, workers=4):
+    """
+    dryrun_check 결과(rows)에 parse 결과를 추가 (파라미터 누락 SQL 은 제외)
+    파라미터는 SQL 별로 첫 번째 확장 값으로 렌더링 (parse 결과는 값과 무관)
+    connection 은 worker thread 마다 1개
+    """
+    schema = host_cfg.get("duckdb_schema", host_name)
+    base = SQL_DIR / source / host_name
+    by_name = {r["sql_file"]: r for r in rows}
+
+    local = threading.local()
+    conns = []
+    conns_lock = threading.Lock()
+
+    def _conn():
+        if getattr(local, "conn", None) is None:
+            local.conn = get_conn(host_cfg)
+            with conns_lock:
+                conns.append(local.conn)
+        return local.conn
+
+    def _check(sql_file):
+        row = by_name.get(sql_file.name)
+        if row is None or row["params_missing"]:
+            return
+
+        sql_raw = normalize_sql(sql_file.read_text(encoding="utf-8"))
+        first = {k: expand_param_value(str(params[k]))[0] for k in extract_params(sql_raw)}
+        sql = apply_params(sql_raw, first)
+
+        try:
+            description = describe_sql(_conn(), sql, source)
+        except Exception as e:
+            row["status"] = "FAIL"
+            row["issues"] = "; ".join(filter(None, [row["issues"], f"parse: {str(e).splitlines()[0]}"]))
+            # 오류 후 connection 상태를 믿지 않음
+            local.conn = None
+            return
+
+        if not description:
+            row["parse"] = "OK (no result set)"
+            return
+
+        columns = columns_from_description(description, oracle=source == "oracle")
+        rel = sql_file.relative_to(base) if sql_file.is_relative_to(base) else sql_file
+        try:
+            _, drift = register_export_schema(
+                schema, sql_file.stem.upper(), columns, source=f"{source}/{host_name}/{rel.as_posix()}",
+            )
+        except Exception as e:
+            logging.warning("DRYRUN schema registry skipped | %s | %s", sql_file.name, e)
+            drift = []
+
+        row["parse"] = "OK"
+        row["columns"] = ", ".join(f"{c['name']}:{c['type']}" for c in columns)
+        if drift:
+            row["issues"] = "; ".join(filter(None, [row["issues"], "type drift: " + "; ".join(drift)]))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+            list(ex.map(_check, sql_files))
+    finally:
+        for c in conns:
+            try:
+                c.close()
+            except Exception:
+                pass
+
+    failed = sum(1 for r in rows if "parse:" in r.get("issues", ""))
+    logging.info("DRYRUN parse | host=%s | sql=%d | failed=%d | workers=%d",
+                 host_name, len(sql_files), failed, workers)
+    return rows
+
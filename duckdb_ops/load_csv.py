@@ -1,3 +1,5 @@
+import csv
+import gzip
 import logging
 from pathlib import Path
 
@@ -5,6 +7,51 @@ import duckdb
 
 from util.paths import CSV_DIR
 from util.filename_suffix import split_table_and_suffix
+from util.schema_registry import load_table_schema, duckdb_column_types
+from duckdb_ops.load_plan import (
+    ensure_load_history, read_load_state, read_table_columns, build_load_plan,
+    execute_load_plan,
+)
+
+
+# ---------------------------------------------------------
+# explicit schema read_csv (sniffing 생략)
+# ---------------------------------------------------------
+def read_csv_header(csv_file: Path) -> list[str]:
+    open_fn = gzip.open if csv_file.name.endswith(".gz") else open
+    with open_fn(csv_file, "rt", newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def _q(s: str) -> str:
+    return s.replace("'", "''")
+
+
+def csv_source_sql(csv_file: Path, col_types: dict) -> str:
+    """
+    col_types {컬럼명(upper): DuckDB 타입} 이 있으면 header 순서대로 columns 지정
+    (없는 컬럼은 VARCHAR), 없으면 read_csv_auto
+    """
+    path = _q(csv_file.as_posix())
+
+    if not col_types:
+        return f"read_csv_auto('{path}')"
+
+    header = read_csv_header(csv_file)
+    unknown = [h for h in header if h.upper() not in col_types]
+    if unknown:
+        logging.warning(
+            "DuckDB CSV unknown columns (VARCHAR) | %s | %s",
+            csv_file.name, unknown,
+        )
+
+    cols = ", ".join(
+        f"'{_q(h)}': '{col_types.get(h.upper(), 'VARCHAR')}'" for h in header
+    )
+    return (
+        f"read_csv('{path}', header=true, delim=',', quote='\"', escape='\"', "
+        f"auto_detect=false, columns={{{cols}}})"
+    )
 
 
 def load_csv_to_duckdb(
@@ -23,6 +70,9 @@ def load_csv_to_duckdb(
     - base 테이블 없으면 CREATE
     - 이미 적재된 suffix는 SKIP (_LOAD_HISTORY 기준)
     - params 지정 시 suffix 기준 필터링
+    - history / catalog 는 1회만 조회해 load plan 을 먼저 만든 뒤 실행
+    - 컬럼 타입은 기존 테이블 → schema registry 순으로 결정해 read_csv 에 명시
+      (둘 다 없는 최초 CREATE 만 read_csv_auto)
     """
 
     duckdb_file.parent.mkdir(parents=True, exist_ok=True)
@@ -31,18 +81,7 @@ def load_csv_to_duckdb(
     # -------------------------------------------------
     # schema & load history
     # -------------------------------------------------
-    con.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
-
-    con.execute(
-        """
-        CREATE TABLE IF NOT EXISTS _LOAD_HISTORY (
-            schema_name  VARCHAR,
-            table_name   VARCHAR,
-            file_suffix  VARCHAR,
-            loaded_at    TIMESTAMP
-        )
-        """
-    )
+    ensure_load_history(con, schema)
 
     # -------------------------------------------------
     # CSV 경로 (★ 핵심 수정)
@@ -56,7 +95,9 @@ def load_csv_to_duckdb(
         con.close()
         return
 
-    for csv_file in base_dir.rglob("*.csv.gz"):
+    candidates = []
+
+    for csv_file in sorted(base_dir.rglob("*.csv.gz")):
         name = Path(csv_file.stem).stem
         table, suffix = split_table_and_suffix(name)
         table = table.upper()
@@ -77,97 +118,39 @@ def load_csv_to_duckdb(
             if not matched:
                 continue
 
-        # -------------------------------------------------
-        # load history 체크
-        # -------------------------------------------------
-        exists = con.execute(
-            """
-            SELECT 1
-            FROM _LOAD_HISTORY
-            WHERE schema_name = ?
-              AND table_name  = ?
-              AND file_suffix = ?
-            LIMIT 1
-            """,
-            [schema, table, suffix],
-        ).fetchone()
-
-        if exists:
-            if suffix:
-                logging.info(
-                    "DuckDB load SKIP (already loaded) | %s.%s%s",
-                    schema, table, suffix,
-                )
-            else:
-                logging.info(
-                    "DuckDB load SKIP (already loaded) | %s.%s",
-                    schema, table,
-                )
-            continue
-
-        table_q = f'"{schema}"."{table}"'
+        candidates.append((csv_file, table, suffix))
 
-        # -------------------------------------------------
-        # CREATE or INSERT
-        # -------------------------------------------------
-        table_exists = con.execute(
-            """
-            SELECT 1
-            FROM information_schema.tables
-            WHERE table_schema = ?
-              AND table_name   = ?
-            LIMIT 1
-            """,
-            [schema, table],
-        ).fetchone()
-
-        if not table_exists:
-            con.execute(
-                f"""
-                CREATE TABLE {table_q} AS
-                SELECT * FROM read_csv_auto('{csv_file.as_posix()}')
-                """
-            )
-            rows = con.execute(
-                f"SELECT COUNT(*) FROM {table_q}"
-            ).fetchone()[0]
-
-            logging.info(
-                "DuckDB CREATE OK | %s.%s | rows=%d",
-                schema, table, rows,
-            )
-        else:
-            con.execute(
-                f"""
-                INSERT INTO {table_q}
-                SELECT * FROM read_csv_auto('{csv_file.as_posix()}')
-                """
-            )
-            rows = con.execute(
-                f"SELECT COUNT(*) FROM read_csv_auto('{csv_file.as_posix()}')"
-            ).fetchone()[0]
-
-            if suffix:
-                logging.info(
-                    "DuckDB INSERT OK | %s.%s%s | rows=%d",
-                    schema, table, suffix, rows,
-                )
-            else:
-                logging.info(
-                    "DuckDB INSERT OK | %s.%s | rows=%d",
-                    schema, table, rows,
-                )
+    # -------------------------------------------------
+    # load plan (history / catalog 1회 조회) → 실행
+    # -------------------------------------------------
+    try:
+        loaded, existing = read_load_state(con, schema)
+        plan = build_load_plan(schema, candidates, loaded, existing)
 
-        # -------------------------------------------------
-        # load history 기록
-        # -------------------------------------------------
-        con.execute(
-            """
-            INSERT INTO _LOAD_HISTORY
-            (schema_name, table_name, file_suffix, loaded_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-            [schema, table, suffix],
+        logging.info(
+            "DuckDB load plan | %s | candidates=%d load=%d",
+            schema, len(candidates), len(plan),
         )
 
-    con.close()
+        table_of = {a.file: a.table for a in plan}
+        types_cache: dict[str, dict] = {}
+
+        def table_types(table: str) -> dict:
+            # 테이블당 1회 조회 (같은 실행에서 CREATE 된 테이블은 다음 파일부터 반영)
+            if table not in types_cache:
+                types = read_table_columns(con, schema, table) or duckdb_column_types(
+                    load_table_schema(schema, table)
+                )
+                if not types:
+                    return {}
+                types_cache[table] = types
+            return types_cache[table]
+
+        execute_load_plan(
+            con,
+            schema,
+            plan,
+            lambda f: csv_source_sql(f, table_types(table_of[f])),
+        )
+    finally:
+        con.close()
@@ -3,6 +3,10 @@ import duckdb
 from pathlib import Path
 
 from util.filename_suffix import split_table_and_suffix
+from duckdb_ops.load_plan import (
+    ensure_load_history, read_load_state, build_load_plan, execute_load_plan,
+    execute_bulk_parquet_plan,
+)
 
 
 def load_parquet_to_duckdb(
@@ -10,6 +14,7 @@ def load_parquet_to_duckdb(
     schema: str,
     target_tables: set[str],
     params: dict | None = None,
+    bulk: bool = False,
 ) -> None:
     """
     Parquet → DuckDB 적재
@@ -19,6 +24,8 @@ def load_parquet_to_duckdb(
     - 이후 suffix parquet은 INSERT
     - 이미 로드한 suffix는 _LOAD_HISTORY 기준 SKIP
     - params 지정 시 suffix 기준 필터링
+    - history / catalog 는 1회만 조회해 load plan 을 먼저 만든 뒤 실행
+    - bulk=True 이면 테이블별 미적재 파일을 1회 read_parquet([...]) 로 적재
     """
 
     duckdb_file.parent.mkdir(parents=True, exist_ok=True)
@@ -27,21 +34,12 @@ def load_parquet_to_duckdb(
     # -------------------------------------------------
     # schema & load history
     # -------------------------------------------------
-    con.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
-
-    con.execute(
-        """
-        CREATE TABLE IF NOT EXISTS _LOAD_HISTORY (
-            schema_name  VARCHAR,
-            table_name   VARCHAR,
-            file_suffix  VARCHAR,
-            loaded_at    TIMESTAMP
-        )
-        """
-    )
+    ensure_load_history(con, schema)
 
     base_dir = Path("data/parquet") / schema
 
+    candidates = []
+
     for pq_file in sorted(base_dir.rglob("*.parquet")):
         table, suffix = split_table_and_suffix(pq_file.stem)
         table = table.upper()
@@ -62,85 +60,28 @@ def load_parquet_to_duckdb(
             if not matched:
                 continue
 
-        # -------------------------------------------------
-        # load history 체크
-        # -------------------------------------------------
-        loaded = con.execute(
-            """
-            SELECT 1
-            FROM _LOAD_HISTORY
-            WHERE schema_name = ?
-              AND table_name  = ?
-              AND file_suffix = ?
-            LIMIT 1
-            """,
-            [schema, table, suffix],
-        ).fetchone()
-
-        if loaded:
-            logging.info(
-                "DuckDB load SKIP (already loaded) | %s.%s%s",
-                schema, table, suffix,
-            )
-            continue
-
-        table_q = f'"{schema}"."{table}"'
+        candidates.append((pq_file, table, suffix))
 
-        table_exists = con.execute(
-            """
-            SELECT 1
-            FROM information_schema.tables
-            WHERE table_schema = ?
-              AND table_name   = ?
-            LIMIT 1
-            """,
-            [schema, table],
-        ).fetchone()
+    # -------------------------------------------------
+    # load plan (history / catalog 1회 조회) → 실행
+    # -------------------------------------------------
+    try:
+        loaded, existing = read_load_state(con, schema)
+        plan = build_load_plan(schema, candidates, loaded, existing)
 
-        # -------------------------------------------------
-        # CREATE or INSERT
-        # -------------------------------------------------
-        if not table_exists:
-            con.execute(
-                f"""
-                CREATE TABLE {table_q} AS
-                SELECT * FROM read_parquet('{pq_file.as_posix()}')
-                """
-            )
-            rows = con.execute(
-                f"SELECT COUNT(*) FROM {table_q}"
-            ).fetchone()[0]
+        logging.info(
+            "DuckDB load plan | %s | candidates=%d load=%d",
+            schema, len(candidates), len(plan),
+        )
 
-            logging.info(
-                "DuckDB CREATE OK | %s.%s | rows=%d",
-                schema, table, rows,
-            )
+        if bulk:
+            execute_bulk_parquet_plan(con, schema, plan)
         else:
-            con.execute(
-                f"""
-                INSERT INTO {table_q}
-                SELECT * FROM read_parquet('{pq_file.as_posix()}')
-                """
-            )
-            rows = con.execute(
-                f"SELECT COUNT(*) FROM read_parquet('{pq_file.as_posix()}')"
-            ).fetchone()[0]
-
-            logging.info(
-                "DuckDB INSERT OK | %s.%s%s | rows=%d",
-                schema, table, suffix, rows,
+            execute_load_plan(
+                con,
+                schema,
+                plan,
+                lambda f: f"read_parquet('{f.as_posix()}')",
             )
-
-        # -------------------------------------------------
-        # load history 기록
-        # -------------------------------------------------
-        con.execute(
-            """
-            INSERT INTO _LOAD_HISTORY
-            (schema_name, table_name, file_suffix, loaded_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-            [schema, table, suffix],
-        )
-
-    con.close()
+    finally:
+        con.close()
@@ -0,0 +1,239 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from util.manifest import read_manifest
+
+
+@dataclass
+class LoadAction:
+    file: Path
+    table: str
+    suffix: str
+    action: str          # create | insert
+
+
+def ensure_load_history(con, schema: str) -> None:
+    con.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS _LOAD_HISTORY (
+            schema_name  VARCHAR,
+            table_name   VARCHAR,
+            file_suffix  VARCHAR,
+            loaded_at    TIMESTAMP
+        )
+        """
+    )
+
+
+def read_load_state(con, schema: str) -> tuple[set, set]:
+    """
+    _LOAD_HISTORY / catalog 를 한 번에 읽어 메모리로
+    반환: ({(table, suffix) 적재 완료}, {존재하는 테이블})
+    """
+    loaded = {
+        (t, s or "")
+        for t, s in con.execute(
+            "SELECT table_name, file_suffix FROM _LOAD_HISTORY WHERE schema_name = ?",
+            [schema],
+        ).fetchall()
+    }
+
+    existing = {
+        r[0]
+        for r in con.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_schema = ?",
+            [schema],
+        ).fetchall()
+    }
+
+    return loaded, existing
+
+
+def read_table_columns(con, schema: str, table: str) -> dict:
+    """
+    기존 테이블 컬럼 타입 {컬럼명(upper): DuckDB 타입} (없으면 빈 dict)
+    """
+    rows = con.execute(
+        """
+        SELECT column_name, data_type
+          FROM information_schema.columns
+         WHERE table_schema = ? AND table_name = ?
+         ORDER BY ordinal_position
+        """,
+        [schema, table],
+    ).fetchall()
+    return {c.upper(): t for c, t in rows}
+
+
+def build_load_plan(
+    schema: str,
+    candidates: list[tuple[Path, str, str]],
+    loaded: set,
+    existing: set,
+) -> list[LoadAction]:
+    """
+    candidates: [(file, table, suffix), ...]
+    - 이미 적재된 (table, suffix) → SKIP
+    - 테이블이 없으면 첫 파일은 CREATE, 이후는 INSERT
+    - 같은 실행 안에서 같은 (table, suffix)가 중복되면 첫 파일만 사용
+    """
+    plan = []
+    planned = set()
+    tables = set(existing)
+
+    for f, table, suffix in candidates:
+        key = (table, suffix or "")
+
+        if key in loaded:
+            if suffix:
+                logging.info(
+                    "DuckDB load SKIP (already loaded) | %s.%s%s",
+                    schema, table, suffix,
+                )
+            else:
+                logging.info(
+                    "DuckDB load SKIP (already loaded) | %s.%s",
+                    schema, table,
+                )
+            continue
+
+        if key in planned:
+            logging.warning(
+                "DuckDB load SKIP (duplicate suffix in this run) | %s.%s%s | %s",
+                schema, table, suffix, f.name,
+            )
+            continue
+
+        action = "insert" if table in tables else "create"
+        tables.add(table)
+        planned.add(key)
+
+        plan.append(LoadAction(file=f, table=table, suffix=suffix, action=action))
+
+    return plan
+
+
+def check_manifest_rows(schema: str, a: LoadAction, rows: int) -> None:
+    """
+    export manifest 의 row 수와 적재 row 수 비교 (파일 재스캔 없음)
+    """
+    m = read_manifest(a.file)
+    if m and m.get("rows") is not None and m["rows"] != rows:
+        logging.warning(
+            "DuckDB load row count mismatch | %s.%s%s | manifest=%d loaded=%d",
+            schema, a.table, a.suffix, m["rows"], rows,
+        )
+
+
+def write_load_history(con, schema: str, done: list[LoadAction]) -> None:
+    if not done:
+        return
+
+    con.executemany(
+        """
+        INSERT INTO _LOAD_HISTORY
+        (schema_name, table_name, file_suffix, loaded_at)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        """,
+        [[schema, a.table, a.suffix] for a in done],
+    )
+
+
+def execute_load_plan(con, schema: str, plan: list[LoadAction], source_sql) -> int:
+    """
+    source_sql(file) -> "read_csv_auto('...')" 같은 FROM 절 표현식
+    INSERT 는 BY NAME (파일 컬럼 순서가 테이블과 달라도 이름 기준 적재)
+    row 수는 CREATE/INSERT 결과 Count 사용 (파일 재스캔 없음)
+    history는 마지막에 일괄 기록 (실패 시 성공분까지만 기록 후 예외 전파)
+    """
+    done: list[LoadAction] = []
+    total_rows = 0
+
+    try:
+        for a in plan:
+            table_q = f'"{schema}"."{a.table}"'
+
+            if a.action == "create":
+                rows = con.execute(
+                    f"CREATE TABLE {table_q} AS SELECT * FROM {source_sql(a.file)}"
+                ).fetchone()[0]
+
+                logging.info(
+                    "DuckDB CREATE OK | %s.%s | rows=%d",
+                    schema, a.table, rows,
+                )
+            else:
+                rows = con.execute(
+                    f"INSERT INTO {table_q} BY NAME SELECT * FROM {source_sql(a.file)}"
+                ).fetchone()[0]
+
+                logging.info(
+                    "DuckDB INSERT OK | %s.%s%s | rows=%d",
+                    schema, a.table, a.suffix, rows,
+                )
+
+            check_manifest_rows(schema, a, rows)
+            total_rows += rows
+            done.append(a)
+
+    finally:
+        write_load_history(con, schema, done)
+
+    return total_rows
+
+
+def execute_bulk_parquet_plan(con, schema: str, plan: list[LoadAction]) -> int:
+    """
+    테이블별로 미적재 parquet 파일을 묶어 1회 read_parquet([...]) 로 적재
+    (DuckDB가 파일 / row group 단위로 병렬 스캔)
+
+    - union_by_name=true : 월별 컬럼 순서/추가 컬럼 차이 허용
+    - filename=true      : 파일별 row 수 집계 → 파일 단위 history 기록
+    """
+    by_table: dict[str, list[LoadAction]] = {}
+    for a in plan:
+        by_table.setdefault(a.table, []).append(a)
+
+    total_rows = 0
+
+    for table, actions in by_table.items():
+        table_q = f'"{schema}"."{table}"'
+        files_sql = ", ".join(f"'{a.file.as_posix()}'" for a in actions)
+        source = f"read_parquet([{files_sql}], union_by_name=true, filename=true)"
+
+        if actions[0].action == "create":
+            rows = con.execute(
+                f"CREATE TABLE {table_q} AS SELECT * EXCLUDE (filename) FROM {source}"
+            ).fetchone()[0]
+        else:
+            rows = con.execute(
+                f"INSERT INTO {table_q} BY NAME SELECT * EXCLUDE (filename) FROM {source}"
+            ).fetchone()[0]
+
+        # 파일별 row 수 (컬럼 데이터는 읽지 않음)
+        per_file = dict(
+            con.execute(
+                f"SELECT filename, COUNT(*) FROM {source} GROUP BY filename"
+            ).fetchall()
+        )
+
+        for a in actions:
+            file_rows = per_file.get(a.file.as_posix(), 0)
+            logging.info(
+                "DuckDB BULK file | %s.%s%s | rows=%d",
+                schema, table, a.suffix, file_rows,
+            )
+            check_manifest_rows(schema, a, file_rows)
+
+        write_load_history(con, schema, actions)
+
+        logging.info(
+            "DuckDB BULK %s OK | %s.%s | files=%d | rows=%d",
+            actions[0].action.upper(), schema, table, len(actions), rows,
+        )
+        total_rows += rows
+
+    return total_rows
@@ -2,6 +2,24 @@ import logging
 import duckdb
 from pathlib import Path
 
+from util.paths import PARQUET_DIR
+
+DEFAULT_PART_COLUMN = "part_key"
+
+
+def _list_parts(con, schema: str, table: str) -> list[str]:
+    rows = con.execute(
+        """
+        SELECT table_name
+        FROM information_schema.tables
+        WHERE table_schema = ?
+          AND table_name LIKE ?
+        ORDER BY table_name
+        """,
+        [schema, f"{table}__%"],
+    ).fetchall()
+    return [r[0] for r in rows]
+
 
 def create_union_views(
     duckdb_file: Path,
@@ -24,18 +42,9 @@ def create_union_views(
     con = duckdb.connect(duckdb_file.as_posix())
 
     for table in sorted(tables):
-        rows = con.execute(
-            """
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = ?
-              AND table_name LIKE ?
-            ORDER BY table_name
-            """,
-            [schema, f"{table}__%"],
-        ).fetchall()
-
-        if not rows:
+        parts = _list_parts(con, schema, table)
+
+        if not parts:
             logging.info(
                 "UNION VIEW skip (no suffix tables) | %s.%s",
                 schema, table,
@@ -43,8 +52,8 @@ def create_union_views(
             continue
 
         selects = [
-            f'SELECT * FROM "{schema}"."{r[0]}"'
-            for r in rows
+            f'SELECT * FROM "{schema}"."{p}"'
+            for p in parts
         ]
 
         union_sql = "\nUNION ALL\n".join(selects)
@@ -58,7 +67,426 @@ def create_union_views(
 
         logging.info(
             "UNION VIEW OK | %s.%s | parts=%d",
-            schema, table, len(rows),
+            schema, table, len(parts),
+        )
+
+    con.close()
+
+
+# =========================================================
+# 파티션 테이블 / hive parquet 모드
+# =========================================================
+def split_part_suffix(table: str, part_table: str) -> tuple[str | None, str]:
+    """
+    A1__clsYymm=202312            → ("clsYymm", "202312")
+    A1__202312                    → (None, "202312")
+    A1__clsYymm=202312__exeIdno=1 → (None, "clsYymm=202312__exeIdno=1")
+    """
+    suffix = part_table[len(table) + 2:]
+    tokens = suffix.split("__")
+
+    if len(tokens) == 1 and "=" in tokens[0]:
+        k, v = tokens[0].split("=", 1)
+        return k, v
+
+    return None, suffix
+
+
+def resolve_part_column(table: str, parts: list[str]) -> tuple[str, dict]:
+    """
+    모든 part가 같은 key(k=v)를 쓰면 그 key를 파티션 컬럼으로,
+    아니면 part_key 컬럼에 suffix 전체를 값으로 사용
+    반환: (컬럼명, {part_table: 파티션 값})
+    """
+    parsed = {p: split_part_suffix(table, p) for p in parts}
+    keys = {k for k, _ in parsed.values()}
+
+    if len(keys) == 1 and None not in keys:
+        return keys.pop(), {p: v for p, (_, v) in parsed.items()}
+
+    return DEFAULT_PART_COLUMN, {p: p[len(table) + 2:] for p in parts}
+
+
+def _ensure_union_registry(con):
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS _UNION_PARTITIONS (
+            schema_name  VARCHAR,
+            table_name   VARCHAR,
+            mode         VARCHAR,
+            part_table   VARCHAR,
+            part_column  VARCHAR,
+            part_value   VARCHAR,
+            row_count    BIGINT,
+            loaded_at    TIMESTAMP
+        )
+        """
+    )
+    con.execute("ALTER TABLE _UNION_PARTITIONS ADD COLUMN IF NOT EXISTS load_marker VARCHAR")
+
+
+def _registered_parts(con, schema: str, table: str, mode: str) -> dict:
+    rows = con.execute(
+        """
+        SELECT part_table, part_column, part_value, load_marker
+        FROM _UNION_PARTITIONS
+        WHERE schema_name = ?
+          AND table_name  = ?
+          AND mode        = ?
+        """,
+        [schema, table, mode],
+    ).fetchall()
+    return {r[0]: (r[1], r[2], r[3]) for r in rows}
+
+
+def _object_type(con, schema: str, name: str) -> str | None:
+    row = con.execute(
+        """
+        SELECT table_type
+        FROM information_schema.tables
+        WHERE table_schema = ?
+          AND table_name   = ?
+        """,
+        [schema, name],
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _columns(con, schema: str, name: str) -> list[str]:
+    rows = con.execute(
+        """
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = ?
+          AND table_name   = ?
+        ORDER BY ordinal_position
+        """,
+        [schema, name],
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def _load_markers(con, schema: str, parts: list[str]) -> dict:
+    """
+    part 테이블별 적재 marker {part_table: marker}
+    - _LOAD_HISTORY 이력 (건수 + 마지막 loaded_at) → 같은 row 수로 재적재돼도 바뀜
+    - 이력이 없는 part (직접 만든 테이블 등)는 row 수
+    """
+    history = {}
+    if "schema_name" in _columns(con, "main", "_LOAD_HISTORY"):
+        history = {
+            t: f"load:{n}@{ts}"
+            for t, n, ts in con.execute(
+                """
+                SELECT upper(table_name), COUNT(*), MAX(loaded_at)
+                FROM _LOAD_HISTORY
+                WHERE schema_name = ?
+                GROUP BY upper(table_name)
+                """,
+                [schema],
+            ).fetchall()
+        }
+
+    markers = {}
+    for p in parts:
+        marker = history.get(p.upper())
+        if marker is None:
+            cnt = con.execute(f'SELECT COUNT(*) FROM "{schema}"."{p}"').fetchone()[0]
+            marker = f"rows:{cnt}"
+        markers[p] = marker
+    return markers
+
+
+def _plan_partitions(con, schema, table, parts, part_col, part_values, mode, refresh):
+    """
+    반환: (추가/교체할 part 목록, 제거할 (part_table, part_value) 목록)
+    - registry에 없는 part            → 추가
+    - 적재 marker가 달라진 part       → 교체 (DELETE 후 INSERT)
+    - 원본 part 테이블이 사라진 part  → 제거
+    """
+    registered = _registered_parts(con, schema, table, mode)
+
+    if refresh or any(col != part_col for col, _, _ in registered.values()):
+        return list(parts), [(p, v) for p, (_, v, _) in registered.items()]
+
+    markers = _load_markers(con, schema, [p for p in parts if p in registered])
+    to_load = [
+        p for p in parts
+        if p not in registered or markers[p] != registered[p][2]
+    ]
+
+    to_drop = [
+        (p, v) for p, (_, v, _) in registered.items()
+        if p not in part_values
+    ]
+    to_drop += [(p, registered[p][1]) for p in to_load if p in registered]
+
+    return to_load, to_drop
+
+
+def _register_part(con, schema, table, mode, part_table, part_col, part_value, rows):
+    """
+    rows=None 이면 registry에서 제거만
+    marker는 적재 직후 값으로 기록 (다음 실행의 변경 판단 기준)
+    """
+    con.execute(
+        """
+        DELETE FROM _UNION_PARTITIONS
+        WHERE schema_name = ? AND table_name = ? AND mode = ? AND part_table = ?
+        """,
+        [schema, table, mode, part_table],
+    )
+    if rows is None:
+        return
+    marker = _load_markers(con, schema, [part_table])[part_table]
+    con.execute(
+        """
+        INSERT INTO _UNION_PARTITIONS
+        (schema_name, table_name, mode, part_table, part_column, part_value, row_count, loaded_at, load_marker)
+        VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+        """,
+        [schema, table, mode, part_table, part_col, part_value, rows, marker],
+    )
+
+
+def _align_columns(con, table_q: str, part_q: str) -> list[str]:
+    """
+    part 에만 있는 컬럼은 ADD COLUMN, 타입이 다른 컬럼은 UNION BY NAME 공통 타입으로 변경
+    (INSERT BY NAME 이 새 컬럼 / 넓어진 타입에서 실패하지 않도록)
+    반환: 변경된 컬럼 목록
+    """
+    current = {
+        r[0]: r[1] for r in con.execute(f"DESCRIBE SELECT * FROM {table_q}").fetchall()
+    }
+    merged = con.execute(
+        f"DESCRIBE SELECT * FROM {table_q} "
+        f"UNION ALL BY NAME SELECT * FROM {part_q} LIMIT 0"
+    ).fetchall()
+
+    changed = []
+    for name, col_type, *_ in merged:
+        if name not in current:
+            con.execute(f'ALTER TABLE {table_q} ADD COLUMN "{name}" {col_type}')
+        elif current[name] != col_type:
+            con.execute(f'ALTER TABLE {table_q} ALTER COLUMN "{name}" SET DATA TYPE {col_type}')
+        else:
+            continue
+        changed.append(name)
+    return changed
+
+
+def create_union_tables(
+    duckdb_file: Path,
+    schema: str,
+    tables: set[str],
+    refresh: bool = False,
+) -> None:
+    """
+    suffix 테이블들을 논리 테이블 1개(물리 테이블)로 materialize
+
+    예:
+      A1__clsYymm=202312, A1__clsYymm=202403
+      →
+      TABLE A1 (..., clsYymm)  ← 파티션 컬럼
+
+    - 새 part만 INSERT, 바뀐 part(_LOAD_HISTORY 재적재)는 파티션 단위 DELETE 후 INSERT
+    - 테이블 스키마는 part 스키마의 합집합, 이후 part 의 컬럼 추가 / 타입 확장은 INSERT 전에 반영
+    - part 단위로 순서대로 적재되므로 row group min/max로 파티션 pruning
+    - refresh=True 이면 전체 재적재
+    """
+
+    con = duckdb.connect(duckdb_file.as_posix())
+    _ensure_union_registry(con)
+
+    for table in sorted(tables):
+        parts = _list_parts(con, schema, table)
+
+        if not parts:
+            logging.info(
+                "UNION TABLE skip (no suffix tables) | %s.%s",
+                schema, table,
+            )
+            continue
+
+        table_q = f'"{schema}"."{table}"'
+        part_col, part_values = resolve_part_column(table, parts)
+
+        obj_type = _object_type(con, schema, table)
+        registered = _registered_parts(con, schema, table, "table")
+
+        if obj_type == "VIEW":
+            con.execute(f"DROP VIEW {table_q}")
+            obj_type = None
+        elif obj_type and not registered:
+            logging.warning(
+                "UNION TABLE skip (not managed table exists) | %s.%s",
+                schema, table,
+            )
+            continue
+
+        to_load, to_drop = _plan_partitions(
+            con, schema, table, parts, part_col, part_values, "table",
+            refresh or obj_type is None,
+        )
+
+        if not to_load and not to_drop:
+            logging.info(
+                "UNION TABLE up-to-date | %s.%s | parts=%d",
+                schema, table, len(parts),
+            )
+            continue
+
+        rebuild = obj_type is None or refresh
+
+        # DuckDB 는 같은 transaction 안에서 ALTER 한 테이블에 DML 불가 → 컬럼 정렬은 먼저
+        if not rebuild:
+            for part_table in to_load:
+                changed = _align_columns(con, table_q, f'"{schema}"."{part_table}"')
+                if changed:
+                    logging.info(
+                        "UNION TABLE columns aligned | %s.%s | %s | %s",
+                        schema, table, part_table, ", ".join(changed),
+                    )
+
+        con.execute("BEGIN TRANSACTION")
+        try:
+            if rebuild:
+                # 전체 part 스키마의 합집합 (UNION BY NAME 이 컬럼 추가 / 공통 타입 처리)
+                union_sql = " UNION ALL BY NAME ".join(
+                    f'SELECT * FROM "{schema}"."{p}"' for p in parts
+                )
+                union_cols = [r[0] for r in con.execute(f"DESCRIBE {union_sql}").fetchall()]
+                extra = "" if part_col in union_cols else f', CAST(NULL AS VARCHAR) AS "{part_col}"'
+                con.execute(
+                    f'CREATE OR REPLACE TABLE {table_q} AS '
+                    f'SELECT *{extra} FROM ({union_sql}) LIMIT 0'
+                )
+                to_drop = []
+                con.execute(
+                    "DELETE FROM _UNION_PARTITIONS WHERE schema_name = ? AND table_name = ? AND mode = 'table'",
+                    [schema, table],
+                )
+
+            for part_table, part_value in to_drop:
+                con.execute(f'DELETE FROM {table_q} WHERE "{part_col}" = ?', [part_value])
+                _register_part(con, schema, table, "table", part_table, part_col, part_value, None)
+
+            for part_table in to_load:
+                part_value = part_values[part_table]
+                cols = _columns(con, schema, part_table)
+                extra = "" if part_col in cols else f', ? AS "{part_col}"'
+                args = [] if part_col in cols else [part_value]
+
+                rows = con.execute(
+                    f'INSERT INTO {table_q} BY NAME '
+                    f'SELECT *{extra} FROM "{schema}"."{part_table}"',
+                    args,
+                ).fetchone()[0]
+
+                _register_part(con, schema, table, "table", part_table, part_col, part_value, rows)
+
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+
+        logging.info(
+            "UNION TABLE OK | %s.%s | %s | loaded=%d dropped=%d parts=%d",
+            schema, table, part_col, len(to_load), len(to_drop), len(parts),
+        )
+
+    con.close()
+
+
+def create_union_parquet(
+    duckdb_file: Path,
+    schema: str,
+    tables: set[str],
+    out_dir: Path | None = None,
+    refresh: bool = False,
+) -> None:
+    """
+    suffix 테이블들을 hive 파티션 parquet dataset으로 내보내고
+    read_parquet(..., hive_partitioning=true) VIEW로 연결
+
+      data/parquet/_union/<schema>/A1/clsYymm=202312/data.parquet
+      VIEW A1 → WHERE clsYymm = '202312' 조건 시 해당 폴더만 스캔
+    """
+
+    base = (out_dir or PARQUET_DIR / "_union") / schema
+
+    con = duckdb.connect(duckdb_file.as_posix())
+    _ensure_union_registry(con)
+
+    for table in sorted(tables):
+        parts = _list_parts(con, schema, table)
+
+        if not parts:
+            logging.info(
+                "UNION PARQUET skip (no suffix tables) | %s.%s",
+                schema, table,
+            )
+            continue
+
+        part_col, part_values = resolve_part_column(table, parts)
+        dataset_dir = base / table
+
+        obj_type = _object_type(con, schema, table)
+        if obj_type == "BASE TABLE":
+            logging.warning(
+                "UNION PARQUET skip (table exists with same name) | %s.%s",
+                schema, table,
+            )
+            continue
+
+        to_load, to_drop = _plan_partitions(
+            con, schema, table, parts, part_col, part_values, "parquet", refresh,
+        )
+
+        # registry에는 있지만 파일이 지워진 파티션은 다시 기록
+        to_load += [
+            p for p in parts
+            if p not in to_load
+            and not (dataset_dir / f"{part_col}={part_values[p]}" / "data.parquet").exists()
+        ]
+
+        for part_table, part_value in to_drop:
+            f = dataset_dir / f"{part_col}={part_value}" / "data.parquet"
+            if f.exists():
+                f.unlink()
+            _register_part(con, schema, table, "parquet", part_table, part_col, part_value, None)
+
+        for part_table in to_load:
+            part_value = part_values[part_table]
+            part_dir = dataset_dir / f"{part_col}={part_value}"
+            part_dir.mkdir(parents=True, exist_ok=True)
+
+            cols = _columns(con, schema, part_table)
+            exclude = f' EXCLUDE ("{part_col}")' if part_col in cols else ""
+
+            rows = con.execute(
+                f'''
+                COPY (SELECT *{exclude} FROM "{schema}"."{part_table}")
+                TO '{(part_dir / "data.parquet").as_posix()}' (FORMAT PARQUET)
+                '''
+            ).fetchone()[0]
+            _register_part(con, schema, table, "parquet", part_table, part_col, part_value, rows)
+
+        con.execute(
+            f'''
+            CREATE OR REPLACE VIEW "{schema}"."{table}" AS
+            SELECT * FROM read_parquet(
+                '{dataset_dir.as_posix()}/*/*.parquet',
+                hive_partitioning = true,
+                union_by_name = true,
+                hive_types = {{'{part_col}': VARCHAR}}
+            )
+            '''
+        )
+
+        logging.info(
+            "UNION PARQUET OK | %s.%s | %s | written=%d removed=%d parts=%d",
+            schema, table, part_col, len(to_load), len(to_drop), len(parts),
         )
 
     con.close()
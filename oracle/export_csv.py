@@ -11,6 +11,8 @@ from oracle.sql_utils import normalize_sql, extract_params, apply_params
 from stats.slow_sql import SLOW_SQL_STATS
 from util.run_history import append_run_history, load_last_success_keys
 from util.sql_hash import compute_sql_hash
+from util.manifest import open_hashed_text, write_manifest
+from util.source_probe import extract_probe_sql, check_source_probe
 
 CHUNK_SIZE = 1_000_000
 
@@ -62,6 +64,7 @@ def export_oracle_to_csv(
             # SQL 분석
             # -------------------------------------------------
             sql_raw = normalize_sql(sql_file.read_text(encoding="utf-8"))
+            probe_sql = extract_probe_sql(sql_raw)
             sql_hash = compute_sql_hash(sql_raw)
             used_keys = extract_params(sql_raw)
 
@@ -102,9 +105,21 @@ def export_oracle_to_csv(
                     continue
 
                 # -------------------------------------------------
-                # 파일 존재 skip
+                # source 변경 probe (--@probe:) : 같으면 skip, 다르면 재-export
                 # -------------------------------------------------
-                if out_file.exists():
+                probe_fp = None
+                if probe_sql:
+                    skip, probe_fp = check_source_probe(
+                        get_oracle_conn, host_cfg, apply_params(probe_sql, case_params),
+                        out_file, host_logger, f"{rel_path_str} | {param_desc}",
+                    )
+                    if skip:
+                        continue
+
+                # -------------------------------------------------
+                # 파일 존재 skip (probe 결과가 있으면 probe 기준)
+                # -------------------------------------------------
+                if out_file.exists() and probe_fp is None:
                     host_logger.info(
                         "CSV exists, skip export | %s",
                         out_file.as_posix(),
@@ -119,27 +134,47 @@ def export_oracle_to_csv(
                 total_rows = 0
                 start = time.time()
 
-                with get_oracle_conn(host_cfg) as conn:
-                    first = True
-                    for chunk in pd.read_sql(sql, conn, chunksize=CHUNK_SIZE):
-                        if chunk.empty:
-                            continue
-
-                        total_rows += len(chunk)
-
-                        chunk.to_csv(
-                            out_file,
-                            mode="a",
-                            header=first,
-                            index=False,
-                            compression="gzip",
-                        )
-                        first = False
-
-                    conn.commit()
+                # tmp 에 gzip 1 stream 으로 기록 (sha256 은 기록 중 계산) → commit
+                tmp_file = out_file.with_name(out_file.name + ".tmp")
+                columns = []
+
+                try:
+                    with get_oracle_conn(host_cfg) as conn:
+                        with open_hashed_text(tmp_file, "gzip") as (f, hasher):
+                            for chunk in pd.read_sql(sql, conn, chunksize=CHUNK_SIZE):
+                                if chunk.empty:
+                                    continue
+
+                                chunk.to_csv(
+                                    f,
+                                    header=(total_rows == 0),
+                                    index=False,
+                                )
+                                total_rows += len(chunk)
+                                columns = list(chunk.columns)
+
+                        conn.commit()
+
+                    if total_rows > 0:
+                        tmp_file.replace(out_file)
+                finally:
+                    if tmp_file.exists():
+                        tmp_file.unlink()
 
                 elapsed = round(time.time() - start, 2)
 
+                if total_rows > 0:
+                    write_manifest(
+                        out_file,
+                        rows=total_rows,
+                        columns=columns,
+                        sha256=hasher.sha256,
+                        sql_hash=sql_hash,
+                        params={k: case_params[k] for k in expand_keys},
+                        probe=probe_fp,
+                        elapsed_sec=elapsed,
+                    )
+
                 # -------------------------------------------------
                 # slow sql 기록
                 # -------------------------------------------------
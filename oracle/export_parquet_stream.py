@@ -1,8 +1,6 @@
 import time
 from itertools import product
 
-import pandas as pd
-import pyarrow as pa
 import pyarrow.parquet as pq
 
 from util.paths import SQL_DIR, PARQUET_DIR
@@ -14,8 +12,13 @@ from util.run_history import append_run_history, load_last_success_keys
 from oracle.client import get_oracle_conn
 from oracle.sql_utils import normalize_sql, extract_params, apply_params
 from util.sql_hash import compute_sql_hash
+from util.manifest import HashingWriter, write_manifest
+from util.source_probe import extract_probe_sql, check_source_probe
+from util.schema_registry import (
+    columns_from_description, register_export_schema, arrow_schema, rows_to_arrow,
+)
 
-CHUNK_SIZE = 1_000_000
+CHUNK_SIZE = 100_000         # fetchmany / row group 단위
 
 
 def export_oracle_to_parquet_stream(
@@ -38,6 +41,8 @@ def export_oracle_to_parquet_stream(
 
     for sql_file in sql_files:
         start_sql = time.time()
+        tmp_file = None
+        sink = None
         writer = None
         param_desc = "-"
         rel_path_str = sql_file.name
@@ -54,6 +59,7 @@ def export_oracle_to_parquet_stream(
             out_dir.mkdir(parents=True, exist_ok=True)
 
             sql_raw = normalize_sql(sql_file.read_text(encoding="utf-8"))
+            probe_sql = extract_probe_sql(sql_raw)
             sql_hash = compute_sql_hash(sql_raw)
             used_keys = sorted(extract_params(sql_raw))
 
@@ -89,7 +95,17 @@ def export_oracle_to_parquet_stream(
                     )
                     continue
 
-                if out_file.exists():
+                # source 변경 probe (--@probe:) : 같으면 skip, 다르면 재-export
+                probe_fp = None
+                if probe_sql:
+                    skip, probe_fp = check_source_probe(
+                        get_oracle_conn, host_cfg, apply_params(probe_sql, full_params),
+                        out_file, host_logger, f"{rel_path_str} | {param_desc}",
+                    )
+                    if skip:
+                        continue
+
+                if out_file.exists() and probe_fp is None:
                     host_logger.info(
                         "Parquet exists, skip export | %s",
                         out_file.as_posix(),
@@ -101,29 +117,70 @@ def export_oracle_to_parquet_stream(
                 total_rows = 0
                 writer = None
 
+                # 실패 시 반쪽 parquet 이 'exists, skip' 되지 않도록 tmp 에 기록 후 rename
+                tmp_file = out_file.with_name(out_file.name + ".tmp")
+
                 with get_oracle_conn(host_cfg) as conn:
-                    for chunk in pd.read_sql(sql, conn, chunksize=CHUNK_SIZE):
-                        if chunk.empty:
-                            continue
+                    cur = conn.cursor()
+                    cur.arraysize = CHUNK_SIZE
+                    cur.execute(sql)
+
+                    # cursor.description → schema registry (최초 export 시 등록)
+                    columns = columns_from_description(cur.description, oracle=True)
+                    entry, drift = register_export_schema(
+                        schema, table.upper(), columns, source=rel_path_str,
+                    )
+                    if drift:
+                        host_logger.warning(
+                            "PARQUET TYPE DRIFT | %s | %s",
+                            rel_path_str,
+                            "; ".join(drift),
+                        )
+
+                    # writer schema 는 registry 기준 → 월별 parquet 타입 고정
+                    # (drift 컬럼은 등록 / 실제 타입을 모두 담는 타입으로 넓힘)
+                    arrow_sch = arrow_schema(entry, [c["name"] for c in columns], observed=columns)
 
-                        total_rows += len(chunk)
-                        arrow = pa.Table.from_pandas(chunk, preserve_index=False)
+                    while True:
+                        rows = cur.fetchmany(CHUNK_SIZE)
+                        if not rows:
+                            break
+
+                        total_rows += len(rows)
 
                         if writer is None:
+                            # sha256 은 기록 중 계산 (manifest 용)
+                            sink = HashingWriter(open(tmp_file, "wb"))
                             writer = pq.ParquetWriter(
-                                out_file,
-                                arrow.schema,
+                                sink,
+                                arrow_sch,
                                 compression="snappy",
                             )
 
-                        writer.write_table(arrow)
+                        writer.write_table(rows_to_arrow(rows, arrow_sch))
+
+                    cur.close()
 
                 if writer:
                     writer.close()
                     writer = None
+                    sink.close()
+                    tmp_file.replace(out_file)
 
                 elapsed = round(time.time() - start_sql, 2)
 
+                if total_rows > 0:
+                    write_manifest(
+                        out_file,
+                        rows=total_rows,
+                        columns=columns,
+                        sha256=sink.sha256,
+                        sql_hash=sql_hash,
+                        params={k: full_params[k] for k in used_keys},
+                        probe=probe_fp,
+                        elapsed_sec=elapsed,
+                    )
+
                 if total_rows == 0:
                     host_logger.warning(
                         "PARQUET EMPTY | %s | %s | rows=0",
@@ -183,5 +240,9 @@ def export_oracle_to_parquet_stream(
         finally:
             if writer:
                 writer.close()
+            if sink is not None:
+                sink.close()
+            if tmp_file is not None and tmp_file.exists():
+                tmp_file.unlink()
 
     return failed
@@ -1,15 +1,26 @@
 import re
+import csv
+import gzip
 import logging
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-import pandas as pd
-from pandas.api.types import is_integer_dtype, is_float_dtype
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill
 from openpyxl.utils import get_column_letter
 
 from util.paths import CSV_DIR, EXCEL_DIR, SQL_DIR
 
+EXCEL_MAX_ROWS = 1_048_576
+SHEET_DATA_ROWS = EXCEL_MAX_ROWS - 1     # header 1행 제외
+SAMPLE_ROWS = 1000                       # 컬럼 폭 / 숫자 컬럼 판단용 샘플
+
+INT_PATTERN = re.compile(r"^-?(0|[1-9]\d*)$")
+FLOAT_PATTERN = re.compile(r"^-?(0|[1-9]\d*)?\.\d+([eE][-+]?\d+)?$|^-?(0|[1-9]\d*)[eE][-+]?\d+$")
+
 
 # ---------------------------------------------------------
 # Excel 파일명 생성
@@ -44,12 +55,250 @@ def get_excel_output_path(
     return out
 
 
+# ---------------------------------------------------------
+# row source (header 1행 + data row 를 순차 yield)
+# ---------------------------------------------------------
+def iter_csv_rows(path: Path):
+    open_fn = gzip.open if path.name.endswith(".gz") else open
+    with open_fn(path, "rt", newline="", encoding="utf-8") as f:
+        yield from csv.reader(f)
+
+
+def iter_parquet_rows(path: Path, batch_size: int = 65_536):
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path)
+    yield pf.schema_arrow.names
+
+    for batch in pf.iter_batches(batch_size=batch_size):
+        cols = [c.to_pylist() for c in batch.columns]
+        yield from zip(*cols)
+
+
+def iter_file_rows(path: Path):
+    if path.name.endswith(".parquet"):
+        return iter_parquet_rows(path)
+    return iter_csv_rows(path)
+
+
+# ---------------------------------------------------------
+# streaming workbook writer
+# ---------------------------------------------------------
+def _numeric_converter(values: list):
+    """
+    샘플 값이 모두 숫자 문자열이면 int/float 변환 함수 반환
+    (선행 0 코드값 '0012' 등은 문자열 유지)
+    """
+    non_empty = [v for v in values if v not in (None, "")]
+    if not non_empty:
+        return None
+
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in non_empty):
+        return lambda v: v
+
+    if not all(isinstance(v, str) for v in non_empty):
+        return None
+
+    if all(INT_PATTERN.match(v) for v in non_empty):
+        conv = int
+    elif all(INT_PATTERN.match(v) or FLOAT_PATTERN.match(v) for v in non_empty):
+        conv = float
+    else:
+        return None
+
+    def _convert(v):
+        if v is None or v == "":
+            return None
+        try:
+            return conv(v)
+        except ValueError:
+            return v
+
+    return _convert
+
+
+def _unique_sheet_name(name: str, used: set) -> str:
+    name = name[:31]
+    candidate = name
+    n = 2
+    while candidate in used:
+        tail = f"_{n}"
+        candidate = name[: 31 - len(tail)] + tail
+        n += 1
+    used.add(candidate)
+    return candidate
+
+
+def _style_header(ws, header, fill_color):
+    fill = PatternFill("solid", fgColor=fill_color)
+    font = Font(bold=True)
+
+    cells = []
+    for name in header:
+        c = WriteOnlyCell(ws, value=name)
+        c.fill = fill
+        c.font = font
+        cells.append(c)
+    return cells
+
+
+def _write_split_sheets(wb, base_name, rows, used_names, max_width=50):
+    """
+    rows: header + data iterator
+    SHEET_DATA_ROWS 초과분은 BASE_2, BASE_3 ... 시트로 이어서 기록
+    반환: [(sheet_name, rows), ...]
+    """
+    it = iter(rows)
+    header = next(it, None)
+    if header is None:
+        return []
+
+    header = list(header)
+    sample = list(islice(it, SAMPLE_ROWS))
+
+    converters = [
+        _numeric_converter([r[i] if i < len(r) else None for r in sample])
+        for i in range(len(header))
+    ]
+
+    widths = []
+    for i, name in enumerate(header):
+        max_len = len(str(name))
+        for r in sample:
+            if i < len(r) and r[i] not in (None, ""):
+                max_len = max(max_len, len(str(r[i])))
+        widths.append(min(int(max_len * 1.2) + 2, max_width))
+
+    data = chain(sample, it)
+    written = []
+    part = 1
+
+    while True:
+        first = next(data, None)
+        if first is None and part > 1:
+            break
+
+        sheet_name = _unique_sheet_name(base_name if part == 1 else f"{base_name}_{part}", used_names)
+        ws = wb.create_sheet(sheet_name)
+
+        for i, w in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(i)].width = w
+        ws.freeze_panes = "A2"
+
+        ws.append(_style_header(ws, header, "D9E1F2"))
+
+        count = 0
+        for r in chain([first] if first is not None else [], islice(data, SHEET_DATA_ROWS - 1)):
+            out = []
+            for i, v in enumerate(r):
+                conv = converters[i] if i < len(converters) else None
+                if conv is None:
+                    out.append(v)
+                    continue
+
+                v = conv(v)
+                if isinstance(v, (int, float)):
+                    c = WriteOnlyCell(ws, value=v)
+                    c.number_format = "#,##0"
+                    out.append(c)
+                else:
+                    out.append(v)
+
+            ws.append(out)
+            count += 1
+
+        last_col = get_column_letter(max(len(header), 1))
+        ws.auto_filter.ref = f"A1:{last_col}{count + 1}"
+
+        written.append((sheet_name, count))
+
+        if count < SHEET_DATA_ROWS:
+            break
+        part += 1
+
+    return written
+
+
+def write_excel_streaming(out: Path, sheets: list) -> list[dict]:
+    """
+    write-only workbook 으로 시트를 순차 기록 (전체 데이터를 메모리에 올리지 않음)
+
+    sheets: [(sheet_name, rows iterable(header 포함)), ...]
+    반환: SUMMARY 행 목록 [{"sheet_name", "rows"}]
+    """
+    wb = Workbook(write_only=True)
+
+    # SUMMARY 시트를 맨 앞에 만들고 마지막에 채움
+    summary_ws = wb.create_sheet("SUMMARY")
+    used_names = {"SUMMARY"}
+
+    summary_rows = []
+    for base_name, rows in sheets:
+        for sheet_name, count in _write_split_sheets(wb, base_name, rows, used_names):
+            if sheet_name != base_name[:31]:
+                logging.info(
+                    "Excel sheet split | %s → %s | rows=%d",
+                    base_name, sheet_name, count,
+                )
+            summary_rows.append({"sheet_name": sheet_name, "rows": count})
+
+    header = ["no", "sheet_name", "rows"]
+    widths = [6, 30, 14]
+    for i, w in enumerate(widths, start=1):
+        summary_ws.column_dimensions[get_column_letter(i)].width = w
+    summary_ws.freeze_panes = "A2"
+    summary_ws.append(_style_header(summary_ws, header, "BDD7EE"))
+
+    for no, r in enumerate(summary_rows, start=1):
+        link = WriteOnlyCell(summary_ws, value=r["sheet_name"])
+        link.hyperlink = f"#'{r['sheet_name']}'!A1"
+        link.style = "Hyperlink"
+
+        cnt = WriteOnlyCell(summary_ws, value=r["rows"])
+        cnt.number_format = "#,##0"
+
+        summary_ws.append([no, link, cnt])
+
+    summary_ws.auto_filter.ref = f"A1:C{len(summary_rows) + 1}"
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(out)
+
+    return summary_rows
+
+
+def _build_folder_workbook(out: Path, files: list) -> list[dict]:
+    """
+    top folder 1개 → Excel 1개 (process pool worker)
+    """
+    sheets = []
+    for f in files:
+        name = f.name
+        for ext in (".csv.gz", ".csv", ".parquet"):
+            if name.endswith(ext):
+                name = name[: -len(ext)]
+                break
+        sheets.append((name.upper(), iter_file_rows(f)))
+
+    return write_excel_streaming(out, sheets)
+
+
 # ---------------------------------------------------------
 # CSV → Excel
 # ---------------------------------------------------------
-def csv_to_excel(source: str, host_name: str, schema: str, sql_files: list[Path]):
+def csv_to_excel(
+    source: str,
+    host_name: str,
+    schema: str,
+    sql_files: list[Path],
+    workers: int = 4,
+):
     """
     이번 실행 대상 SQL 기준으로 생성된 CSV만 Excel로 변환
+
+    - write-only(streaming) workbook: 파일 크기와 무관하게 메모리 일정
+    - 1,048,575 row 초과 시 시트 분할 (SHEET, SHEET_2 ...)
+    - top folder 별 Excel 을 process 단위로 병렬 생성
     """
 
     base_dir = CSV_DIR / source / host_name
@@ -64,117 +313,46 @@ def csv_to_excel(source: str, host_name: str, schema: str, sql_files: list[Path]
         return
 
     grouped: dict[str, list[Path]] = {}
-    for csv in csv_files:
-        rel = csv.relative_to(base_dir)
+    for csv_file in sorted(csv_files):
+        rel = csv_file.relative_to(base_dir)
         top = rel.parts[0] if rel.parts else "ROOT"
-        grouped.setdefault(top, []).append(csv)
-
-    for top_folder, files in grouped.items():
-        out = get_excel_output_path(schema, top_folder)
-        summary_rows = []
-
-        with pd.ExcelWriter(out, engine="openpyxl") as writer:
-
-            # --------------------------
-            # 각 CSV 시트로 저장
-            # --------------------------
-            for csv in files:
-                rel = csv.relative_to(base_dir)
-                sheet = Path(rel.stem).stem.upper()[:31]
-
-                df = pd.read_csv(csv, compression="gzip")
-                row_count = len(df)
-
-                if row_count > 1_048_576:
-                    logging.warning(
-                        "Excel row limit exceeded, skip sheet | %s | rows=%d",
-                        sheet,
-                        row_count,
-                    )
-                    continue
+        grouped.setdefault(top, []).append(csv_file)
 
-                df.to_excel(writer, sheet_name=sheet, index=False)
-                summary_rows.append({"sheet_name": sheet, "rows": row_count})
-
-                ws = writer.book[sheet]
-
-                ws.freeze_panes = "A2"
-                ws.auto_filter.ref = ws.dimensions
-
-                header_fill = PatternFill("solid", fgColor="D9E1F2")
-                header_font = Font(bold=True)
-
-                for col_idx in range(1, len(df.columns) + 1):
-                    c = ws.cell(row=1, column=col_idx)
-                    c.fill = header_fill
-                    c.font = header_font
-
-                for col_idx, col_name in enumerate(df.columns, start=1):
-                    max_len = len(str(col_name))
-                    for v in df.iloc[:, col_idx - 1]:
-                        if pd.notna(v):
-                            max_len = max(max_len, len(str(v)))
-                    ws.column_dimensions[get_column_letter(col_idx)].width = min(
-                        int(max_len * 1.2) + 2,
-                        50,
-                    )
-
-                for col_idx, col_name in enumerate(df.columns, start=1):
-                    if is_integer_dtype(df[col_name]) or is_float_dtype(df[col_name]):
-                        for row in range(2, ws.max_row + 1):
-                            ws.cell(row=row, column=col_idx).number_format = "#,##0"
-
-            # --------------------------
-            # SUMMARY 시트
-            # --------------------------
-            if summary_rows:
-                summary_df = pd.DataFrame(summary_rows)
-                summary_df.insert(0, "no", range(1, len(summary_df) + 1))
-
-                summary_df.to_excel(writer, sheet_name="SUMMARY", index=False)
-
-                ws = writer.book["SUMMARY"]
-
-                ws.freeze_panes = "A2"
-                ws.auto_filter.ref = ws.dimensions
-
-                header_fill = PatternFill("solid", fgColor="BDD7EE")
-                header_font = Font(bold=True)
-
-                for col_idx in range(1, summary_df.shape[1] + 1):
-                    c = ws.cell(row=1, column=col_idx)
-                    c.fill = header_fill
-                    c.font = header_font
-
-                for col_idx, col_name in enumerate(summary_df.columns, start=1):
-                    max_len = len(str(col_name))
-                    for v in summary_df[col_name]:
-                        if pd.notna(v):
-                            max_len = max(max_len, len(str(v)))
-                    ws.column_dimensions[get_column_letter(col_idx)].width = min(
-                        int(max_len * 1.2) + 2,
-                        30,
-                    )
-
-                # SUMMARY → 시트 이동 hyperlink
-                existing_sheets = set(writer.book.sheetnames)
-
-                for row_idx in range(2, ws.max_row + 1):
-                    sheet_name = ws.cell(row=row_idx, column=2).value
-                    if sheet_name and sheet_name in existing_sheets:
-                        ws.cell(row=row_idx, column=2).hyperlink = f"#'{sheet_name}'!A1"
-                        ws.cell(row=row_idx, column=2).style = "Hyperlink"
-
-                wb = writer.book
-                wb._sheets.insert(0, wb._sheets.pop(wb._sheets.index(ws)))
+    jobs = [
+        (top_folder, get_excel_output_path(schema, top_folder), files)
+        for top_folder, files in grouped.items()
+    ]
 
+    def _done(top_folder, out, summary):
         logging.info(
-            "Excel export completed | schema=%s | folder=%s | file=%s",
+            "Excel export completed | schema=%s | folder=%s | file=%s | sheets=%d",
             schema,
             top_folder,
             out.name,
+            len(summary),
         )
 
+    if workers <= 1 or len(jobs) == 1:
+        for top_folder, out, files in jobs:
+            _done(top_folder, out, _build_folder_workbook(out, files))
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        futures = {
+            executor.submit(_build_folder_workbook, out, files): (top_folder, out)
+            for top_folder, out, files in jobs
+        }
+        for fut, (top_folder, out) in futures.items():
+            try:
+                _done(top_folder, out, fut.result())
+            except Exception as e:
+                logging.error(
+                    "Excel export FAIL | schema=%s | folder=%s | %s",
+                    schema,
+                    top_folder,
+                    e,
+                )
+
 
 # ---------------------------------------------------------
 # SQL 기준 CSV 찾기
@@ -189,7 +367,7 @@ def csv_files_from_sql(source: str, host_name: str, sql_files: list[Path]) -> li
         table = rel.stem
 
         pattern = f"{table}*.csv.gz"
-        for csv in (CSV_DIR / source / host_name / subdir).glob(pattern):
-            csv_files.append(csv)
+        for csv_file in (CSV_DIR / source / host_name / subdir).glob(pattern):
+            csv_files.append(csv_file)
 
     return csv_files
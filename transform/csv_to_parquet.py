@@ -1,34 +1,289 @@
 import time
 import logging
-import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from util.paths import CSV_DIR, PARQUET_DIR
+from util.filename_suffix import split_table_and_suffix
+from util.schema_registry import (
+    load_table_schema, save_table_schema, column_types, arrow_type,
+)
+
+BLOCK_SIZE = 4 << 20          # Arrow CSV reader block (4MB)
+SAMPLE_BLOCKS = 2             # 타입 추론용 샘플 block 수
+
+LEADING_ZERO = r"^-?0\d"
+MAX_NUMERIC_DIGITS = 15       # 이보다 긴 숫자 문자열은 코드/번호로 보고 string 유지
+
+TIMESTAMP_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"]
+DATE_FORMATS = ["%Y-%m-%d"]
+
+
+# ---------------------------------------------------------
+# 타입 추론 (Arrow compute, 컬럼 단위 벡터 연산)
+# ---------------------------------------------------------
+def _can_cast(arr, target) -> bool:
+    try:
+        pc.cast(arr, target)
+        return True
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return False
 
-STRING_KEYWORDS = ["ID", "CODE", "KEY", "NO", "SEQ"]
-NUMERIC_KEYWORDS = ["AMT", "AMOUNT", "RATE", "CNT", "COUNT", "QTY"]
 
+def _can_parse(arr, fmt: str) -> bool:
+    try:
+        pc.strptime(arr, format=fmt, unit="s")
+        return True
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return False
 
-def decide_column_type(col_name: str):
-    col = col_name.upper()
 
-    if any(k in col for k in STRING_KEYWORDS):
+def infer_column_type(arr) -> str:
+    """
+    string 컬럼(샘플) → registry type
+    - 선행 0 코드값 ('0012'), 15자리 초과 번호는 string 유지
+    - 전부 null 이면 string
+    """
+    arr = arr.drop_null()
+    if len(arr) == 0:
         return "string"
-    if any(k in col for k in NUMERIC_KEYWORDS):
-        return "numeric"
-    return None
 
+    if pc.any(pc.match_substring_regex(arr, LEADING_ZERO)).as_py():
+        return "string"
+
+    if _can_cast(arr, pa.int64()):
+        if pc.max(pc.utf8_length(arr)).as_py() > MAX_NUMERIC_DIGITS:
+            return "string"
+        return "int64"
+
+    if _can_cast(arr, pa.float64()):
+        return "float64"
 
-def csv_to_parquet(schema: str):
+    if any(_can_parse(arr, f) for f in TIMESTAMP_FORMATS):
+        return "timestamp"
+
+    if any(_can_parse(arr, f) for f in DATE_FORMATS):
+        return "date"
+
+    return "string"
+
+
+def _merge_type(a: str, b: str) -> str:
+    """
+    block 간 추론 결과 병합 (int64 < float64, 그 외 불일치는 string)
+    """
+    if a == b:
+        return a
+    if {a, b} == {"int64", "float64"}:
+        return "float64"
+    return "string"
+
+
+def _string_reader(path: Path):
+    """
+    모든 컬럼을 string 으로 읽는 streaming reader (추론 전용)
+    """
+    read_opts = pacsv.ReadOptions(block_size=BLOCK_SIZE)
+    reader = pacsv.open_csv(path, read_options=read_opts)
+    names = reader.schema.names
+    reader.close()
+
+    convert_opts = pacsv.ConvertOptions(
+        column_types={n: pa.string() for n in names},
+        null_values=[""],
+        strings_can_be_null=True,
+    )
+    return pacsv.open_csv(path, read_options=read_opts, convert_options=convert_opts)
+
+
+def infer_csv_types(path: Path, max_blocks: int | None = SAMPLE_BLOCKS) -> dict:
+    """
+    CSV 앞쪽 block 샘플(max_blocks=None 이면 전체)로 컬럼 타입 추론
+    반환: {컬럼명: type} (CSV 컬럼 순서 유지)
+    """
+    reader = _string_reader(path)
+    types: dict = {}
+
+    try:
+        for i, batch in enumerate(reader):
+            if max_blocks is not None and i >= max_blocks:
+                break
+
+            for name, arr in zip(batch.schema.names, batch.columns):
+                t = infer_column_type(arr)
+                if name in types:
+                    if pc.all(pc.is_null(arr)).as_py():
+                        continue
+                    types[name] = _merge_type(types[name], t)
+                else:
+                    types[name] = t
+
+        if not types:
+            types = {n: "string" for n in reader.schema.names}
+    finally:
+        reader.close()
+
+    return types
+
+
+# ---------------------------------------------------------
+# streaming 변환 (block 단위 read → ParquetWriter)
+# ---------------------------------------------------------
+def _convert_options(types: dict):
+    arrow_types = {}
+    timestamp_formats = set()
+
+    for name, t in types.items():
+        arrow_types[name] = arrow_type(t)
+        if t == "timestamp":
+            timestamp_formats.update(TIMESTAMP_FORMATS)
+        elif t == "date":
+            timestamp_formats.update(DATE_FORMATS)
+
+    return pacsv.ConvertOptions(
+        column_types=arrow_types,
+        null_values=[""],
+        strings_can_be_null=True,
+        timestamp_parsers=sorted(timestamp_formats) or None,
+    )
+
+
+def write_parquet_streaming(csv_path: Path, out: Path, types: dict) -> int:
+    """
+    tmp 파일에 block 단위로 기록 후 rename
+    반환: row 수
+    """
+    tmp = out.with_name(out.name + ".tmp")
+    rows = 0
+    writer = None
+
+    try:
+        reader = pacsv.open_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(block_size=BLOCK_SIZE),
+            convert_options=_convert_options(types),
+        )
+        try:
+            schema = reader.schema
+            writer = pq.ParquetWriter(tmp, schema)
+
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        finally:
+            reader.close()
+
+        writer.close()
+        writer = None
+        tmp.replace(out)
+        return rows
+
+    finally:
+        if writer is not None:
+            writer.close()
+        if tmp.exists():
+            tmp.unlink()
+
+
+# ---------------------------------------------------------
+# 테이블 단위 변환 (process pool worker)
+# ---------------------------------------------------------
+def _resolve_types(schema: str, table: str, csv_path: Path, registered: dict) -> tuple[dict, bool]:
+    """
+    registry 타입 우선, 신규 컬럼만 샘플 추론
+    반환: (types, registry 갱신 필요 여부)
+    """
+    inferred = infer_csv_types(csv_path)
+
+    if not registered:
+        return inferred, True
+
+    types = {}
+    changed = False
+    for name, t in inferred.items():
+        if name.upper() in registered:
+            types[name] = registered[name.upper()]
+        else:
+            logging.warning(
+                "Schema registry new column | %s.%s.%s -> %s",
+                schema, table, name, t,
+            )
+            types[name] = t
+            changed = True
+
+    missing = set(registered) - {n.upper() for n in inferred}
+    if missing:
+        logging.warning(
+            "Schema registry missing column | %s.%s | %s | %s",
+            schema, table, sorted(missing), csv_path.name,
+        )
+
+    return types, changed
+
+
+def convert_table_files(schema: str, table: str, jobs: list[tuple[Path, Path]]) -> list[tuple]:
+    """
+    같은 테이블의 CSV 들을 순서대로 변환 (registry 갱신 경합 방지)
+    반환: [(csv_path, status, rows, elapsed, message), ...]
+    """
+    results = []
+
+    for csv_path, out in jobs:
+        start = time.time()
+        try:
+            entry = load_table_schema(schema, table)
+            registered = column_types(entry)
+
+            types, changed = _resolve_types(schema, table, csv_path, registered)
+
+            try:
+                rows = write_parquet_streaming(csv_path, out, types)
+            except pa.ArrowInvalid as e:
+                if registered:
+                    # 등록된 타입과 다른 값 → 월별 타입 불일치를 막기 위해 실패 처리
+                    raise ValueError(f"type drift vs schema registry: {e}") from e
+                # 샘플 밖에서 타입이 달라짐 → 전체 block 으로 재추론
+                types = infer_csv_types(csv_path, max_blocks=None)
+                rows = write_parquet_streaming(csv_path, out, types)
+
+            if changed:
+                columns = [{"name": n, "type": t} for n, t in types.items()]
+                if entry:
+                    known = {c["name"].upper() for c in columns}
+                    columns += [c for c in entry["columns"] if c["name"].upper() not in known]
+                save_table_schema(schema, table, columns, source=f"csv:{csv_path.name}")
+
+            results.append((csv_path, "OK", rows, time.time() - start, ""))
+
+        except Exception as e:
+            results.append((csv_path, "FAIL", 0, time.time() - start, str(e)[:500]))
+
+    return results
+
+
+# ---------------------------------------------------------
+# CSV → Parquet
+# ---------------------------------------------------------
+def csv_to_parquet(schema: str, workers: int = 4):
     """
     CSV 파일명 그대로 Parquet 변환
     (suffix 포함 / 이미 존재하면 SKIP)
+
+    - Arrow CSV reader 로 block 단위 streaming (파일 전체를 메모리에 올리지 않음)
+    - 컬럼 타입은 값 샘플로 추론, 테이블별 schema registry 로 월별 타입 고정
+    - 테이블 단위로 process 병렬 변환
     """
     base = CSV_DIR / schema
     out_base = PARQUET_DIR / schema
 
-    for csv in base.rglob("*.csv.gz"):
+    by_table: dict[str, list] = {}
+
+    for csv in sorted(base.rglob("*.csv.gz")):
         rel = csv.relative_to(base)
         out = out_base / rel.with_name(rel.name.replace(".csv.gz", ".parquet"))
 
@@ -41,41 +296,49 @@ def csv_to_parquet(schema: str):
 
         out.parent.mkdir(parents=True, exist_ok=True)
 
-        start = time.time()
-        try:
-            df = pd.read_csv(csv, compression="gzip", low_memory=False)
-
-            fields = []
-            arrays = []
-
-            for col in df.columns:
-                rule = decide_column_type(col)
-
-                if rule == "string":
-                    arr = pa.array(df[col].astype(str))
-                    fields.append(pa.field(col, pa.string()))
-                elif rule == "numeric":
-                    arr = pa.array(pd.to_numeric(df[col], errors="coerce"))
-                    fields.append(pa.field(col, pa.float64()))
-                else:
-                    arr = pa.array(df[col])
-                    fields.append(pa.field(col, arr.type))
+        table, _ = split_table_and_suffix(csv.name[: -len(".csv.gz")])
+        by_table.setdefault(table, []).append((csv, out))
 
-                arrays.append(arr)
+    if not by_table:
+        return
 
-            table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
-            pq.write_table(table, out)
+    def _log(table, result):
+        csv_path, status, rows, elapsed, msg = result
+        rel = csv_path.relative_to(base).as_posix()
 
-            elapsed = round(time.time() - start, 2)
+        if status == "OK":
             logging.info(
-                "Parquet OK | %s | %.2fs",
-                rel.as_posix(),
+                "Parquet OK | %s | rows=%d | %.2fs",
+                rel,
+                rows,
                 elapsed,
             )
-
-        except Exception as e:
+        else:
             logging.error(
                 "Parquet FAIL | %s | %s",
-                rel.as_posix(),
-                e,
+                rel,
+                msg,
             )
+
+    if workers <= 1 or len(by_table) == 1:
+        for table, jobs in by_table.items():
+            for r in convert_table_files(schema, table, jobs):
+                _log(table, r)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(by_table))) as executor:
+        futures = {
+            executor.submit(convert_table_files, schema, table, jobs): table
+            for table, jobs in by_table.items()
+        }
+        for fut in as_completed(futures):
+            table = futures[fut]
+            try:
+                for r in fut.result():
+                    _log(table, r)
+            except Exception as e:
+                logging.error(
+                    "Parquet FAIL | table=%s | %s",
+                    table,
+                    e,
+                )
@@ -0,0 +1,200 @@
+# util/manifest.py
+import gzip
+import hashlib
+import io
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# =========================================================
+# export 결과 파일 옆 sidecar manifest
+#   <file>.manifest.json
+#   {"file", "rows", "columns", "sha256", "file_size", "mtime",
+#    "sql_hash", "params", "elapsed_sec", "created_at"[, "probe"]}
+# 적재 / 리포트는 데이터 파일을 다시 읽지 않고 manifest 로 dedup / row 검증
+# =========================================================
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def manifest_path(data_file: Path) -> Path:
+    data_file = Path(data_file)
+    return data_file.with_name(data_file.name + MANIFEST_SUFFIX)
+
+
+def is_manifest(path: Path) -> bool:
+    return Path(path).name.endswith(MANIFEST_SUFFIX)
+
+
+# ---------------------------------------------------------
+# streaming checksum
+# ---------------------------------------------------------
+class HashingWriter(io.RawIOBase):
+    """
+    실제 파일에 쓰면서 sha256 / byte 수를 같이 계산 (파일 재읽기 없음)
+    write_sec / hash_sec / compress_sec : profile 용 누적 시간 (1MB 단위 write 라 부담 없음)
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._h = hashlib.sha256()
+        self.size = 0
+        self.write_sec = 0.0
+        self.hash_sec = 0.0
+        self.compress_sec = 0.0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        t0 = time.perf_counter()
+        n = self._raw.write(b)
+        t1 = time.perf_counter()
+        self._h.update(b)
+        self.write_sec += t1 - t0
+        self.hash_sec += time.perf_counter() - t1
+        self.size += len(b)
+        return n
+
+    def flush(self):
+        self._raw.flush()
+
+    def close(self):
+        if not self.closed:
+            super().close()         # flush
+            self._raw.close()
+
+    @property
+    def sha256(self) -> str:
+        return self._h.hexdigest()
+
+
+class _TimedGzipFile(gzip.GzipFile):
+    """
+    gzip.write 시간(압축 + 하위 write 포함)을 hasher.compress_sec 에 누적
+    """
+
+    def __init__(self, hasher, **kwargs):
+        super().__init__(**kwargs)
+        self._hasher = hasher
+
+    def write(self, data):
+        t0 = time.perf_counter()
+        try:
+            return super().write(data)
+        finally:
+            self._hasher.compress_sec += time.perf_counter() - t0
+
+
+@contextmanager
+def open_hashed_text(path: Path, compression: str = "none"):
+    """
+    gzip / plain text writer + HashingWriter
+    with 블록 종료 후 hasher.sha256 == 최종 파일 sha256
+    """
+    hasher = HashingWriter(open(path, "wb"))
+    buf = io.BufferedWriter(hasher, buffer_size=1 << 20)
+    gz = None
+    try:
+        if compression == "gzip":
+            gz = _TimedGzipFile(hasher, fileobj=buf, mode="wb")
+            text = io.TextIOWrapper(gz, encoding="utf-8", newline="")
+        else:
+            text = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+
+        with text:
+            yield text, hasher
+    finally:
+        # GzipFile 은 fileobj 를 닫지 않으므로 순서대로 정리
+        if gz is not None and not gz.closed:
+            gz.close()
+        if not buf.closed:
+            buf.close()
+        hasher.close()
+
+
+def file_sha256(path: Path, chunk_size: int = 8 * 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            b = f.read(chunk_size)
+            if not b:
+                break
+            h.update(b)
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------
+# write / read
+# ---------------------------------------------------------
+def write_manifest(
+    data_file: Path,
+    rows: int,
+    columns: list,
+    sha256: str,
+    sql_hash: str = "",
+    params: dict | None = None,
+    elapsed_sec: float | None = None,
+    probe: str | None = None,
+) -> Path:
+    """
+    data_file commit(rename) 직후 호출
+    columns: [{"name", "type"...}] 또는 컬럼명 list
+    probe: source 변경 probe fingerprint (util.source_probe)
+    """
+    data_file = Path(data_file)
+    st = data_file.stat()
+
+    data = {
+        "file": data_file.name,
+        "rows": rows,
+        "columns": [c if isinstance(c, dict) else {"name": c} for c in columns],
+        "sha256": sha256,
+        "file_size": st.st_size,
+        "mtime": st.st_mtime,
+        "sql_hash": sql_hash,
+        "params": params or {},
+        "elapsed_sec": None if elapsed_sec is None else round(elapsed_sec, 2),
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    if probe:
+        data["probe"] = probe
+
+    p = manifest_path(data_file)
+    tmp = p.with_name(p.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    tmp.replace(p)
+
+    return p
+
+
+def read_manifest(data_file: Path) -> dict | None:
+    """
+    manifest 가 없거나 데이터 파일 크기 / mtime 이 다르면(파일 교체) None
+    """
+    data_file = Path(data_file)
+    p = manifest_path(data_file)
+
+    if not p.exists() or not data_file.exists():
+        return None
+
+    try:
+        with open(p, "r", encoding="utf-8") as f:
+            m = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    st = data_file.stat()
+    if m.get("file_size") != st.st_size or abs((m.get("mtime") or 0) - st.st_mtime) > 1e-3:
+        return None
+
+    return m
+
+
+def remove_manifest(data_file: Path) -> None:
+    p = manifest_path(data_file)
+    if p.exists():
+        p.unlink()
+
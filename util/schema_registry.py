@@ -0,0 +1,337 @@
+# util/schema_registry.py
+import re
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from util.paths import DATA_DIR
+
+# =========================================================
+# 테이블별 컬럼 타입 registry (JSON)
+#   data/schema_registry/<schema>/<TABLE>.json
+#   {"table", "schema", "source", "updated_at",
+#    "columns": [{"name": "...", "type": "string|int64|float64|decimal(p,s)|bool|date|timestamp",
+#                 "db_type", "precision", "scale", "nullable"}],   # db_type~ : export 시 기록
+#    "drift": [{"at", "source", "changes"}]}
+# =========================================================
+REGISTRY_DIR = DATA_DIR / "schema_registry"
+
+# 같은 테이블을 여러 thread 가 동시에 export 하는 경우 (파라미터 병렬)
+_LOCK = threading.Lock()
+
+
+def registry_path(schema: str, table: str) -> Path:
+    return REGISTRY_DIR / schema / f"{table.upper()}.json"
+
+
+def load_table_schema(schema: str, table: str) -> dict | None:
+    p = registry_path(schema, table)
+    if not p.exists():
+        return None
+
+    with open(p, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_table_schema(schema: str, table: str, columns: list[dict], source: str) -> Path:
+    """
+    tmp 파일에 쓴 뒤 rename (동시 실행 중 깨진 JSON 방지)
+    """
+    data = {
+        "schema": schema,
+        "table": table.upper(),
+        "source": source,
+        "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "columns": columns,
+    }
+    return _write_entry(schema, table, data)
+
+
+def _write_entry(schema: str, table: str, data: dict) -> Path:
+    p = registry_path(schema, table)
+    p.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = p.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp.replace(p)
+
+    return p
+
+
+def column_types(entry: dict | None) -> dict:
+    """
+    registry entry → {컬럼명(upper): type}
+    """
+    if not entry:
+        return {}
+    return {c["name"].upper(): c["type"] for c in entry.get("columns", [])}
+
+
+def arrow_type(type_name: str):
+    import pyarrow as pa
+
+    t = (type_name or "string").lower()
+
+    if t == "int64":
+        return pa.int64()
+    if t == "float64":
+        return pa.float64()
+    if t == "date":
+        return pa.date32()
+    if t == "timestamp":
+        return pa.timestamp("us")
+    if t == "bool":
+        return pa.bool_()
+    if t.startswith("decimal("):
+        p, s = (int(x) for x in t[len("decimal("):-1].split(","))
+        return pa.decimal128(p, s)
+    return pa.string()
+
+
+def duckdb_type(type_name: str) -> str:
+    t = (type_name or "string").lower()
+
+    if t.startswith("decimal("):
+        return t.upper()
+    return {
+        "int64": "BIGINT",
+        "float64": "DOUBLE",
+        "bool": "BOOLEAN",
+        "date": "DATE",
+        "timestamp": "TIMESTAMP",
+    }.get(t, "VARCHAR")
+
+
+def duckdb_column_types(entry: dict | None) -> dict:
+    """
+    registry entry → {컬럼명(upper): DuckDB 타입}
+    """
+    return {n: duckdb_type(t) for n, t in column_types(entry).items()}
+
+
+# =========================================================
+# cursor.description → registry 컬럼
+# =========================================================
+# vertica_python 은 type_code 로 OID(int) 를 돌려줌
+VERTICA_TYPE_CODES = {
+    5: "BOOLEAN",
+    6: "INTEGER",
+    7: "FLOAT",
+    8: "CHAR",
+    9: "VARCHAR",
+    10: "DATE",
+    11: "TIME",
+    12: "TIMESTAMP",
+    13: "TIMESTAMPTZ",
+    16: "NUMERIC",
+    115: "LONG VARCHAR",
+}
+
+
+_TYPE_ARGS = re.compile(r"^([A-Z_ ]+)\((.*)\)$")
+
+
+def db_type_name(type_code) -> str:
+    """
+    oracledb DbType(DB_TYPE_NUMBER) / vertica OID(int) / 문자열 → 'NUMBER' 형태
+    """
+    if isinstance(type_code, int):
+        return VERTICA_TYPE_CODES.get(type_code, str(type_code))
+
+    name = getattr(type_code, "name", None) or str(type_code)
+    name = name.upper()
+    if name.startswith("<"):
+        name = name.strip("<>").split()[-1]
+    return name.replace("DB_TYPE_", "")
+
+
+def logical_type(db_type: str, precision, scale) -> str:
+    t = db_type.upper()
+
+    if t in ("NUMBER", "NUMERIC", "DECIMAL"):
+        p = precision or 0
+        s = scale if scale is not None else -127
+
+        # Oracle NUMBER (precision/scale 미지정) → scale -127
+        if p <= 0 or s < 0:
+            return "float64"
+        if s == 0 and p <= 18:
+            return "int64"
+        return f"decimal({min(p, 38)},{s})"
+
+    if t in ("INTEGER", "INT", "BIGINT", "SMALLINT", "BINARY_INTEGER"):
+        return "int64"
+    if t in ("FLOAT", "DOUBLE", "REAL", "BINARY_DOUBLE", "BINARY_FLOAT", "DOUBLE PRECISION"):
+        return "float64"
+    if t == "BOOLEAN":
+        return "bool"
+
+    if t.startswith("TIMESTAMP"):
+        return "timestamp"
+    if t == "DATE":
+        return "date"
+
+    return "string"
+
+
+def columns_from_description(description, oracle: bool = False) -> list[dict]:
+    """
+    DB-API cursor.description
+      (name, type_code, display_size, internal_size, precision, scale, null_ok)
+    """
+    columns = []
+    for d in description:
+        name, type_code = d[0], d[1]
+        precision = d[4] if len(d) > 4 else None
+        scale = d[5] if len(d) > 5 else None
+        null_ok = d[6] if len(d) > 6 else None
+
+        db_type = db_type_name(type_code)
+
+        # DuckDB 등 'DECIMAL(10,2)' 형태 문자열 type_code
+        m = _TYPE_ARGS.match(db_type)
+        if m:
+            db_type = m.group(1).strip()
+            args = [int(x) for x in m.group(2).split(",") if x.strip().isdigit()]
+            if precision is None and args:
+                precision = args[0]
+            if scale is None and len(args) > 1:
+                scale = args[1]
+
+        # Oracle DATE 는 시각 포함 → timestamp
+        if oracle and db_type == "DATE":
+            t = "timestamp"
+        else:
+            t = logical_type(db_type, precision, scale)
+
+        columns.append({
+            "name": name,
+            "type": t,
+            "db_type": db_type,
+            "precision": precision,
+            "scale": scale,
+            "nullable": None if null_ok is None else bool(null_ok),
+        })
+    return columns
+
+
+# =========================================================
+# export 시점 등록 / type drift 판정
+# =========================================================
+def register_export_schema(schema: str, table: str, columns: list[dict],
+                           source: str) -> tuple[dict, list[str]]:
+    """
+    최초 export → 그대로 등록
+    이후 export → 등록 타입 유지, 다른 타입은 drift 로 기록 (실패시키지 않음)
+    반환: (registry entry, drift 메시지 목록)
+    """
+    with _LOCK:
+        return _register_export_schema(schema, table, columns, source)
+
+
+def _register_export_schema(schema, table, columns, source):
+    entry = load_table_schema(schema, table)
+
+    if not entry:
+        save_table_schema(schema, table, columns, source=source)
+        return load_table_schema(schema, table), []
+
+    registered = {c["name"].upper(): c for c in entry["columns"]}
+    drift = []
+    added = []
+
+    for c in columns:
+        old = registered.get(c["name"].upper())
+        if old is None:
+            added.append(c)
+            drift.append(f"{c['name']}: new column ({c['type']})")
+        elif old["type"] != c["type"]:
+            drift.append(f"{c['name']}: {old['type']} -> {c['type']}")
+
+    if not drift:
+        return entry, []
+
+    entry.setdefault("drift", []).append({
+        "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "source": source,
+        "changes": drift,
+    })
+    entry["columns"] = entry["columns"] + added
+    _write_entry(schema, table, entry)
+
+    return entry, drift
+
+
+# =========================================================
+# Arrow 변환 (Parquet writer schema 고정)
+# =========================================================
+def _decimal_scale(t: str) -> int | None:
+    if t.startswith("decimal("):
+        return int(t[len("decimal("):-1].split(",")[1])
+    return None
+
+
+def widen_type(registered: str, observed: str) -> str:
+    """
+    drift 컬럼의 writer 타입: 두 타입을 모두 담을 수 있는 타입
+      int64 / decimal → decimal(38, s), float64 가 섞이면 float64, 그 외 string
+    """
+    if registered == observed:
+        return registered
+    pair = {registered, observed}
+    numeric = all(t in ("int64", "float64") or t.startswith("decimal(") for t in pair)
+    if not numeric:
+        return "string"
+    if "float64" in pair:
+        return "float64"
+    scale = max(_decimal_scale(t) or 0 for t in pair)
+    return f"decimal(38,{scale})"
+
+
+def arrow_schema(entry: dict, names: list[str], observed: list[dict] | None = None):
+    """
+    결과 컬럼 순서(names) 기준으로 registry 타입 적용
+    observed: 이번 export 의 컬럼 (columns_from_description). 등록 타입과 다르면 (drift)
+              등록 타입으로 cast 하지 않고 widen_type 으로 넓힘 → export 는 계속 진행
+    """
+    import pyarrow as pa
+
+    types = column_types(entry)
+    seen = column_types({"columns": observed}) if observed else {}
+
+    fields = []
+    for n in names:
+        t = types.get(n.upper(), "string")
+        if n.upper() in seen:
+            t = widen_type(t, seen[n.upper()])
+        fields.append(pa.field(n, arrow_type(t)))
+    return pa.schema(fields)
+
+
+def rows_to_arrow(rows: list, schema):
+    """
+    fetchmany 결과(tuple list) → registry schema 의 pyarrow Table
+    """
+    import pyarrow as pa
+    from decimal import Decimal
+
+    cols = list(zip(*rows)) if rows else [[] for _ in schema]
+    arrays = []
+
+    for values, field in zip(cols, schema):
+        t = field.type
+
+        if pa.types.is_decimal(t):
+            values = [
+                v if v is None or isinstance(v, Decimal) else Decimal(str(v))
+                for v in values
+            ]
+            arrays.append(pa.array(values, type=t))
+        elif pa.types.is_string(t):
+            arrays.append(pa.array([None if v is None else str(v) for v in values], type=t))
+        else:
+            arrays.append(pa.array(values).cast(t))
+
+    return pa.Table.from_arrays(arrays, schema=schema)
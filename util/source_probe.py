@@ -0,0 +1,84 @@
+# util/source_probe.py
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from util.manifest import read_manifest
+
+# =========================================================
+# source 변경 probe
+#   SQL 헤더 주석:  --@probe: SELECT COUNT(*), MAX(upd_dt) FROM t WHERE ym = :clsYymm
+#   (여러 줄이면 --@probe: 줄을 순서대로 이어 붙임)
+# probe 결과 fingerprint 를 manifest 의 "probe" 에 기록
+# 다음 실행 때 같으면 본 query 를 건너뛰고 기존 파일 유지, 다르면 재-export
+# =========================================================
+PROBE_HEADER = re.compile(r"^\s*--\s*@probe:\s*(.*?)\s*$", re.MULTILINE | re.IGNORECASE)
+
+
+def extract_probe_sql(sql_text: str) -> str | None:
+    lines = [m.group(1) for m in PROBE_HEADER.finditer(sql_text) if m.group(1)]
+    if not lines:
+        return None
+    probe = "\n".join(lines).strip()
+    while probe.endswith(";"):
+        probe = probe[:-1].rstrip()
+    return probe or None
+
+
+def probe_fingerprint(rows) -> str:
+    """
+    probe 결과 row → sha256 (Decimal / datetime 등은 str 로 정규화)
+    """
+    data = json.dumps([list(r) for r in rows], default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def run_probe(conn, probe_sql: str) -> str:
+    cur = conn.cursor()
+    try:
+        cur.execute(probe_sql)
+        return probe_fingerprint(cur.fetchall())
+    finally:
+        cur.close()
+
+
+async def run_probe_async(conn, probe_sql: str) -> str:
+    cur = conn.cursor()
+    try:
+        await cur.execute(probe_sql)
+        return probe_fingerprint(await cur.fetchall())
+    finally:
+        cur.close()
+
+
+def probe_unchanged(data_file: Path, fingerprint: str, others=()) -> bool:
+    """
+    data_file(+ others) 가 모두 있고 마지막 성공 export 의 probe 값이 같으면 True
+    """
+    if not Path(data_file).exists() or not all(Path(f).exists() for f in others):
+        return False
+    m = read_manifest(data_file)
+    return m is not None and m.get("probe") == fingerprint
+
+
+def check_source_probe(get_conn, host_cfg, probe_sql: str, out_file: Path,
+                       logger, label: str) -> tuple[bool, str | None]:
+    """
+    v1 exporter 용. 반환: (skip 여부, fingerprint)
+    probe 실패 시 (False, None) → 기존 규칙(파일 존재 skip) 그대로
+    """
+    try:
+        with get_conn(host_cfg) as conn:
+            fingerprint = run_probe(conn, probe_sql)
+    except Exception as e:
+        logger.warning("PROBE FAIL | %s | %s", label, str(e)[:200])
+        return False, None
+
+    if probe_unchanged(out_file, fingerprint):
+        logger.info("SKIP (source unchanged, probe) | %s", label)
+        return True, fingerprint
+
+    if Path(out_file).exists():
+        logger.info("SOURCE CHANGED (probe), re-export | %s", label)
+    return False, fingerprint
@@ -0,0 +1,148 @@
+# file: v2/adapters/sources/fused_source.py
+
+import csv
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+from v2.engine.runtime_state import stop_event
+from v2.engine.sql_fusion import FUSE_KEY, fuse_key_str
+from util.manifest import open_hashed_text, write_manifest
+from util.schema_registry import columns_from_description
+
+
+def export_fused_to_csv(
+    conn,
+    sql_text,
+    out_files,            # {param 값: out_file}
+    logger,
+    compression="none",
+    fetch_size=10000,
+    oracle=True,
+    on_describe=None,     # on_describe(description) : FUSE_KEY 제외한 description
+    manifests=None,       # {param 값: {"sql_hash", "params"}}
+    progress=None,
+):
+    """
+    fused SQL 1회 실행 → 첫 컬럼(FUSE_KEY__) 값 기준으로 파일별 분리 기록
+    모든 파일은 tmp 에 쓰고 전체 성공 시에만 commit (일부만 남지 않음)
+    반환: {param 값: row 수}
+    """
+    start = time.time()
+    cursor = conn.cursor()
+
+    try:
+        if hasattr(cursor, "arraysize"):
+            cursor.arraysize = fetch_size
+
+        try:
+            cursor.execute(sql_text)
+        except Exception as e:
+            _raise_if_cancelled(progress, e)
+            raise
+
+        description = cursor.description
+        if description is None or str(description[0][0]).upper() != FUSE_KEY:
+            raise RuntimeError("Fused SQL must return FUSE_KEY__ as first column")
+
+        data_desc = list(description[1:])
+        columns = [d[0] for d in data_desc]
+
+        if on_describe:
+            on_describe(data_desc)
+
+        if progress is not None:
+            progress.beat(phase="fetch")
+
+        tmp_files = {v: Path(f).with_name(Path(f).name + ".tmp") for v, f in out_files.items()}
+        rows_by_value = {v: 0 for v in out_files}
+
+        try:
+            with ExitStack() as stack:
+                writers = {}
+                hashers = {}
+                for v, tmp in tmp_files.items():
+                    tmp.parent.mkdir(parents=True, exist_ok=True)
+                    f, hasher = stack.enter_context(open_hashed_text(tmp, compression))
+                    writers[v] = csv.writer(f)
+                    writers[v].writerow(columns)
+                    hashers[v] = hasher
+
+                total_rows = 0
+                last_log_ts = time.time()
+
+                while True:
+                    if progress is not None:
+                        progress.check()
+                    elif stop_event.is_set():
+                        raise RuntimeError("Export interrupted")
+
+                    rows = cursor.fetchmany(fetch_size)
+                    if not rows:
+                        break
+
+                    # 값별로 모아서 writerows (row 단위 dict 조회 최소화)
+                    groups = {}
+                    for r in rows:
+                        groups.setdefault(r[0], []).append(r[1:])
+
+                    for raw_key, grp in groups.items():
+                        key = fuse_key_str(raw_key)
+                        w = writers.get(key)
+                        if w is None:
+                            raise RuntimeError(f"Fused result has unexpected key: {raw_key!r}")
+                        w.writerows(grp)
+                        rows_by_value[key] += len(grp)
+
+                    total_rows += len(rows)
+
+                    if progress is not None:
+                        progress.beat(len(rows), bytes_written=sum(h.size for h in hashers.values()))
+
+                    now = time.time()
+                    if now - last_log_ts >= 120:
+                        logger.info("CSV progress (fused): %d rows (heartbeat)", total_rows)
+                        last_log_ts = now
+
+            for v, tmp in tmp_files.items():
+                tmp.replace(out_files[v])
+
+            elapsed = time.time() - start
+            if manifests:
+                manifest_cols = columns_from_description(data_desc, oracle=oracle)
+                for v, out_file in out_files.items():
+                    m = manifests.get(v) or {}
+                    write_manifest(
+                        out_file,
+                        rows=rows_by_value[v],
+                        columns=manifest_cols,
+                        sha256=hashers[v].sha256,
+                        sql_hash=m.get("sql_hash", ""),
+                        params=m.get("params"),
+                        elapsed_sec=elapsed,
+                    )
+
+            logger.info(
+                "CSV export completed (fused) | rows=%d files=%d",
+                total_rows, len(out_files),
+            )
+
+        except Exception as e:
+            for tmp in tmp_files.values():
+                if tmp.exists():
+                    tmp.unlink()
+            _raise_if_cancelled(progress, e)
+            raise
+
+        return rows_by_value
+
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+
+def _raise_if_cancelled(progress, exc):
+    if progress is not None and progress.cancelled:
+        raise RuntimeError(f"Export cancelled: {progress.cancel_reason}") from exc
@@ -0,0 +1,168 @@
+# file: v2/adapters/sources/oracle_async_source.py
+
+import asyncio
+import csv
+import time
+from pathlib import Path
+
+from v2.engine.runtime_state import stop_event
+from v2.engine.profiler import profiler
+from util.manifest import open_hashed_text, write_manifest
+from util.schema_registry import columns_from_description
+
+STOP_POLL_SEC = 1.0
+
+
+async def export_sql_to_csv_async(
+    conn,
+    sql_text,
+    out_file,
+    logger,
+    compression="none",
+    fetch_size=10000,
+    stall_seconds=1800,
+    on_describe=None,
+    manifest=None,
+    progress=None,
+    executor=None,
+    profile_key=None,
+):
+    """
+    oracledb AsyncConnection 기반 CSV export (oracle_source.export_sql_to_csv 와 같은 결과)
+
+    - execute / fetchmany 는 event loop 에서 대기 (thread 점유 없음)
+    - csv encode / gzip / 파일 기록은 executor 로 넘김
+    - stall: await 마다 stall_seconds timeout → 예외 (호출측에서 connection 폐기)
+    - stop 요청 / watchdog cancel: STOP_POLL_SEC 마다 확인 → 블록된 await 취소 후 예외
+    - profile_key: (stage, task). event loop 는 thread 1개이므로 task 를 명시해서 누적
+    """
+    loop = asyncio.get_running_loop()
+    start = time.time()
+
+    def _add(phase, sec):
+        if profile_key is not None:
+            profiler.add(profile_key[0], profile_key[1], phase, sec)
+
+    async def _await(coro, phase):
+        # stall timeout 과 stop 요청 / watchdog cancel 을 같이 감시
+        # (블록된 await 를 직접 취소. connection 은 호출측에서 폐기)
+        fut = asyncio.ensure_future(coro)
+        deadline = loop.time() + stall_seconds
+        while True:
+            done, _ = await asyncio.wait({fut}, timeout=min(STOP_POLL_SEC, max(deadline - loop.time(), 0)))
+            if done:
+                return fut.result()
+
+            if stop_event.is_set():
+                reason = "stop requested"
+            elif progress is not None and progress.cancelled:
+                reason = progress.cancel_reason
+            elif loop.time() >= deadline:
+                reason = f"stalled > {stall_seconds}s (phase={phase})"
+            else:
+                continue
+
+            fut.cancel()
+            try:
+                await fut
+            except (asyncio.CancelledError, Exception):
+                pass
+            if progress is not None:
+                progress.cancel(reason)
+            raise RuntimeError(f"Export cancelled: {reason}")
+
+    cursor = conn.cursor()
+
+    try:
+        cursor.arraysize = fetch_size
+        cursor.prefetchrows = fetch_size
+
+        t0 = time.perf_counter()
+        await _await(cursor.execute(sql_text), "execute")
+        _add("execute", time.perf_counter() - t0)
+
+        description = cursor.description
+        columns = [d[0] for d in description]
+
+        if on_describe:
+            await loop.run_in_executor(executor, on_describe, description)
+
+        if progress is not None:
+            progress.beat(phase="fetch")
+
+        out_file = Path(out_file)
+        tmp_file = out_file.with_suffix(out_file.suffix + ".tmp")
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+
+        total_rows = 0
+        fetch_sec = first_row_sec = write_sec = 0.0
+
+        try:
+            with open_hashed_text(tmp_file, compression) as (f, hasher):
+                writer = csv.writer(f)
+                writer.writerow(columns)
+
+                while True:
+                    if progress is not None:
+                        progress.check()
+                    elif stop_event.is_set():
+                        raise RuntimeError("Export interrupted")
+
+                    t0 = time.perf_counter()
+                    rows = await _await(cursor.fetchmany(fetch_size), "fetch")
+                    t1 = time.perf_counter()
+                    if total_rows == 0:
+                        first_row_sec = t1 - t0
+                    else:
+                        fetch_sec += t1 - t0
+
+                    if not rows:
+                        break
+
+                    # 같은 파일 writer 를 쓰므로 chunk 단위로 순서대로 await
+                    await loop.run_in_executor(executor, writer.writerows, rows)
+                    write_sec += time.perf_counter() - t1
+                    total_rows += len(rows)
+
+                    if progress is not None:
+                        progress.beat(len(rows), bytes_written=hasher.size)
+
+            _add("first_row", first_row_sec)
+            _add("fetch", fetch_sec)
+            _add("write", write_sec)
+
+            tmp_file.replace(out_file)
+
+            if manifest is not None:
+                t0 = time.perf_counter()
+                await loop.run_in_executor(executor, lambda: write_manifest(
+                    out_file,
+                    rows=total_rows,
+                    columns=columns_from_description(description, oracle=True),
+                    sha256=hasher.sha256,
+                    sql_hash=manifest.get("sql_hash", ""),
+                    params=manifest.get("params"),
+                    probe=manifest.get("probe"),
+                    elapsed_sec=time.time() - start,
+                ))
+                _add("manifest", time.perf_counter() - t0)
+
+            logger.info("CSV export completed (async) | rows=%d file=%s", total_rows, out_file)
+
+        except BaseException:
+            if tmp_file.exists():
+                tmp_file.unlink()
+            raise
+
+        return total_rows
+
+    except Exception as e:
+        if progress is not None and progress.cancelled and "cancelled" not in str(e):
+            raise RuntimeError(f"Export cancelled: {progress.cancel_reason}") from e
+        raise
+
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            pass
@@ -58,3 +58,20 @@ def get_oracle_conn(host_cfg):
 
     logger.debug("Oracle connection opened | dsn=%s", host_cfg["dsn"])
     return conn
+
+
+def create_oracle_pool_async(host_cfg, max_size, min_size=1):
+    """
+    asyncio export 용 connection pool (python-oracledb thin mode 전용)
+    """
+    pool = oracledb.create_pool_async(
+        user=host_cfg["user"],
+        password=host_cfg["password"],
+        dsn=host_cfg["dsn"],
+        min=min(min_size, max_size),
+        max=max_size,
+        increment=max(1, min(8, max_size // 4)),
+    )
+
+    logger.debug("Oracle async pool created | dsn=%s max=%d", host_cfg["dsn"], max_size)
+    return pool
@@ -1,8 +1,10 @@
 import csv
-import gzip
 import time
 from pathlib import Path
 from v2.engine.runtime_state import stop_event
+from v2.engine.profiler import profiler
+from util.manifest import open_hashed_text, write_manifest
+from util.schema_registry import columns_from_description
 
 def export_sql_to_csv(
     conn,
@@ -12,6 +14,9 @@ def export_sql_to_csv(
     compression="none",
     fetch_size=10000,
     stall_seconds=1800,
+    on_describe=None,
+    manifest=None,
+    progress=None,
 ):
     """
     fetchmany 기반 고속 CSV export
@@ -19,9 +24,21 @@ def export_sql_to_csv(
     stall_seconds:
       - fetch/execute가 예외 없이 멈추는(hang) 케이스 대응용
       - 가능한 경우 Oracle driver의 call_timeout을 설정해서 stall을 예외로 전환
+
+    on_describe:
+      - execute 직후 cursor.description 전달 (schema registry 기록용)
+
+    manifest:
+      - {"sql_hash", "params"[, "probe"]} 전달 시 commit 후 <file>.manifest.json 기록
+        (row 수 / 컬럼 / 기록 중 계산한 sha256)
+
+    progress:
+      - v2.engine.progress.TaskProgress. fetch 마다 heartbeat 갱신
+      - watchdog 가 stall 감지 시 conn.cancel() → 예외를 cancel 사유로 변환
     """
 
     cursor = conn.cursor()
+    start = time.time()
 
     try:
         # fetch 성능
@@ -45,7 +62,12 @@ def export_sql_to_csv(
             except Exception:
                 pass
 
-        cursor.execute(sql_text)
+        try:
+            with profiler.phase("execute"):
+                cursor.execute(sql_text)
+        except Exception as e:
+            _raise_if_cancelled(progress, e)
+            raise
 
         if cursor.description is None:
             logger.warning("No result set returned, skipping CSV export")
@@ -53,6 +75,12 @@ def export_sql_to_csv(
 
         columns = [col[0] for col in cursor.description]
 
+        if on_describe:
+            on_describe(cursor.description)
+
+        if progress is not None:
+            progress.beat(phase="fetch")
+
         out_file = Path(out_file)
         tmp_file = out_file.with_suffix(out_file.suffix + ".tmp")
         out_file.parent.mkdir(parents=True, exist_ok=True)
@@ -60,28 +88,38 @@ def export_sql_to_csv(
         total_rows = 0
         last_log_ts = time.time()
 
-        try:
-            if compression == "gzip":
-                f = gzip.open(tmp_file, "wt", newline="", encoding="utf-8")
-            else:
-                f = open(tmp_file, "w", newline="", encoding="utf-8")
+        fetch_sec = first_row_sec = writerows_sec = 0.0
 
-            with f:
+        try:
+            with open_hashed_text(tmp_file, compression) as (f, hasher):
                 writer = csv.writer(f)
                 writer.writerow(columns)
 
                 while True:
-                    if stop_event.is_set():
-                        logger.warning("Export interrupted")
-                        break   
+                    # 중단 시 예외 → tmp 삭제 (잘린 파일이 commit 되지 않도록)
+                    if progress is not None:
+                        progress.check()
+                    elif stop_event.is_set():
+                        raise RuntimeError("Export interrupted")
                     # fetchmany block 구간
+                    t0 = time.perf_counter()
                     rows = cursor.fetchmany(fetch_size)
+                    t1 = time.perf_counter()
+                    if total_rows == 0:
+                        first_row_sec = t1 - t0
+                    else:
+                        fetch_sec += t1 - t0
+
                     if not rows:
                         break
 
                     writer.writerows(rows)
+                    writerows_sec += time.perf_counter() - t1
                     total_rows += len(rows)
 
+                    if progress is not None:
+                        progress.beat(len(rows), bytes_written=hasher.size)
+
                     # 진행 로그
                     if total_rows % (fetch_size * 5) == 0:
                         logger.info("CSV progress: %d rows", total_rows)
@@ -93,18 +131,38 @@ def export_sql_to_csv(
                             logger.info("CSV progress: %d rows (heartbeat)", total_rows)
                             last_log_ts = now
 
-            tmp_file.replace(out_file)
+            profiler.add_current("first_row", first_row_sec)
+            profiler.add_current("fetch", fetch_sec)
+            profiler.add_writer_phases(writerows_sec, hasher)
+
+            with profiler.phase("rename"):
+                tmp_file.replace(out_file)
             logger.debug("File committed: %s", out_file)
 
+            if manifest is not None:
+                t0 = time.perf_counter()
+                write_manifest(
+                    out_file,
+                    rows=total_rows,
+                    columns=columns_from_description(cursor.description, oracle=True),
+                    sha256=hasher.sha256,
+                    sql_hash=manifest.get("sql_hash", ""),
+                    params=manifest.get("params"),
+                    probe=manifest.get("probe"),
+                    elapsed_sec=time.time() - start,
+                )
+                profiler.add_current("manifest", time.perf_counter() - t0)
+
             logger.info(
                 "CSV export completed | rows=%d file=%s",
                 total_rows,
                 out_file,
             )
 
-        except Exception:
+        except Exception as e:
             if tmp_file.exists():
                 tmp_file.unlink()
+            _raise_if_cancelled(progress, e)
             raise
 
         return total_rows
@@ -115,3 +173,9 @@ def export_sql_to_csv(
             cursor.close()
         except Exception:
             pass
+
+
+def _raise_if_cancelled(progress, exc):
+    # watchdog cancel (ORA-01013 등) 은 원인이 보이도록 변환
+    if progress is not None and progress.cancelled:
+        raise RuntimeError(f"Export cancelled: {progress.cancel_reason}") from exc
@@ -1,10 +1,14 @@
 # file: v2/adapters/sources/vertica_source.py
 
 import csv
-import gzip
 import time
 from pathlib import Path
 
+from v2.engine.runtime_state import stop_event
+from v2.engine.profiler import profiler
+from util.manifest import open_hashed_text, write_manifest
+from util.schema_registry import columns_from_description
+
 
 def export_sql_to_csv(
     conn,
@@ -13,49 +17,77 @@ def export_sql_to_csv(
     logger,
     compression="none",
     fetch_size=10000,
-    stall_seconds=1800,   # 30분 기본 stall 기준
+    stall_seconds=1800,   # 호환용 (stall 기준은 watchdog 설정 사용)
+    on_describe=None,     # on_describe(cursor.description) : schema registry 기록용
+    manifest=None,        # {"sql_hash", "params"[, "probe"]} : commit 후 <file>.manifest.json 기록
+    progress=None,        # v2.engine.progress.TaskProgress : watchdog 감시 / heartbeat 공유
 ):
+    """
+    stall 감지는 progress 를 감시하는 watchdog thread 가 담당
+    (fetchmany 가 블록된 상태에서도 conn.cancel() 로 깨움)
+    """
+    start = time.time()
     cursor = conn.cursor()
-    cursor.execute(sql_text)
+
+    try:
+        with profiler.phase("execute"):
+            cursor.execute(sql_text)
+    except Exception as e:
+        cursor.close()
+        _raise_if_cancelled(progress, e)
+        raise
 
     if cursor.description is None:
         logger.warning("No result set returned, skipping CSV export")
         cursor.close()
         return 0
 
+    if progress is not None:
+        progress.beat(phase="fetch")
+
     columns = [col[0] for col in cursor.description]
 
+    if on_describe:
+        on_describe(cursor.description)
+
     out_file = Path(out_file)
     tmp_file = out_file.with_suffix(out_file.suffix + ".tmp")
     out_file.parent.mkdir(parents=True, exist_ok=True)
 
     total_rows = 0
-    last_progress = time.time()
     last_heartbeat = time.time()
+    fetch_sec = first_row_sec = writerows_sec = 0.0
 
     try:
-        if compression == "gzip":
-            f = gzip.open(tmp_file, "wt", newline="", encoding="utf-8")
-        else:
-            f = open(tmp_file, "w", newline="", encoding="utf-8")
-
-        with f:
+        with open_hashed_text(tmp_file, compression) as (f, hasher):
             writer = csv.writer(f)
             writer.writerow(columns)
 
             while True:
-                rows = cursor.fetchmany(fetch_size)
+                if progress is not None:
+                    progress.check()
+                elif stop_event.is_set():
+                    raise RuntimeError("Export interrupted")
 
-                now = time.time()
+                t0 = time.perf_counter()
+                rows = cursor.fetchmany(fetch_size)
+                t1 = time.perf_counter()
+                if total_rows == 0:
+                    first_row_sec = t1 - t0
+                else:
+                    fetch_sec += t1 - t0
 
-                # stall 감지
                 if not rows:
                     # 결과 종료
                     break
 
                 writer.writerows(rows)
+                writerows_sec += time.perf_counter() - t1
                 total_rows += len(rows)
-                last_progress = now
+                now = time.time()
+
+                if progress is not None:
+                    progress.beat(len(rows), bytes_written=hasher.size)
 
                 # 기존 progress 로그
                 if total_rows % (fetch_size * 5) == 0:
@@ -67,14 +99,28 @@ def export_sql_to_csv(
                         logger.info("CSV progress: %d rows (heartbeat)", total_rows)
                         last_heartbeat = now
 
-                # stall watchdog
-                if now - last_progress > stall_seconds:
-                    raise RuntimeError(
-                        f"Fetch stalled > {stall_seconds} seconds"
-                    )
+        profiler.add_current("first_row", first_row_sec)
+        profiler.add_current("fetch", fetch_sec)
+        profiler.add_writer_phases(writerows_sec, hasher)
 
-        tmp_file.replace(out_file)
+        with profiler.phase("rename"):
+            tmp_file.replace(out_file)
         logger.debug("File committed: %s", out_file)
+
+        if manifest is not None:
+            t0 = time.perf_counter()
+            write_manifest(
+                out_file,
+                rows=total_rows,
+                columns=columns_from_description(cursor.description),
+                sha256=hasher.sha256,
+                sql_hash=manifest.get("sql_hash", ""),
+                params=manifest.get("params"),
+                probe=manifest.get("probe"),
+                elapsed_sec=time.time() - start,
+            )
+            profiler.add_current("manifest", time.perf_counter() - t0)
+
         cursor.close()
 
         logger.info(
@@ -83,9 +129,20 @@ def export_sql_to_csv(
             out_file,
         )
 
-    except Exception:
+    except Exception as e:
         if tmp_file.exists():
             tmp_file.unlink()
+        try:
+            cursor.close()
+        except Exception:
+            pass
+        _raise_if_cancelled(progress, e)
         raise
 
     return total_rows
+
+
+def _raise_if_cancelled(progress, exc):
+    # watchdog cancel 로 깨어난 driver 예외는 원인이 보이도록 변환
+    if progress is not None and progress.cancelled:
+        raise RuntimeError(f"Export cancelled: {progress.cancel_reason}") from exc
@@ -1,10 +1,14 @@
 # file: v2/adapters/targets/duckdb_target.py
 
+import csv
+import gzip
 import time
 import logging
 from datetime import datetime
 from pathlib import Path
 
+from util.schema_registry import load_table_schema, duckdb_column_types
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,16 +60,229 @@ def _insert_history(con, job_name: str, table_name: str, csv_file: str,
 
 def _table_exists(con, table_name: str) -> bool:
     rows = con.execute(
-        "SELECT 1 FROM information_schema.tables WHERE table_name = ? LIMIT 1",
+        """
+        SELECT 1 FROM information_schema.tables
+         WHERE table_schema = current_schema()
+           AND table_name   = ?
+         LIMIT 1
+        """,
         [table_name],
     ).fetchall()
     return bool(rows)
 
 
+def _ensure_postwork_history(con):
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS _POSTWORK_HISTORY (
+            job_name      VARCHAR,
+            run_id        VARCHAR,
+            sql_file      VARCHAR,
+            sql_hash      VARCHAR,
+            status        VARCHAR,
+            rows          BIGINT,
+            elapsed_sec   DOUBLE,
+            error_message VARCHAR,
+            input_sig     VARCHAR,
+            finished_at   VARCHAR
+        )
+        """
+    )
+
+
+def _insert_postwork_history(con, job_name: str, run_id: str, sql_file: str,
+                             sql_hash: str, status: str, rows, elapsed_sec: float,
+                             error_message: str = "", input_sig: str = ""):
+    con.execute(
+        """
+        INSERT INTO _POSTWORK_HISTORY
+            (job_name, run_id, sql_file, sql_hash, status, rows,
+             elapsed_sec, error_message, input_sig, finished_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [job_name, run_id, sql_file, sql_hash, status, rows,
+         elapsed_sec, error_message, input_sig, _now_str()],
+    )
+
+
+def _last_postwork_success(con, job_name: str, sql_file: str):
+    """
+    마지막 성공 이력 (sql_hash, input_sig, run_id, finished_at) 또는 None
+    """
+    return con.execute(
+        """
+        SELECT sql_hash, input_sig, run_id, finished_at
+          FROM _POSTWORK_HISTORY
+         WHERE job_name = ?
+           AND sql_file = ?
+           AND status   = 'OK'
+         ORDER BY finished_at DESC
+         LIMIT 1
+        """,
+        [job_name, sql_file],
+    ).fetchone()
+
+
+def _load_versions(con) -> dict:
+    """
+    _LOAD_HISTORY 기준 테이블별 적재 버전
+    반환: {table_name(lower): version 문자열}
+    적재 이력이 한 건이라도 추가되면 버전이 바뀜
+    """
+    if not _table_exists(con, "_LOAD_HISTORY"):
+        return {}
+
+    rows = con.execute(
+        """
+        SELECT lower(table_name),
+               md5(string_agg(coalesce(file_hash, '') || '@' || coalesce(loaded_at, ''), ','
+                              ORDER BY loaded_at, file_hash))
+          FROM _LOAD_HISTORY
+         GROUP BY lower(table_name)
+        """
+    ).fetchall()
+    return {t: v for t, v in rows}
+
+
+def _existing_tables(con) -> set:
+    rows = con.execute(
+        "SELECT lower(table_name) FROM information_schema.tables"
+    ).fetchall()
+    return {r[0] for r in rows}
+
+
+def _ensure_report_history(con):
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS _REPORT_HISTORY (
+            job_name      VARCHAR,
+            run_id        VARCHAR,
+            report_name   VARCHAR,
+            out_file      VARCHAR,
+            sql_hash      VARCHAR,
+            input_sig     VARCHAR,
+            status        VARCHAR,
+            rows          BIGINT,
+            elapsed_sec   DOUBLE,
+            error_message VARCHAR,
+            finished_at   VARCHAR
+        )
+        """
+    )
+
+
+def _insert_report_history(con, job_name: str, run_id: str, report_name: str,
+                           out_file: str, sql_hash: str, input_sig: str, status: str,
+                           rows, elapsed_sec: float, error_message: str = ""):
+    con.execute(
+        """
+        INSERT INTO _REPORT_HISTORY
+            (job_name, run_id, report_name, out_file, sql_hash, input_sig,
+             status, rows, elapsed_sec, error_message, finished_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [job_name, run_id, report_name, out_file, sql_hash, input_sig,
+         status, rows, elapsed_sec, error_message, _now_str()],
+    )
+
+
+def _last_report_success(con, job_name: str, report_name: str):
+    """
+    마지막 성공 이력 (sql_hash, input_sig, out_file, rows) 또는 None
+    """
+    return con.execute(
+        """
+        SELECT sql_hash, input_sig, out_file, rows
+          FROM _REPORT_HISTORY
+         WHERE job_name    = ?
+           AND report_name = ?
+           AND status      = 'OK'
+         ORDER BY finished_at DESC
+         LIMIT 1
+        """,
+        [job_name, report_name],
+    ).fetchone()
+
+
+
+def _table_columns(con, table_name: str) -> dict:
+    rows = con.execute(
+        """
+        SELECT column_name, data_type
+          FROM information_schema.columns
+         WHERE table_schema = current_schema()
+           AND table_name   = ?
+         ORDER BY ordinal_position
+        """,
+        [table_name],
+    ).fetchall()
+    return {c.upper(): t for c, t in rows}
+
+
+def _csv_header(csv_path: Path) -> list:
+    open_fn = gzip.open if csv_path.name.endswith(".gz") else open
+    with open_fn(csv_path, "rt", newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def _read_csv_expr(csv_path: Path, col_types: dict):
+    """
+    반환: (FROM 절 표현식, bind 파라미터)
+    col_types 가 있으면 header 순서대로 columns 명시 → sniffing 없음, 월별 타입 동일
+    """
+    if not col_types:
+        return "read_csv_auto(?, header=True)", [str(csv_path)]
+
+    header = _csv_header(csv_path)
+    unknown = [h for h in header if h.upper() not in col_types]
+    if unknown:
+        logger.warning("LOAD unknown columns (VARCHAR) | %s | %s", csv_path.name, unknown)
+
+    cols = ", ".join(
+        "'{}': '{}'".format(h.replace("'", "''"), col_types.get(h.upper(), "VARCHAR"))
+        for h in header
+    )
+    expr = (
+        "read_csv(?, header=true, delim=',', quote='\"', escape='\"', "
+        f"auto_detect=false, columns={{{cols}}})"
+    )
+    return expr, [str(csv_path)]
+
+
+def _resolve_keys(key_cols: list, header: list, csv_path: Path) -> list:
+    """
+    merge key / partition 컬럼 → CSV header 의 실제 컬럼명 (대소문자 무시)
+    """
+    by_upper = {h.upper(): h for h in header}
+    missing = [k for k in key_cols if k.upper() not in by_upper]
+    if missing:
+        raise ValueError(f"merge column not in {csv_path.name}: {missing}")
+    return [by_upper[k.upper()] for k in key_cols]
+
+
+def _delete_matching(con, table_name: str, source: str, binds: list, cols: list) -> int:
+    """
+    source(CSV) 에 있는 cols 값 조합의 기존 row 삭제 (cols = [] 이면 테이블 전체)
+    """
+    if not cols:
+        return con.execute(f'DELETE FROM "{table_name}"').fetchone()[0]
+    col_list = ", ".join(f'"{k}"' for k in cols)
+    cond = " AND ".join(f't."{k}" = d."{k}"' for k in cols)
+    return con.execute(
+        f'DELETE FROM "{table_name}" t USING (SELECT DISTINCT {col_list} FROM {source}) d '
+        f"WHERE {cond}",
+        binds,
+    ).fetchone()[0]
+
+
 def load_csv(con, job_name: str, table_name: str, csv_path: Path,
-             file_hash: str, mode: str) -> int:
+             file_hash: str, mode: str, key_cols: list | None = None,
+             replace_cols: list | None = None) -> int:
     """
     CSV를 DuckDB 테이블에 적재.
+    컬럼 타입: 기존 테이블 → schema registry(job_name/table) → read_csv_auto 순
+    key_cols: 지정 시 같은 key 의 기존 row 삭제 후 적재 (incremental delta merge, 1 transaction)
+    replace_cols: 지정 시 CSV 의 해당 컬럼 값 범위를 교체 ([] 이면 테이블 전체, incremental full 재적재)
     반환값: 적재된 row 수
     """
     file_size = csv_path.stat().st_size
@@ -77,23 +294,48 @@ def load_csv(con, job_name: str, table_name: str, csv_path: Path,
 
     start = time.time()
 
-    if not _table_exists(con, table_name):
-        con.execute(
-            f'CREATE TABLE "{table_name}" AS SELECT * FROM read_csv_auto(?, header=True)',
-            [str(csv_path)],
-        )
-    else:
-        con.execute(
-            f'INSERT INTO "{table_name}" SELECT * FROM read_csv_auto(?, header=True)',
-            [str(csv_path)],
-        )
+    exists = _table_exists(con, table_name)
+    col_types = _table_columns(con, table_name) if exists else {}
+    if not col_types:
+        col_types = duckdb_column_types(load_table_schema(job_name, table_name))
 
-    row_count = con.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+    source, binds = _read_csv_expr(csv_path, col_types)
 
-    _insert_history(con, job_name, table_name, str(csv_path), file_hash, file_size, mtime)
+    if not exists:
+        row_count = con.execute(
+            f'CREATE TABLE "{table_name}" AS SELECT * FROM {source}', binds,
+        ).fetchone()[0]
+        _insert_history(con, job_name, table_name, str(csv_path), file_hash, file_size, mtime)
+    elif key_cols or replace_cols is not None:
+        cols = _resolve_keys(key_cols or replace_cols, _csv_header(csv_path), csv_path)
+
+        con.execute("BEGIN TRANSACTION")
+        try:
+            deleted = _delete_matching(con, table_name, source, binds, cols)
+            row_count = con.execute(
+                f'INSERT INTO "{table_name}" BY NAME SELECT * FROM {source}', binds,
+            ).fetchone()[0]
+            _insert_history(con, job_name, table_name, str(csv_path), file_hash, file_size, mtime)
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        if key_cols:
+            logger.info("LOAD merge | table=%s key=%s replaced=%d", table_name, cols, deleted)
+        else:
+            logger.info("LOAD replace | table=%s partition=%s deleted=%d",
+                        table_name, cols or "(all)", deleted)
+    else:
+        row_count = con.execute(
+            f'INSERT INTO "{table_name}" BY NAME SELECT * FROM {source}', binds,
+        ).fetchone()[0]
+        _insert_history(con, job_name, table_name, str(csv_path), file_hash, file_size, mtime)
 
     elapsed = time.time() - start
-    logger.info("LOAD done | table=%s rows=%d elapsed=%.2fs", table_name, row_count, elapsed)
+    logger.info(
+        "LOAD done | table=%s rows=%d typed=%s elapsed=%.2fs",
+        table_name, row_count, bool(col_types), elapsed,
+    )
 
     return row_count
 
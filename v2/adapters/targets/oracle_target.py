@@ -4,9 +4,12 @@ import csv
 import gzip
 import time
 import logging
-from datetime import datetime
+from datetime import datetime, date
+from decimal import Decimal
 from pathlib import Path
 
+from util.schema_registry import load_table_schema, column_types
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,10 +63,135 @@ def _insert_history(cur, conn, job_name: str, table_name: str, csv_file: str,
     conn.commit()
 
 
+# ----------------------------------------
+# schema registry 기반 typed bind
+# ----------------------------------------
+def _to_bool(v: str) -> int:
+    # Oracle(23 이전) SQL 에는 BOOLEAN 이 없으므로 1/0 NUMBER 로 bind
+    return int(v.strip().lower() in ("1", "true", "t", "y"))
+
+
+_CONVERTERS = {
+    "int64": int,
+    "float64": float,
+    "bool": _to_bool,
+    "timestamp": datetime.fromisoformat,
+    "date": date.fromisoformat,
+}
+
+
+def _typed_columns(job_name: str, table_name: str, headers: list) -> list | None:
+    """
+    registry 에 등록된 테이블이면 컬럼별 [name, type, converter, bind type] 반환
+    CSV 값(str)을 python 타입으로 변환해 bind → 배치마다 bind 타입이 바뀌지 않음
+    """
+    types = column_types(load_table_schema(job_name, table_name))
+    if not types:
+        return None
+
+    import oracledb
+
+    unknown = [h for h in headers if h.upper() not in types]
+    if unknown:
+        logger.warning("LOAD schema registry unknown columns | %s | %s", table_name, unknown)
+
+    typed = []
+    for h in headers:
+        t = types.get(h.upper(), "string")
+
+        if t.startswith("decimal("):
+            conv, bind = Decimal, oracledb.DB_TYPE_NUMBER
+        elif t in ("int64", "float64"):
+            conv, bind = _CONVERTERS[t], oracledb.DB_TYPE_NUMBER
+        elif t == "timestamp":
+            conv, bind = _CONVERTERS[t], oracledb.DB_TYPE_TIMESTAMP
+        elif t == "date":
+            conv, bind = _CONVERTERS[t], oracledb.DB_TYPE_DATE
+        elif t == "bool":
+            conv, bind = _CONVERTERS[t], oracledb.DB_TYPE_NUMBER
+        else:
+            conv, bind = None, None
+
+        typed.append([h, t, conv, bind])
+
+    return typed
+
+
+def _convert_batch(batch: list, typed: list, table_name: str) -> list:
+    """
+    컬럼 단위 변환. 변환 실패 컬럼은 type drift 로 경고 후 이후 string bind 로 전환
+    (적재 도중 실패시키지 않음)
+    """
+    cols = [list(c) for c in zip(*batch)]
+
+    for i, col in enumerate(cols):
+        name, t, conv, _ = typed[i]
+        if conv is None:
+            continue
+        try:
+            cols[i] = [None if v == "" else conv(v) for v in col]
+        except (ValueError, ArithmeticError) as e:
+            logger.warning(
+                "LOAD TYPE DRIFT | %s.%s | registry=%s | %s -> string bind",
+                table_name, name, t, e,
+            )
+            typed[i][2] = None
+            typed[i][3] = None
+
+    return list(zip(*cols))
+
+
+def _executemany(cur, insert_sql: str, batch: list, typed: list | None, table_name: str):
+    if typed is None:
+        cur.executemany(insert_sql, batch)
+        return
+
+    rows = _convert_batch(batch, typed, table_name)
+    cur.setinputsizes(*[t[3] for t in typed])
+    cur.executemany(insert_sql, rows)
+
+
+def _delete_matching(cur, job_name: str, table_name: str, csv_path: Path, cols: list) -> int:
+    """
+    CSV 에 있는 cols 값 조합의 기존 row 삭제 (commit 은 적재 / history 와 함께)
+      cols = []            : 테이블 전체 (DELETE 1회, TRUNCATE 는 rollback 불가라 사용 안 함)
+      delta key / partition: 값 조합별 DELETE (delta 는 작고 partition 값은 몇 개뿐)
+    """
+    if not cols:
+        cur.execute(f"DELETE FROM {table_name}")
+        return cur.rowcount
+
+    open_fn = gzip.open if str(csv_path).endswith(".gz") else open
+    with open_fn(csv_path, "rt", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        headers = next(reader)
+        by_upper = {h.upper(): i for i, h in enumerate(headers)}
+        missing = [k for k in cols if k.upper() not in by_upper]
+        if missing:
+            raise ValueError(f"merge column not in {csv_path.name}: {missing}")
+        idx = [by_upper[k.upper()] for k in cols]
+        values = {tuple(row[i] for i in idx) for row in reader}
+
+    typed = _typed_columns(job_name, table_name, [headers[i] for i in idx])
+    cond = " AND ".join(f"{headers[i]} = :{j + 1}" for j, i in enumerate(idx))
+    delete_sql = f"DELETE FROM {table_name} WHERE {cond}"
+
+    deleted = 0
+    batch = list(values)
+    for start in range(0, len(batch), 1000):
+        chunk = batch[start:start + 1000]
+        _executemany(cur, delete_sql, chunk, typed, table_name)
+        deleted += cur.rowcount
+    return deleted
+
+
 def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
-             file_hash: str, mode: str) -> int:
+             file_hash: str, mode: str, key_cols: list | None = None,
+             replace_cols: list | None = None) -> int:
     """
     CSV를 Oracle 테이블에 적재.
+    key_cols: 지정 시 같은 key 의 기존 row 삭제 후 적재 (incremental delta merge, 1 transaction)
+    replace_cols: 지정 시 CSV 의 해당 컬럼 값 범위를 교체 ([] 이면 테이블 전체, incremental full 재적재)
     반환값: 적재된 row 수 (-1이면 skip)
     """
     cur = conn.cursor()
@@ -79,6 +207,14 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
 
         start = time.time()
 
+        if key_cols:
+            deleted = _delete_matching(cur, job_name, table_name, csv_path, key_cols)
+            logger.info("LOAD merge | table=%s key=%s replaced=%d", table_name, key_cols, deleted)
+        elif replace_cols is not None:
+            deleted = _delete_matching(cur, job_name, table_name, csv_path, replace_cols)
+            logger.info("LOAD replace | table=%s partition=%s deleted=%d",
+                        table_name, replace_cols or "(all)", deleted)
+
         total_rows = 0
         open_fn = gzip.open if str(csv_path).endswith(".gz") else open
         with open_fn(csv_path, "rt", encoding="utf-8") as f:
@@ -88,6 +224,8 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
             placeholders = ",".join([f":{j + 1}" for j in range(len(headers))])
             insert_sql = f"INSERT INTO {table_name} VALUES ({placeholders})"
 
+            typed = _typed_columns(job_name, table_name, headers)
+
             batch = []
             batch_size = 1000
 
@@ -95,11 +233,11 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
                 batch.append(row)
                 total_rows += 1
                 if len(batch) >= batch_size:
-                    cur.executemany(insert_sql, batch)
+                    _executemany(cur, insert_sql, batch, typed, table_name)
                     batch.clear()
 
             if batch:
-                cur.executemany(insert_sql, batch)
+                _executemany(cur, insert_sql, batch, typed, table_name)
 
         _insert_history(cur, conn, job_name, table_name, str(csv_path),
                         file_hash, file_size, mtime)
@@ -109,6 +247,11 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
 
         return total_rows
 
+    except Exception:
+        # 삭제(merge) / 일부 insert 가 다음 파일의 commit 에 섞이지 않도록
+        conn.rollback()
+        raise
+
     finally:
         cur.close()
 
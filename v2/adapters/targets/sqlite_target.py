@@ -58,10 +58,19 @@ def _insert_history(con, job_name: str, table_name: str, csv_file: str,
     con.commit()
 
 
+def _table_exists(con, table_name: str) -> bool:
+    cur = con.cursor()
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+    return cur.fetchone() is not None
+
+
 def load_csv(con, job_name: str, table_name: str, csv_path: Path,
-             file_hash: str, mode: str) -> int:
+             file_hash: str, mode: str, key_cols: list | None = None,
+             replace_cols: list | None = None) -> int:
     """
     CSV를 SQLite 테이블에 적재.
+    key_cols: 지정 시 같은 key 의 기존 row 삭제 후 적재 (incremental delta merge)
+    replace_cols: 지정 시 CSV 의 해당 컬럼 값 범위를 교체 ([] 이면 테이블 전체, incremental full 재적재)
     반환값: 적재된 row 수 (-1이면 skip)
     """
     import pandas as pd
@@ -76,9 +85,35 @@ def load_csv(con, job_name: str, table_name: str, csv_path: Path,
     start = time.time()
 
     df = pd.read_csv(csv_path)
+
+    if (key_cols or replace_cols is not None) and _table_exists(con, table_name):
+        # delete + append 를 1 transaction 으로 (history commit 시점에 함께 반영)
+        cur = con.cursor()
+        if key_cols or replace_cols:
+            want = key_cols or replace_cols
+            by_upper = {c.upper(): c for c in df.columns}
+            missing = [k for k in want if k.upper() not in by_upper]
+            if missing:
+                raise ValueError(f"merge column not in {csv_path.name}: {missing}")
+            cols = [by_upper[k.upper()] for k in want]
+
+            values = df[cols].drop_duplicates()
+            values = values.astype(object).where(values.notna(), None)
+            cond = " AND ".join(f'"{k}" = ?' for k in cols)
+            cur.executemany(f'DELETE FROM "{table_name}" WHERE {cond}', values.values.tolist())
+        else:
+            cols = []
+            cur.execute(f'DELETE FROM "{table_name}"')
+
+        if key_cols:
+            logger.info("LOAD merge | table=%s key=%s replaced=%d", table_name, cols, cur.rowcount)
+        else:
+            logger.info("LOAD replace | table=%s partition=%s deleted=%d",
+                        table_name, cols or "(all)", cur.rowcount)
+
     df.to_sql(table_name, con, if_exists="append", index=False)
 
-    row_count = con.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+    row_count = len(df)
 
     _insert_history(con, job_name, table_name, str(csv_path), file_hash, file_size, mtime)
 
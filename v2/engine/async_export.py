@@ -0,0 +1,233 @@
+# file: v2/engine/async_export.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from v2.adapters.sources.oracle_client import create_oracle_pool_async
+from v2.adapters.sources.oracle_async_source import export_sql_to_csv_async
+from v2.engine.runtime_state import stop_event
+from v2.engine.progress import progress_registry
+from v2.engine.metrics import metrics
+from v2.stages.export_stage import (
+    ExportTask, build_log_prefix, prepare_export_targets, finish_export_copies,
+    make_schema_recorder, task_probe_sql, skip_if_probe_unchanged, task_incremental,
+)
+from util.sql_hash import compute_sql_hash
+from util.source_probe import run_probe_async
+
+# =========================================================
+# export.executor: async
+#   ExportTask      → oracledb async pool 에서 execute / fetch 대기 (host 별 semaphore)
+#   encode / 파일   → encode executor (thread)
+#   그 외 (fused / incremental) → 기존 thread runner 로 fallback
+# =========================================================
+
+
+def async_supported(opts) -> str | None:
+    """
+    async 실행 불가 사유 (가능하면 None)
+    """
+    if opts.source_type != "oracle":
+        return f"source type {opts.source_type} has no async driver"
+
+    oracle_cfg = opts.env_cfg.get("sources", {}).get("oracle", {})
+    if oracle_cfg.get("thick", {}).get("instant_client"):
+        return "python-oracledb async requires thin mode (thick.instant_client configured)"
+
+    return None
+
+
+def run_async_exports(units, total: int, opts, logger, async_cfg: dict, sync_runner,
+                      on_done=None) -> int:
+    """
+    units 를 event loop 1개에서 실행. 반환: 시작한 task 수
+    sync_runner: make_task_runner() 결과 (fused task 등 fallback 용)
+    on_done(idx): task 종료마다 호출, 대기 중에는 1초마다 on_done(None) (ETA 갱신용)
+    """
+    return asyncio.run(_run(units, total, opts, logger, async_cfg, sync_runner, on_done))
+
+
+async def _run(units, total, opts, logger, async_cfg, sync_runner, on_done=None) -> int:
+    loop = asyncio.get_running_loop()
+
+    concurrency = int(async_cfg.get("concurrency", 32))
+    host_limits = async_cfg.get("hosts") or {}
+    encode_workers = int(async_cfg.get("encode_workers", 4))
+    fallback_workers = int(async_cfg.get("fallback_workers", 2))
+    max_inflight = int(async_cfg.get("max_inflight") or concurrency * 2)
+
+    encode_pool = ThreadPoolExecutor(encode_workers, thread_name_prefix="export-encode")
+    fallback_pool = ThreadPoolExecutor(fallback_workers, thread_name_prefix="export-sync")
+
+    oracle_cfg = opts.env_cfg["sources"]["oracle"]
+    pools = {}
+    semaphores = {}
+
+    def _host(host):
+        # host 별 pool + semaphore (pool 크기 = 동시 실행 상한)
+        if host not in pools:
+            host_cfg = oracle_cfg["hosts"].get(host)
+            if not host_cfg:
+                raise RuntimeError(f"Oracle host not found: {host}")
+            limit = int(host_limits.get(host, concurrency))
+            pools[host] = create_oracle_pool_async(host_cfg, limit)
+            semaphores[host] = asyncio.Semaphore(limit)
+            logger.info("Async pool opened | host=%s concurrency=%d", host, limit)
+        return pools[host], semaphores[host]
+
+    async def _export_async(task, idx):
+        prefix = build_log_prefix(task.sql_file, task.params)
+        progress = None
+        csv_name = task.out_file.name
+
+        try:
+            pool, sem = _host(opts.host_name)
+
+            fingerprint = None
+            probe_sql = task_probe_sql(opts, task)
+            if probe_sql:
+                async with sem:
+                    conn = await pool.acquire()
+                    try:
+                        fingerprint = await run_probe_async(conn, probe_sql)
+                        await pool.release(conn)
+                    except Exception as e:
+                        await pool.drop(conn)
+                        logger.warning("%s probe failed (export as usual): %s", prefix, e)
+                if fingerprint and skip_if_probe_unchanged(task, fingerprint, logger, prefix):
+                    return
+
+            need = await loop.run_in_executor(encode_pool, prepare_export_targets,
+                                              task, opts, logger, prefix, bool(fingerprint))
+            if not need:
+                return
+
+            async with sem:
+                if stop_event.is_set():
+                    logger.warning("%s Export interrupted before start", prefix)
+                    return
+
+                conn = await pool.acquire()
+                metrics.inc_gauge("active_connections", 1)
+                broken = False
+
+                try:
+                    logger.info(
+                        "%s EXPORT start [%d/%d] (async)%s",
+                        prefix, idx, total,
+                        f" (+{len(task.copies)} dedup)" if task.copies else "",
+                    )
+                    start_time = time.time()
+
+                    # conn=None: AsyncConnection 은 다른 thread 에서 cancel / close 불가
+                    #   → stop / stall 은 export_sql_to_csv_async 의 await 감시에서 처리
+                    progress = progress_registry.start(csv_name, None)
+
+                    rows = await export_sql_to_csv_async(
+                        conn=conn,
+                        sql_text=task.rendered_sql,
+                        out_file=task.out_file,
+                        logger=logger,
+                        compression=opts.compression,
+                        fetch_size=int(async_cfg.get("fetch_size", 10000)),
+                        stall_seconds=opts.stall_seconds,
+                        on_describe=make_schema_recorder(opts, task.sql_file, prefix, logger),
+                        manifest={"sql_hash": compute_sql_hash(task.rendered_sql), "params": task.params,
+                                  "probe": fingerprint},
+                        progress=progress,
+                        executor=encode_pool,
+                        profile_key=("export", csv_name),
+                    )
+                    progress_registry.finish(csv_name, "done")
+
+                except BaseException:
+                    broken = True
+                    raise
+
+                finally:
+                    metrics.inc_gauge("active_connections", -1)
+                    # 중단된 fetch 가 남은 connection 은 pool 로 돌려보내지 않음
+                    if broken:
+                        await pool.drop(conn)
+                    else:
+                        await pool.release(conn)
+
+            await loop.run_in_executor(encode_pool, finish_export_copies, task, logger, prefix)
+
+            size_mb = task.out_file.stat().st_size / (1024 * 1024) if task.out_file.exists() else 0
+            logger.info(
+                "%s EXPORT done rows=%d size=%.2fMB elapsed=%.2fs",
+                prefix, rows or 0, size_mb, time.time() - start_time,
+            )
+
+        except Exception as e:
+            if progress is not None:
+                progress_registry.finish(progress.key, "failed")
+                if progress.cancelled:
+                    logger.error("%s EXPORT failed: %s", prefix, e)
+                    return
+            logger.exception("%s EXPORT failed: %s", prefix, e)
+
+    async def _one(task, idx):
+        try:
+            if not isinstance(task, ExportTask) or task_incremental(opts, task) is not None:
+                # fused / incremental task 는 기존 thread runner 로 실행 (gauge 는 runner 가 감소)
+                await loop.run_in_executor(fallback_pool, sync_runner, task, idx, total)
+                return
+
+            metrics.inc_gauge("export_queue_depth", -1)
+            if stop_event.is_set():
+                logger.warning("Export interrupted before start")
+                return
+            await _export_async(task, idx)
+        finally:
+            if on_done is not None:
+                on_done(idx)
+
+    window = asyncio.Semaphore(max_inflight)
+    pending = set()
+    started = 0
+
+    def _done(t):
+        pending.discard(t)
+        window.release()
+        if not t.cancelled():
+            t.exception()       # 예외는 task 안에서 로그 처리됨 (미조회 경고 방지)
+
+    logger.info(
+        "Async engine | concurrency=%d window=%d encode_workers=%d",
+        concurrency, max_inflight, encode_workers,
+    )
+
+    try:
+        _host(opts.host_name)
+
+        for idx, task in enumerate(units, 1):
+            await window.acquire()
+            if stop_event.is_set():
+                window.release()
+                logger.warning("EXPORT cancelled | running=%d", len(pending))
+                break
+
+            started = idx
+            t = asyncio.create_task(_one(task, idx))
+            pending.add(t)
+            t.add_done_callback(_done)
+
+        # 진행 중 task 는 stop 시 블록된 await 취소 / fetch loop 의 progress.check() 에서 종료
+        while pending:
+            await asyncio.wait(set(pending), timeout=1)
+            if on_done is not None:
+                on_done(None)
+
+    finally:
+        for pool in pools.values():
+            try:
+                await pool.close(force=True)
+            except Exception as e:
+                logger.warning("Async pool close failed: %s", e)
+        encode_pool.shutdown(wait=True)
+        fallback_pool.shutdown(wait=True)
+
+    return started
@@ -0,0 +1,211 @@
+# file: v2/engine/estimators.py
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+# =========================================================
+# Optimizer 예상치 (preflight)
+#   oracle  : EXPLAIN PLAN → PLAN_TABLE id=0 의 CARDINALITY / COST / BYTES
+#   vertica : EXPLAIN 텍스트의 첫 [Cost: .., Rows: ..]
+#   duckdb  : EXPLAIN 의 root operator ~N rows (테스트용 stand-in source)
+# estimator(conn, sql) → {"rows", "cost", "bytes"} (모르는 값은 None)
+# 결과는 렌더링 SQL hash 기준으로 cache 파일에 보관
+# =========================================================
+
+
+def _num(text: str | None) -> float | None:
+    """
+    '1,234' / '1.5K' / '80M' → 숫자
+    """
+    if not text:
+        return None
+    s = text.replace(",", "").strip().upper()
+    mult = {"K": 1e3, "M": 1e6, "B": 1e9, "G": 1e9, "T": 1e12}.get(s[-1:], 1)
+    if mult != 1:
+        s = s[:-1]
+    try:
+        return float(s) * mult
+    except ValueError:
+        return None
+
+
+def _int_or_none(v):
+    return int(v) if v is not None else None
+
+
+# ---------------------------
+# Estimators
+# ---------------------------
+def explain_oracle(conn, sql: str) -> dict:
+    """
+    PLAN_TABLE 기록은 transaction 안에서만 사용하고 rollback 으로 정리
+    """
+    cur = conn.cursor()
+    stmt_id = f"BR{threading.get_ident() % 10**12}"
+    try:
+        cur.execute(f"EXPLAIN PLAN SET STATEMENT_ID = '{stmt_id}' FOR {sql}")
+        cur.execute(
+            "SELECT cardinality, cost, bytes FROM plan_table "
+            "WHERE statement_id = :sid AND id = 0",
+            sid=stmt_id,
+        )
+        row = cur.fetchone()
+    finally:
+        try:
+            conn.rollback()
+        finally:
+            cur.close()
+
+    if not row:
+        return {"rows": None, "cost": None, "bytes": None}
+    return {"rows": _int_or_none(row[0]), "cost": row[1], "bytes": _int_or_none(row[2])}
+
+
+_VERTICA_COST = re.compile(r"\[Cost:\s*([\d.,]+[KMGTB]?)\s*,\s*Rows:\s*([\d.,]+[KMGTB]?)", re.IGNORECASE)
+
+
+def explain_vertica(conn, sql: str) -> dict:
+    cur = conn.cursor()
+    try:
+        cur.execute(f"EXPLAIN {sql}")
+        text = "\n".join(str(r[0]) for r in cur.fetchall())
+    finally:
+        cur.close()
+
+    m = _VERTICA_COST.search(text)
+    if not m:
+        return {"rows": None, "cost": None, "bytes": None}
+    return {"rows": _int_or_none(_num(m.group(2))), "cost": _num(m.group(1)), "bytes": None}
+
+
+_DUCKDB_ROWS = re.compile(r"(?:~\s*([\d,]+)\s+rows|EC:\s*([\d,]+))", re.IGNORECASE)
+
+
+def explain_duckdb(conn, sql: str) -> dict:
+    # physical_plan 은 root operator 부터 출력 → 첫 예상치 = 최종 결과 row 수
+    # ORDER BY / PROJECTION 등 root 가 ~0 rows 로 나오는 경우가 있어 0 이 아닌 첫 예상치 사용
+    text = "\n".join(str(r[-1]) for r in conn.execute(f"EXPLAIN {sql}").fetchall())
+    rows = next(
+        (n for n in (_num(m.group(1) or m.group(2)) for m in _DUCKDB_ROWS.finditer(text)) if n),
+        None,
+    )
+    return {"rows": _int_or_none(rows), "cost": None, "bytes": None}
+
+
+ESTIMATOR_REGISTRY = {
+    "oracle": explain_oracle,
+    "vertica": explain_vertica,
+    "duckdb": explain_duckdb,
+}
+
+
+def register_estimator(name: str, func):
+    """
+    estimator 추가 / 교체: func(conn, sql) -> {"rows", "cost", "bytes"}
+    """
+    ESTIMATOR_REGISTRY[name] = func
+
+
+def get_estimator(name: str):
+    func = ESTIMATOR_REGISTRY.get(name)
+    if func is None:
+        raise ValueError(f"Unknown estimator: {name} (available: {sorted(ESTIMATOR_REGISTRY)})")
+    return func
+
+
+# ---------------------------
+# Cache (sql_hash → estimate)
+# ---------------------------
+class EstimateCache:
+    """
+    JSON 파일 1개. key = 렌더링 SQL hash (manifest 의 sql_hash 와 같은 값)
+    """
+
+    def __init__(self, path: Path, ttl_hours: float = 24):
+        self.path = Path(path)
+        self.ttl_sec = float(ttl_hours) * 3600
+        self._lock = threading.Lock()
+        self._data = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+
+    def get(self, sql_hash: str, estimator: str | None = None, fresh: bool = True) -> dict | None:
+        with self._lock:
+            e = self._data.get(sql_hash)
+        if e is None:
+            return None
+        if estimator and e.get("estimator") != estimator:
+            return None
+        if fresh and time.time() - e.get("at", 0) > self.ttl_sec:
+            return None
+        return e
+
+    def put(self, sql_hash: str, entry: dict):
+        with self._lock:
+            self._data[sql_hash] = dict(entry, at=time.time())
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with self._lock:
+            data = dict(self._data)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp.replace(self.path)
+
+
+def estimate_cache_path(ctx_out_dir: Path, cfg: dict) -> Path:
+    """
+    preflight.cache_file 미지정 시 export 폴더의 _estimates.json
+    """
+    return Path(cfg["cache_file"]) if cfg.get("cache_file") else ctx_out_dir / "_estimates.json"
+
+
+# ---------------------------
+# ETA
+# ---------------------------
+class EtaTracker:
+    """
+    예상 row 수 가중 진행률 → 남은 시간 (경과 시간 x 남은 weight / 끝난 weight)
+    """
+
+    def __init__(self, total_weight: float, log_interval: float = 30):
+        self.total = float(total_weight)
+        self.done_weight = 0.0
+        self.done_count = 0
+        self.started = time.time()
+        self.log_interval = log_interval
+        self._last_log = self.started
+        self._lock = threading.Lock()
+
+    def done(self, weight: float):
+        with self._lock:
+            self.done_weight += weight or 0
+            self.done_count += 1
+
+    def eta_sec(self) -> float | None:
+        with self._lock:
+            if self.done_weight <= 0 or self.total <= 0:
+                return None
+            remaining = max(self.total - self.done_weight, 0)
+            return (time.time() - self.started) * remaining / self.done_weight
+
+    def maybe_log(self, logger, total_tasks: int, force: bool = False):
+        now = time.time()
+        if not force and now - self._last_log < self.log_interval:
+            return
+        self._last_log = now
+        eta = self.eta_sec()
+        pct = 100.0 * self.done_weight / self.total if self.total else 0.0
+        logger.info(
+            "EXPORT progress | tasks=%d/%d | est_rows %.1f%% | ETA %s",
+            self.done_count, total_tasks, pct,
+            f"{eta:.0f}s" if eta is not None else "unknown",
+        )
@@ -0,0 +1,288 @@
+# file: v2/engine/metrics.py
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from v2.engine.progress import progress_registry
+
+logger = logging.getLogger(__name__)
+
+
+# _*_HISTORY status → metrics task status
+HISTORY_STATUS = {"OK": "done", "FAIL": "failed", "SKIP": "skipped"}
+
+
+def _now_str() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# ---------------------------
+# Metrics registry
+# ---------------------------
+class MetricsRegistry:
+    """
+    프로세스 내 실행 지표 저장소 (stage 타이밍 / 완료 task / gauge)
+    진행 중 export task 는 progress_registry 에서 실시간으로 합쳐서 보여줌
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self, job_name: str = "", run_id: str = ""):
+        with self._lock:
+            self.job_name = job_name
+            self.run_id = run_id
+            self.started_at = time.time()
+            self._stages: dict[str, dict] = {}
+            self._tasks: dict[tuple, dict] = {}
+            self._gauges: dict[str, float] = {}
+
+    # ---- stage ----
+    def stage_start(self, stage: str):
+        with self._lock:
+            self._stages[stage] = {
+                "status": "running",
+                "started_at": time.time(),
+                "elapsed_sec": None,
+            }
+
+    def stage_end(self, stage: str, status: str = "done"):
+        with self._lock:
+            st = self._stages.setdefault(stage, {"started_at": time.time()})
+            st["status"] = status
+            st["elapsed_sec"] = round(time.time() - st["started_at"], 2)
+
+    # ---- task ----
+    def task_start(self, stage: str, key: str):
+        with self._lock:
+            self._tasks[(stage, key)] = {
+                "stage": stage,
+                "key": key,
+                "status": "running",
+                "rows": 0,
+                "bytes": 0,
+                "started_at": time.time(),
+                "elapsed_sec": None,
+            }
+
+    def task_end(self, stage: str, key: str, status: str, rows: int = 0,
+                 nbytes: int = 0, elapsed: float | None = None):
+        with self._lock:
+            t = self._tasks.get((stage, key))
+            if t is None:
+                started = time.time() - (elapsed or 0)
+                t = self._tasks[(stage, key)] = {
+                    "stage": stage, "key": key, "started_at": started,
+                }
+            if elapsed is None:
+                elapsed = time.time() - t["started_at"]
+            t.update({
+                "status": status,
+                "rows": rows or 0,
+                "bytes": nbytes or 0,
+                "elapsed_sec": round(elapsed, 2),
+            })
+
+    def pop_tasks(self) -> list[dict]:
+        """
+        끝난 task 기록을 꺼내고 제거 (process worker → parent 전달용)
+        """
+        with self._lock:
+            done = [k for k, t in self._tasks.items() if t.get("status") != "running"]
+            return [self._tasks.pop(k) for k in done]
+
+    def merge_tasks(self, items: list[dict]):
+        with self._lock:
+            for t in items:
+                self._tasks[(t["stage"], t["key"])] = dict(t)
+
+    # ---- gauge ----
+    def set_gauge(self, name: str, value: float):
+        with self._lock:
+            self._gauges[name] = value
+
+    def inc_gauge(self, name: str, delta: float = 1):
+        with self._lock:
+            self._gauges[name] = self._gauges.get(name, 0) + delta
+
+    def get_gauge(self, name: str, default: float = 0) -> float:
+        with self._lock:
+            return self._gauges.get(name, default)
+
+    # ---- snapshot ----
+    def snapshot(self) -> dict:
+        now = time.time()
+
+        with self._lock:
+            stages = {}
+            for name, st in self._stages.items():
+                elapsed = st.get("elapsed_sec")
+                if elapsed is None:
+                    elapsed = round(now - st["started_at"], 2)
+                stages[name] = {"status": st.get("status"), "elapsed_sec": elapsed}
+
+            tasks = [dict(t) for t in self._tasks.values()]
+            gauges = dict(self._gauges)
+            header = {
+                "job_name": self.job_name,
+                "run_id": self.run_id,
+                "started_at": datetime.fromtimestamp(self.started_at).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+        # 진행 중 export (progress registry) 를 같은 형식으로 합침
+        for p in progress_registry.snapshot():
+            tasks.append({
+                "stage": "export",
+                "key": p["key"],
+                "status": p["status"],
+                "rows": p["rows"],
+                "bytes": p["bytes"],
+                "phase": p["phase"],
+                "elapsed_sec": p["elapsed_sec"],
+                "idle_sec": p["idle_sec"],
+            })
+
+        for t in tasks:
+            t.pop("started_at", None)
+            elapsed = t.get("elapsed_sec") or 0
+            t["rows_per_sec"] = round(t["rows"] / elapsed, 1) if elapsed > 0 else 0.0
+
+        summary = {}
+        for t in tasks:
+            s = summary.setdefault(t["stage"], {"running": 0, "done": 0, "failed": 0,
+                                                "skipped": 0, "rows": 0, "bytes": 0})
+            bucket = t["status"] if t["status"] in ("running", "done", "skipped") else "failed"
+            s[bucket] += 1
+            s["rows"] += t["rows"]
+            s["bytes"] += t["bytes"]
+
+        return {
+            **header,
+            "updated_at": _now_str(),
+            "elapsed_sec": round(now - self.started_at, 2),
+            "stages": stages,
+            "gauges": gauges,
+            "summary": summary,
+            "tasks": tasks,
+        }
+
+
+metrics = MetricsRegistry()
+
+
+# ---------------------------
+# Prometheus text format
+# ---------------------------
+def _label(v) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def render_prometheus(snap: dict) -> str:
+    lines = []
+
+    def metric(name, help_text, kind, samples):
+        lines.append(f"# HELP batch_runner_{name} {help_text}")
+        lines.append(f"# TYPE batch_runner_{name} {kind}")
+        for labels, value in samples:
+            lbl = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            lbl = f"{{{lbl}}}" if lbl else ""
+            lines.append(f"batch_runner_{name}{lbl} {value}")
+
+    metric("stage_elapsed_seconds", "stage elapsed time", "gauge",
+           [({"stage": s}, st["elapsed_sec"]) for s, st in snap["stages"].items()])
+
+    for name, value in snap["gauges"].items():
+        metric(name, name.replace("_", " "), "gauge", [({}, value)])
+
+    metric("task_rows", "rows processed per task", "gauge",
+           [({"stage": t["stage"], "task": t["key"], "status": t["status"]}, t["rows"])
+            for t in snap["tasks"]])
+    metric("task_bytes", "bytes written per task", "gauge",
+           [({"stage": t["stage"], "task": t["key"]}, t["bytes"]) for t in snap["tasks"]])
+    metric("task_rows_per_second", "rows/sec per task", "gauge",
+           [({"stage": t["stage"], "task": t["key"]}, t["rows_per_sec"]) for t in snap["tasks"]])
+
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------
+# status.json writer
+# ---------------------------
+def write_status(path: Path, snap: dict | None = None):
+    snap = snap if snap is not None else metrics.snapshot()
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snap, f, indent=2, ensure_ascii=False, default=str)
+    tmp.replace(path)
+
+
+class StatusWriter(threading.Thread):
+    """
+    run 폴더의 status.json 을 interval 초마다 갱신 (GUI / 외부 모니터링용)
+    """
+
+    def __init__(self, path: Path, interval: float = 2.0):
+        super().__init__(name="status-writer", daemon=True)
+        self.path = Path(path)
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self._write()
+
+    def _write(self):
+        try:
+            write_status(self.path)
+        except Exception as e:
+            logger.debug("status.json write failed: %s", e)
+
+    def stop(self):
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout=self.interval + 1)
+        self._write()     # 최종 상태
+
+
+# ---------------------------
+# HTTP endpoint (optional)
+# ---------------------------
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        snap = metrics.snapshot()
+
+        if self.path.startswith("/metrics"):
+            body = render_prometheus(snap).encode("utf-8")
+            ctype = "text/plain; version=0.0.4; charset=utf-8"
+        elif self.path.startswith("/status"):
+            body = json.dumps(snap, ensure_ascii=False, default=str).encode("utf-8")
+            ctype = "application/json; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        logger.debug("metrics http | " + fmt, *args)
+
+
+def start_http_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    GET /metrics (Prometheus text), GET /status (JSON)
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,361 @@
+# file: v2/engine/planner.py
+
+import heapq
+import json
+import statistics
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from v2.engine.path_utils import resolve_path
+from v2.engine.sql_utils import sort_sql_files, resolve_table_name, extract_sqlname_from_csv
+from v2.stages.export_stage import (
+    expand_param_values, plan_export_tasks, iter_export_tasks,
+    task_probe_sql, task_incremental, incremental_mode,
+)
+from v2.engine.watermark import DELTA_MARK
+from util.manifest import read_manifest, MANIFEST_SUFFIX
+
+# =========================================================
+# plan 모드: DB 접속 없이 실행 계획 계산 → run_dir/plan.json
+#   export : SQL x params task, 출력 경로, dedup copy, skip(파일 존재) 여부
+#            probe / watermark incremental SQL 은 실행 시 DB 조회로 결정 → 별도 action
+#   load   : 적재 대상 파일 / 테이블, skip(_LOAD_HISTORY) 여부 (로컬 target 만 조회)
+#   예상 시간: 과거 run 의 status.json → manifest elapsed_sec → 같은 SQL 중앙값
+# =========================================================
+
+WORKER_CANDIDATES = [1, 2, 4, 8, 16, 32]
+
+
+# ---------------------------
+# History
+# ---------------------------
+def load_run_history(job_dir: Path) -> dict:
+    """
+    과거 run 폴더 status.json 의 완료 task 소요 시간
+    반환: {(stage, key): {"elapsed_sec", "rows", "bytes"}} (최신 run 우선)
+    """
+    history = {}
+    if not job_dir.exists():
+        return history
+
+    files = sorted(job_dir.glob("*/status.json"), key=lambda p: p.stat().st_mtime)
+    for p in files:
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                status = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for t in status.get("tasks", []):
+            if t.get("status") == "done" and t.get("elapsed_sec"):
+                history[(t["stage"], t["key"])] = {
+                    "elapsed_sec": t["elapsed_sec"],
+                    "rows": t.get("rows", 0),
+                    "bytes": t.get("bytes", 0),
+                }
+
+    return history
+
+
+def load_manifest_history(out_dir: Path) -> dict:
+    """
+    export 폴더 manifest 의 elapsed_sec. 반환: {file_name: manifest}
+    """
+    result = {}
+    if not out_dir.exists():
+        return result
+
+    for p in out_dir.glob(f"*{MANIFEST_SUFFIX}"):
+        data_file = p.with_name(p.name[: -len(MANIFEST_SUFFIX)])
+        m = read_manifest(data_file)
+        if m is not None:
+            result[data_file.name] = m
+
+    return result
+
+
+def load_history_hashes(ctx, target_cfg: dict) -> set | None:
+    """
+    로컬 target(duckdb / sqlite3) 의 _LOAD_HISTORY (table, hash). 조회 불가면 None
+    (oracle target 은 DB 접속이 필요하므로 조회하지 않음)
+    """
+    tgt_type = (target_cfg.get("type") or "").strip().lower()
+    sql = "SELECT table_name, file_hash FROM _LOAD_HISTORY WHERE job_name = ?"
+
+    try:
+        if tgt_type == "duckdb":
+            import duckdb
+            db_path = resolve_path(ctx, target_cfg.get("db_path", "data/local/result.duckdb"))
+            if not db_path.exists():
+                return set()
+            con = duckdb.connect(str(db_path), read_only=True)
+        elif tgt_type == "sqlite3":
+            import sqlite3
+            db_path = resolve_path(ctx, target_cfg.get("db_path", "data/local/result.sqlite"))
+            if not db_path.exists():
+                return set()
+            con = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        else:
+            return None
+    except Exception as e:
+        ctx.logger.warning("PLAN load history not available: %s", e)
+        return None
+
+    try:
+        return {(t, h) for t, h in con.execute(sql, [ctx.job_name]).fetchall()}
+    except Exception:
+        # history 테이블 없음 = 적재 이력 없음
+        return set()
+    finally:
+        con.close()
+
+
+# ---------------------------
+# Estimate
+# ---------------------------
+class Estimator:
+    """
+    task 1건 예상 시간: 같은 파일 이력 → 같은 SQL 중앙값 → 전체 중앙값
+    """
+
+    def __init__(self, stage: str, run_history: dict, manifests: dict | None = None):
+        self.stage = stage
+        self.exact = {}
+        for (stage_name, key), h in run_history.items():
+            if stage_name == stage:
+                self.exact[key] = ("history", h["elapsed_sec"])
+        for name, m in (manifests or {}).items():
+            if name not in self.exact and m.get("elapsed_sec"):
+                self.exact[name] = ("manifest", m["elapsed_sec"])
+
+        by_sql = {}
+        for name, (_, sec) in self.exact.items():
+            by_sql.setdefault(name.split("__", 1)[0], []).append(sec)
+        self.by_sql = {k: statistics.median(v) for k, v in by_sql.items()}
+        values = [sec for _, sec in self.exact.values()]
+        self.overall = statistics.median(values) if values else None
+
+    def estimate(self, file_name: str) -> tuple[float | None, str]:
+        if file_name in self.exact:
+            source, sec = self.exact[file_name]
+            return round(sec, 2), source
+        sql = file_name.split("__", 1)[0]
+        if sql in self.by_sql:
+            return round(self.by_sql[sql], 2), "sql_median"
+        if self.overall is not None:
+            return round(self.overall, 2), "job_median"
+        return None, "unknown"
+
+
+def simulate_workers(durations: list, workers: int) -> float:
+    """
+    긴 task 부터 가장 먼저 비는 worker 에 배정 (LPT) → 예상 wall time
+    """
+    if not durations:
+        return 0.0
+    heap = [0.0] * min(workers, len(durations))
+    for d in sorted(durations, reverse=True):
+        heapq.heapreplace(heap, heap[0] + d)
+    return max(heap)
+
+
+# ---------------------------
+# Plan
+# ---------------------------
+def build_plan(ctx) -> dict:
+    job_cfg = ctx.job_config
+    export_cfg = job_cfg.get("export", {}) or {}
+    target_cfg = job_cfg.get("target", {}) or {}
+    source_sel = job_cfg.get("source", {})
+    host_name = source_sel.get("host")
+
+    out_dir = resolve_path(ctx, export_cfg.get("out_dir", "data/export")) / ctx.job_name
+    sql_dir = resolve_path(ctx, export_cfg.get("sql_dir", "sql/export"))
+    sql_files = sort_sql_files(sql_dir) if sql_dir.exists() else []
+
+    compression = export_cfg.get("compression", "none")
+    ext = "csv.gz" if compression == "gzip" else "csv"
+    overwrite = export_cfg.get("overwrite", False)
+    parallel_workers = export_cfg.get("parallel_workers", 1)
+
+    # export stage 와 같은 probe / incremental 설정 (job.yml 우선, 없으면 SQL 헤더)
+    sql_opts = SimpleNamespace(
+        probes={Path(k).stem: v for k, v in (export_cfg.get("probe") or {}).items()},
+        incremental={Path(k).stem: v for k, v in (export_cfg.get("incremental") or {}).items()},
+    )
+    full_resync = bool(export_cfg.get("full_resync", False))
+
+    run_history = load_run_history(out_dir)
+    manifests = load_manifest_history(out_dir)
+    export_est = Estimator("export", run_history, manifests)
+    load_est = Estimator("load_local", run_history)
+
+    # ---- export ----
+    param_values = expand_param_values(ctx.params)
+    task_plan = plan_export_tasks(sql_files, param_values, host_name, ext, out_dir)
+
+    export_tasks = []
+    run_durations = []
+    will_write = set()
+    delta_patterns = []
+
+    for t in iter_export_tasks(sql_files, param_values, host_name, ext, out_dir, task_plan):
+        targets = [t.out_file] + [c[2] for c in t.copies]
+        existing = [f for f in targets if f.exists()]
+        inc = task_incremental(sql_opts, t)
+
+        if inc is not None:
+            # 항상 high watermark 조회. full 이 아니면 새 row 가 있을 때 __delta_ 파일 기록
+            full = incremental_mode(t, full_resync)[1]
+            action = "incremental (full)" if full else "incremental (delta)"
+        elif task_probe_sql(sql_opts, t) and existing:
+            # probe 결과가 같으면 skip, 다르면 재-export (실행 시 결정)
+            action = "probe (runtime)"
+        elif overwrite:
+            action = "export (overwrite)" if existing else "export"
+        elif len(existing) == len(targets):
+            action = "skip (exists)"
+        elif existing:
+            action = "copy (dedup)"
+        else:
+            action = "export"
+
+        est, source = export_est.estimate(t.out_file.name)
+        if action == "incremental (delta)":
+            # delta 크기는 알 수 없음 (est unknown). 파일명은 실행 시각 기준
+            est, source = None, "runtime"
+            run_durations.append(0.0)
+            base = t.out_file.name[: -(len(ext) + 1)]
+            delta_patterns.append((t.out_file.parent, f"{base}{DELTA_MARK}*.{ext}"))
+        elif action.startswith(("export", "incremental", "probe")):
+            # probe 는 재-export 되는 경우 기준 (최대치)
+            run_durations.append(est or 0.0)
+            will_write.update(targets)
+        elif action == "copy (dedup)":
+            will_write.update(f for f in targets if f not in existing)
+
+        export_tasks.append({
+            "sql": t.sql_file.name,
+            "params": t.params,
+            "out_file": str(t.out_file),
+            "copies": [str(c[2]) for c in t.copies],
+            "action": action,
+            "est_sec": est if action.startswith(("export", "incremental", "probe")) else 0.0,
+            "est_source": source,
+        })
+
+    # ---- load ----
+    history = load_history_hashes(ctx, target_cfg) if target_cfg else None
+    sql_map = {p.stem: p for p in sql_files}
+
+    files = set(will_write)
+    if out_dir.exists():
+        files.update(p for p in out_dir.iterdir()
+                     if p.is_file() and p.name.endswith((".csv", ".csv.gz")))
+
+    load_items = []
+    load_total = 0.0
+
+    # 이번 실행에서 생길 수 있는 delta 파일 (이름 미정 → 패턴으로 표시)
+    for parent, pattern in delta_patterns:
+        sql_file = sql_map.get(extract_sqlname_from_csv(parent / pattern))
+        load_items.append({
+            "file": pattern,
+            "table": resolve_table_name(sql_file) if sql_file else None,
+            "action": "load (after export, if delta)" if target_cfg else "none (no target)",
+            "est_sec": None,
+            "est_source": "runtime",
+        })
+    for f in sorted(files, key=lambda p: p.name):
+        sql_file = sql_map.get(extract_sqlname_from_csv(f))
+        table = resolve_table_name(sql_file) if sql_file else None
+        m = manifests.get(f.name)
+
+        if not target_cfg:
+            action = "none (no target)"
+        elif table is None:
+            action = "skip (sql not found)"
+        elif f in will_write:
+            action = "load (after export)"
+        elif history is None:
+            action = "load (history not checked)"
+        elif m is None:
+            action = "load (hash check at runtime)"
+        elif (table, m["sha256"]) in history:
+            action = "skip (history)"
+        else:
+            action = "load"
+
+        est, source = load_est.estimate(f.name)
+        if action.startswith("load"):
+            load_total += est or 0.0
+
+        load_items.append({
+            "file": f.name,
+            "table": table,
+            "action": action,
+            "est_sec": est if action.startswith("load") else 0.0,
+            "est_source": source,
+        })
+
+    # ---- summary ----
+    def _count(items, prefix):
+        return sum(1 for i in items if i["action"].startswith(prefix))
+
+    unknown = sum(1 for t in export_tasks
+                  if t["action"].startswith(("export", "incremental", "probe")) and t["est_sec"] is None)
+    workers = sorted(set(WORKER_CANDIDATES + [parallel_workers]))
+    summary = {
+        "sql_files": len(sql_files),
+        "export_files": task_plan.n_files,
+        "export_queries": task_plan.n_tasks,
+        "export_run": _count(export_tasks, "export"),
+        "export_skip": _count(export_tasks, "skip"),
+        "export_copy": _count(export_tasks, "copy"),
+        "export_incremental": _count(export_tasks, "incremental"),
+        "export_probe": _count(export_tasks, "probe"),
+        "export_est_unknown": unknown,
+        "export_est_serial_sec": round(sum(run_durations), 1),
+        "export_est_wall_sec": {
+            str(w): round(simulate_workers(run_durations, w), 1) for w in workers
+        },
+        "load_files": len(load_items),
+        "load_run": _count(load_items, "load"),
+        "load_skip": _count(load_items, "skip"),
+        "load_est_sec": round(load_total, 1),
+    }
+
+    return {
+        "job_name": ctx.job_name,
+        "run_id": ctx.run_id,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "params": ctx.params,
+        "parallel_workers": parallel_workers,
+        "summary": summary,
+        "export": export_tasks,
+        "load": load_items,
+    }
+
+
+def write_plan(ctx, run_dir: Path) -> Path:
+    logger = ctx.logger
+    plan = build_plan(ctx)
+
+    path = run_dir / "plan.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=2, ensure_ascii=False)
+
+    s = plan["summary"]
+    logger.info("PLAN export | sql=%d files=%d queries=%d | run=%d skip=%d copy=%d "
+                "incremental=%d probe=%d",
+                s["sql_files"], s["export_files"], s["export_queries"],
+                s["export_run"], s["export_skip"], s["export_copy"],
+                s["export_incremental"], s["export_probe"])
+    logger.info("PLAN export estimate | serial=%.1fs (unknown=%d) | workers %s",
+                s["export_est_serial_sec"], s["export_est_unknown"],
+                " ".join(f"{w}={sec}s" for w, sec in s["export_est_wall_sec"].items()))
+    logger.info("PLAN load | files=%d run=%d skip=%d | est=%.1fs",
+                s["load_files"], s["load_run"], s["load_skip"], s["load_est_sec"])
+    logger.info("PLAN written | %s", path)
+
+    return path
@@ -0,0 +1,177 @@
+# file: v2/engine/process_pool.py
+
+import logging
+import multiprocessing as mp
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+
+from v2.engine.runtime_state import stop_event
+from v2.engine.progress import progress_registry, StallWatchdog
+from v2.engine.metrics import metrics
+from v2.engine.profiler import profiler
+
+# =========================================================
+# export.executor: process
+#   worker = 별도 process (자체 DB connection / logger / watchdog) → GIL 경합 없음
+#   log      : worker QueueHandler → parent QueueListener (parent root handler 로 출력)
+#   stop     : parent Manager Event → worker relay thread 가 worker stop_event set
+#   progress : worker 가 주기적으로 running task 상태 전송 → parent progress_registry
+#   result   : task 종료 시 progress / metrics / profile 누적값 반환 → parent 에 merge
+# =========================================================
+
+_worker = {}
+
+
+# ---------------------------
+# Worker side
+# ---------------------------
+def _init_worker(log_queue, status_queue, shared_stop, level, logger_name,
+                 runner_factory, opts, watchdog_interval, profile, status_interval):
+    # Ctrl+C 는 parent 가 받아서 shared_stop 으로 전달
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        root.removeHandler(h)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    log = logging.getLogger(logger_name)
+    log.setLevel(level)
+
+    profiler.configure(profile)
+
+    watchdog = StallWatchdog(progress_registry, opts.stall_seconds, log=log,
+                             interval=watchdog_interval)
+    watchdog.start()
+
+    relay = threading.Thread(
+        target=_relay_loop,
+        args=(shared_stop, status_queue, status_interval),
+        name="stop-relay",
+        daemon=True,
+    )
+    relay.start()
+
+    _worker["run"] = runner_factory(opts, log)
+
+
+def _relay_loop(shared_stop, status_queue, interval):
+    pid = os.getpid()
+    while True:
+        try:
+            stopped = shared_stop.wait(interval)
+        except Exception:
+            # manager 종료 (parent shutdown 중)
+            return
+        if stopped:
+            stop_event.set()
+
+        running = [p for p in progress_registry.snapshot() if p["status"] == "running"]
+        try:
+            status_queue.put((pid, running, metrics.get_gauge("active_connections")))
+        except Exception:
+            return
+
+        if stopped:
+            return
+
+
+def _run_task(task, idx, total):
+    _worker["run"](task, idx, total)
+    return {
+        "progress": progress_registry.pop_finished(),
+        "tasks": metrics.pop_tasks(),
+        "profile": profiler.pop_state(),
+    }
+
+
+# ---------------------------
+# Parent side
+# ---------------------------
+class ProcessExportPool:
+    """
+    ThreadPoolExecutor 대신 사용하는 process pool (submit / collect / request_stop)
+    runner_factory(opts, logger) 는 module 최상위 함수여야 함 (spawn 시 pickle)
+    """
+
+    def __init__(self, workers: int, runner_factory, opts, logger,
+                 watchdog_interval: float = 5, status_interval: float = 1.0):
+        self.logger = logger
+        mp_ctx = mp.get_context("spawn")   # DB client / thread 상태를 fork 로 복제하지 않음
+
+        self._manager = mp_ctx.Manager()
+        self._stop = self._manager.Event()
+        self._log_queue = mp_ctx.Queue()
+        self._status_queue = mp_ctx.Queue()
+
+        self._listener = QueueListener(
+            self._log_queue, *logging.getLogger().handlers, respect_handler_level=True,
+        )
+        self._listener.start()
+
+        self._conns: dict[int, int] = {}
+        self._closed = threading.Event()
+        self._status_thread = threading.Thread(
+            target=self._status_loop, name="process-status", daemon=True,
+        )
+        self._status_thread.start()
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_ctx,
+            initializer=_init_worker,
+            initargs=(
+                self._log_queue, self._status_queue, self._stop,
+                logger.getEffectiveLevel(), logger.name,
+                runner_factory, opts, watchdog_interval, profiler.enabled, status_interval,
+            ),
+        )
+        logger.info("Process pool started | workers=%d", workers)
+
+    def _status_loop(self):
+        while not self._closed.is_set():
+            try:
+                pid, running, conns = self._status_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+            progress_registry.merge_remote(running)
+            self._conns[pid] = conns
+            metrics.set_gauge("active_connections", sum(self._conns.values()))
+
+    def submit(self, task, idx, total):
+        return self._executor.submit(_run_task, task, idx, total)
+
+    def collect(self, future):
+        """
+        완료 future 결과를 parent registry 에 반영 (worker 예외 / pool 손상은 그대로 raise)
+        """
+        metrics.inc_gauge("export_queue_depth", -1)
+        result = future.result()
+        progress_registry.merge_remote(result["progress"])
+        metrics.merge_tasks(result["tasks"])
+        profiler.merge_state(result["profile"])
+
+    def request_stop(self):
+        self._stop.set()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._closed.set()
+        self._status_thread.join(timeout=2)
+        self._listener.stop()
+        self._manager.shutdown()
+        metrics.set_gauge("active_connections", 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        return False
@@ -0,0 +1,232 @@
+# file: v2/engine/profiler.py
+
+import csv
+import fnmatch
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+# =========================================================
+# --profile : task 별 phase 시간 측정 (execute / first_row / fetch / encode /
+#             compress / write / hash / rename / manifest / load ...)
+# --profile-sample : 선택 task 를 실행 중인 thread 의 stack 을 주기적으로 sampling
+#                    → collapsed stack 파일 (flamegraph.pl / speedscope 입력)
+# 비활성 시 add / task_begin 은 즉시 return (오버헤드 없음)
+# =========================================================
+
+PHASE_ORDER = [
+    "execute", "first_row", "fetch", "encode", "compress", "write", "hash",
+    "rename", "manifest", "load",
+]
+
+
+class PhaseProfiler:
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._phases: dict[tuple, dict] = {}     # (stage, task) -> {phase: sec}
+        self._wall: dict[tuple, float] = {}
+        self._current: dict[int, tuple] = {}     # thread id -> (stage, task, t0)
+
+    def configure(self, enabled: bool):
+        self.enabled = enabled
+
+    # ---- task scope ----
+    def task_begin(self, stage: str, task: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._current[threading.get_ident()] = (stage, task, time.perf_counter())
+
+    def task_end(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            cur = self._current.pop(threading.get_ident(), None)
+            if cur is None:
+                return
+            stage, task, t0 = cur
+            key = (stage, task)
+            self._wall[key] = self._wall.get(key, 0.0) + time.perf_counter() - t0
+            self._phases.setdefault(key, {})
+
+    def current_tasks(self) -> dict:
+        with self._lock:
+            return {tid: (c[0], c[1]) for tid, c in self._current.items()}
+
+    # ---- phase ----
+    def add(self, stage: str, task: str, phase: str, seconds: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            d = self._phases.setdefault((stage, task), {})
+            d[phase] = d.get(phase, 0.0) + max(seconds, 0.0)
+
+    def add_current(self, phase: str, seconds: float):
+        """
+        현재 thread 가 실행 중인 task 에 누적 (adapter 는 task 이름을 몰라도 됨)
+        """
+        if not self.enabled:
+            return
+        cur = self._current.get(threading.get_ident())
+        if cur is not None:
+            self.add(cur[0], cur[1], phase, seconds)
+
+    def add_writer_phases(self, writerows_sec: float, hasher):
+        """
+        csv.writerows 누적 시간을 HashingWriter 계측값으로 encode / compress / write / hash 분리
+        (gzip 은 compress_sec 안에 하위 write / hash 가 포함되어 있으므로 차감)
+        """
+        if not self.enabled:
+            return
+        io_sec = hasher.write_sec + hasher.hash_sec
+        compress = max(hasher.compress_sec - io_sec, 0.0) if hasher.compress_sec else 0.0
+        self.add_current("encode", writerows_sec - (hasher.compress_sec or io_sec))
+        self.add_current("compress", compress)
+        self.add_current("write", hasher.write_sec)
+        self.add_current("hash", hasher.hash_sec)
+
+    @contextmanager
+    def phase(self, phase: str):
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_current(phase, time.perf_counter() - t0)
+
+    # ---- process worker ----
+    def pop_state(self) -> tuple[dict, dict]:
+        """
+        누적값을 꺼내고 초기화 (process worker → parent 전달용)
+        """
+        with self._lock:
+            state = (self._phases, self._wall)
+            self._phases, self._wall = {}, {}
+        return state
+
+    def merge_state(self, state: tuple[dict, dict]):
+        phases, wall = state
+        with self._lock:
+            for key, d in phases.items():
+                cur = self._phases.setdefault(key, {})
+                for p, sec in d.items():
+                    cur[p] = cur.get(p, 0.0) + sec
+            for key, sec in wall.items():
+                self._wall[key] = self._wall.get(key, 0.0) + sec
+
+    # ---- report ----
+    def rows(self) -> list[dict]:
+        with self._lock:
+            keys = list(self._phases)
+            phases = {k: dict(v) for k, v in self._phases.items()}
+            wall = dict(self._wall)
+
+        result = []
+        for stage, task in keys:
+            ph = phases[(stage, task)]
+            measured = sum(ph.values())
+            total = wall.get((stage, task), measured)
+            row = {"stage": stage, "task": task}
+            for p in PHASE_ORDER + sorted(set(ph) - set(PHASE_ORDER)):
+                row[p] = round(ph.get(p, 0.0), 3)
+            row["other"] = round(max(total - measured, 0.0), 3)
+            row["total"] = round(total, 3)
+            result.append(row)
+
+        result.sort(key=lambda r: r["total"], reverse=True)
+        return result
+
+    def write_table(self, path: Path) -> list[dict]:
+        rows = self.rows()
+        if not rows:
+            return rows
+
+        fields = ["stage", "task"]
+        for r in rows:
+            fields += [k for k in r if k not in fields]
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=fields, restval=0.0)
+            w.writeheader()
+            w.writerows(rows)
+
+        return rows
+
+    def log_table(self, logger, rows: list[dict], top: int = 20):
+        if not rows:
+            return
+
+        phases = [p for p in PHASE_ORDER + ["other"]
+                  if any(r.get(p) for r in rows)]
+
+        logger.info("PROFILE top %d tasks (sec)", min(top, len(rows)))
+        logger.info("%-10s %-40s %s %8s", "stage", "task",
+                    " ".join(f"{p:>9}" for p in phases), "total")
+        for r in rows[:top]:
+            logger.info("%-10s %-40s %s %8.2f", r["stage"], r["task"][:40],
+                        " ".join(f"{r.get(p, 0.0):9.2f}" for p in phases), r["total"])
+
+
+profiler = PhaseProfiler()
+
+
+# ---------------------------
+# Sampling profiler
+# ---------------------------
+class StackSampler(threading.Thread):
+    """
+    interval 초마다 task 실행 중인 thread stack 을 수집
+    task_pattern(glob) 에 맞는 task 만 대상. 결과: "stage;task;mod:func;... count"
+    """
+
+    def __init__(self, task_pattern: str = "*", interval: float = 0.01):
+        super().__init__(name="stack-sampler", daemon=True)
+        self.task_pattern = task_pattern
+        self.interval = interval
+        self.samples = Counter()
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        tasks = profiler.current_tasks()
+        if not tasks:
+            return
+
+        frames = sys._current_frames()
+        for tid, (stage, task) in tasks.items():
+            if not fnmatch.fnmatch(task, self.task_pattern):
+                continue
+            frame = frames.get(tid)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                mod = frame.f_globals.get("__name__", "?")
+                stack.append(f"{mod}:{code.co_name}")
+                frame = frame.f_back
+
+            stack.reverse()
+            self.samples[";".join([stage, task] + stack)] += 1
+
+    def stop(self):
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout=1)
+
+    def write_collapsed(self, path: Path) -> int:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, n in self.samples.most_common():
+                f.write(f"{stack} {n}\n")
+        return sum(self.samples.values())
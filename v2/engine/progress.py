@@ -0,0 +1,208 @@
+# file: v2/engine/progress.py
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from v2.engine.runtime_state import stop_event
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------
+# Task progress
+# ---------------------------
+@dataclass
+class TaskProgress:
+    """
+    export 1건의 진행 상태 (worker thread 가 beat, watchdog 가 감시)
+    """
+    key: str
+    conn: object = None
+    rows: int = 0
+    bytes: int = 0
+    phase: str = "execute"          # execute | fetch
+    status: str = "running"         # running | done | failed | cancelled
+    cancel_reason: str | None = None
+    started_at: float = field(default_factory=time.time)
+    last_progress: float = field(default_factory=time.time)
+    cancelled_at: float | None = None
+    finished_at: float | None = None
+
+    def beat(self, rows: int = 0, phase: str | None = None, bytes_written: int | None = None):
+        self.rows += rows
+        if bytes_written is not None:
+            self.bytes = bytes_written
+        if phase:
+            self.phase = phase
+        self.last_progress = time.time()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_reason is not None
+
+    def check(self):
+        """
+        fetch loop 에서 호출: watchdog 취소 / stop 요청이면 예외
+        """
+        if self.cancelled:
+            raise RuntimeError(f"Export cancelled: {self.cancel_reason}")
+        if stop_event.is_set():
+            raise RuntimeError("Export interrupted")
+
+    def cancel(self, reason: str):
+        """
+        watchdog thread 에서 호출. 블록된 execute/fetch 를 driver cancel 로 깨움
+        """
+        if self.cancelled:
+            return
+        self.cancel_reason = reason
+        self.cancelled_at = time.time()
+        if self.conn is not None and hasattr(self.conn, "cancel"):
+            try:
+                self.conn.cancel()
+            except Exception as e:
+                logger.warning("conn.cancel failed | %s | %s", self.key, e)
+
+    def abort(self):
+        """
+        cancel 후에도 풀리지 않는 경우 connection 자체를 닫음 (socket 강제 종료)
+        """
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception as e:
+                logger.warning("conn.close failed | %s | %s", self.key, e)
+
+    def to_dict(self) -> dict:
+        now = self.finished_at or time.time()
+        return {
+            "key": self.key,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "phase": self.phase,
+            "status": self.status,
+            "elapsed_sec": round(now - self.started_at, 2),
+            "idle_sec": round(now - self.last_progress, 2),
+            "cancel_reason": self.cancel_reason,
+        }
+
+
+# ---------------------------
+# Shared registry
+# ---------------------------
+class ProgressRegistry:
+    """
+    thread 간 공유되는 진행 상태 저장소 (key = export 파일명)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tasks: dict[str, TaskProgress] = {}
+        self._remote: dict[str, dict] = {}      # process worker 가 보내온 상태 (to_dict 형식)
+
+    def start(self, key: str, conn=None) -> TaskProgress:
+        task = TaskProgress(key=key, conn=conn)
+        with self._lock:
+            self._tasks[key] = task
+        return task
+
+    def finish(self, key: str, status: str):
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                return
+            task.status = "cancelled" if task.cancelled and status != "done" else status
+            task.conn = None
+            task.finished_at = time.time()
+
+    def running(self) -> list[TaskProgress]:
+        with self._lock:
+            return [t for t in self._tasks.values() if t.status == "running"]
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [t.to_dict() for t in self._tasks.values()] + [dict(d) for d in self._remote.values()]
+
+    def pop_finished(self) -> list[dict]:
+        """
+        끝난 task 상태를 꺼내고 제거 (process worker → parent 전달용)
+        """
+        with self._lock:
+            done = [k for k, t in self._tasks.items() if t.status != "running"]
+            return [self._tasks.pop(k).to_dict() for k in done]
+
+    def merge_remote(self, items: list[dict]):
+        with self._lock:
+            for d in items:
+                # 늦게 도착한 running 상태가 종료 상태를 덮지 않도록
+                cur = self._remote.get(d["key"])
+                if cur is not None and cur["status"] != "running" and d["status"] == "running":
+                    continue
+                self._remote[d["key"]] = d
+
+    def clear(self):
+        with self._lock:
+            self._tasks.clear()
+            self._remote.clear()
+
+
+progress_registry = ProgressRegistry()
+
+
+# ---------------------------
+# Stall watchdog
+# ---------------------------
+class StallWatchdog(threading.Thread):
+    """
+    running task 를 주기적으로 검사
+      - stall_seconds 동안 beat 없음 → conn.cancel()
+      - stop_event → 진행 중 task 모두 cancel
+      - cancel 후 abort_after 초가 지나도 running 이면 conn.close()
+    """
+
+    def __init__(self, registry: ProgressRegistry, stall_seconds: float,
+                 log=None, interval: float = 5.0, abort_after: float = 60.0):
+        super().__init__(name="export-watchdog", daemon=True)
+        self.registry = registry
+        self.stall_seconds = stall_seconds
+        self.log = log or logger
+        self.interval = interval
+        self.abort_after = abort_after
+        self._stopped = threading.Event()
+        self._aborted: set[str] = set()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def check(self):
+        now = time.time()
+
+        for task in self.registry.running():
+            if task.cancelled:
+                if (task.key not in self._aborted
+                        and now - task.cancelled_at > self.abort_after):
+                    self.log.warning("WATCHDOG abort (cancel not honored) | %s", task.key)
+                    self._aborted.add(task.key)
+                    task.abort()
+                continue
+
+            if stop_event.is_set():
+                reason = "stop requested"
+            elif now - task.last_progress > self.stall_seconds:
+                reason = (
+                    f"stalled > {self.stall_seconds}s "
+                    f"(phase={task.phase} rows={task.rows})"
+                )
+            else:
+                continue
+
+            self.log.warning("WATCHDOG cancel | %s | %s", task.key, reason)
+            task.cancel(reason)
+
+    def stop(self):
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout=self.interval + 1)
@@ -10,6 +10,8 @@ from pathlib import Path
 
 from v2.engine.stage_registry import STAGE_REGISTRY
 from v2.engine.runtime_state import stop_event
+from v2.engine.metrics import metrics, StatusWriter, start_http_server
+from v2.engine.profiler import profiler, StackSampler
 import signal
 
 # ----------------------------
@@ -203,7 +205,13 @@ def run_pipeline(ctx: RunContext):
         ctx.logger.info("-" * 60)
 
         start = time.time()
-        stage_func(ctx)
+        metrics.stage_start(stage_name)
+        try:
+            stage_func(ctx)
+        except Exception:
+            metrics.stage_end(stage_name, "failed")
+            raise
+        metrics.stage_end(stage_name, "stopped" if stop_event.is_set() else "done")
         elapsed = time.time() - start
 
         ctx.logger.info("-" * 60)
@@ -236,6 +244,30 @@ def main():
         action="append",
         help="Override parameter (key=value)",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Per-task phase timing (run_dir/profile_tasks.csv)",
+    )
+    parser.add_argument(
+        "--profile-sample",
+        nargs="?",
+        const="*",
+        default=None,
+        metavar="TASK_GLOB",
+        help="Sample stacks of matching tasks (run_dir/profile_stacks.collapsed)",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=0.01,
+        help="Stack sampling interval in seconds (default 0.01)",
+    )
+    parser.add_argument(
+        "--full-resync",
+        action="store_true",
+        help="Ignore stored watermarks and fully re-export incremental SQL",
+    )
 
     args = parser.parse_args()
 
@@ -246,6 +278,10 @@ def main():
     job_config = load_job(job_path)
     env_config = load_env(env_path)
 
+    # incremental SQL 의 저장된 watermark 무시 → 전체 재-export
+    if args.full_resync and job_config.get("export"):
+        job_config["export"]["full_resync"] = True
+
     logger = setup_logging(work_dir / "logs", debug=args.debug)
     job_name = job_config.get("job_name", "unnamed_job")
 
@@ -312,12 +348,63 @@ def main():
     logger.info(" Log file : %s", log_file)
     run_dir = export_base / job_name / run_id
     write_run_info(run_dir, ctx, start_time_str)
+
+    # 실행 지표: run 폴더 status.json 주기 갱신 + (옵션) HTTP /metrics, /status
+    metrics_cfg = ctx.job_config.get("metrics", {}) or {}
+    metrics.reset(ctx.job_name, ctx.run_id)
+    status_writer = StatusWriter(run_dir / "status.json", metrics_cfg.get("status_interval", 2))
+    status_writer.start()
+    logger.info(" Status   : %s", run_dir / "status.json")
+
+    http_server = None
+    if metrics_cfg.get("http_port"):
+        host = metrics_cfg.get("http_host", "127.0.0.1")
+        try:
+            http_server = start_http_server(int(metrics_cfg["http_port"]), host)
+            logger.info(" Metrics  : http://%s:%s/metrics", host, metrics_cfg["http_port"])
+        except OSError as e:
+            logger.warning("Metrics HTTP server not started: %s", e)
+
+    # profile: phase timer (+ 선택 task stack sampling)
+    sampler = None
+    profiler.configure(args.profile or args.profile_sample is not None)
+    if profiler.enabled:
+        logger.info(" Profile  : on%s",
+                    f" | sample={args.profile_sample}" if args.profile_sample else "")
+    if args.profile_sample is not None:
+        sampler = StackSampler(args.profile_sample, args.profile_interval)
+        sampler.start()
+
     logger.info("=" * 60)
     logger.info("")
 
-    run_pipeline(ctx)
+    try:
+        if ctx.mode == "plan":
+            # plan: DB 접속 없이 task matrix / skip / 예상 시간 계산 → run_dir/plan.json
+            from v2.engine.planner import write_plan
+            write_plan(ctx, run_dir)
+        else:
+            run_pipeline(ctx)
+    finally:
+        status_writer.stop()
+        if http_server is not None:
+            http_server.shutdown()
+        if profiler.enabled:
+            _write_profile(logger, run_dir, sampler)
     logger.info("Job finished")
 
 
+def _write_profile(logger, run_dir: Path, sampler):
+    rows = profiler.write_table(run_dir / "profile_tasks.csv")
+    profiler.log_table(logger, rows)
+    logger.info("PROFILE tasks=%d | %s", len(rows), run_dir / "profile_tasks.csv")
+
+    if sampler is not None:
+        sampler.stop()
+        out = run_dir / "profile_stacks.collapsed"
+        n = sampler.write_collapsed(out)
+        logger.info("PROFILE samples=%d | %s (flamegraph.pl / speedscope)", n, out)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,112 @@
+# file: v2/engine/sql_deps.py
+
+import re
+
+# ---------------------------
+# SQL 텍스트 정리
+# ---------------------------
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINE_COMMENT = re.compile(r"--[^\n]*")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+
+_IDENT = r'(?:"[^"]+"|[A-Za-z_][\w$]*)(?:\s*\.\s*(?:"[^"]+"|[A-Za-z_][\w$]*))*'
+
+WRITE_PATTERNS = [
+    re.compile(
+        rf"\bCREATE\s+(?:OR\s+REPLACE\s+)?(?:TEMP(?:ORARY)?\s+)?(?:TABLE|VIEW)\s+"
+        rf"(?:IF\s+NOT\s+EXISTS\s+)?({_IDENT})",
+        re.IGNORECASE,
+    ),
+    re.compile(rf"\bINSERT\s+(?:OR\s+\w+\s+)?INTO\s+({_IDENT})", re.IGNORECASE),
+    re.compile(rf"\bDELETE\s+FROM\s+({_IDENT})", re.IGNORECASE),
+    re.compile(rf"\bUPDATE\s+({_IDENT})\s+SET\b", re.IGNORECASE),
+    re.compile(rf"\bDROP\s+(?:TABLE|VIEW)\s+(?:IF\s+EXISTS\s+)?({_IDENT})", re.IGNORECASE),
+    re.compile(rf"\bALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?({_IDENT})", re.IGNORECASE),
+    re.compile(rf"\bTRUNCATE\s+(?:TABLE\s+)?({_IDENT})", re.IGNORECASE),
+]
+
+# FROM x / JOIN x (함수 호출 read_csv(...) 등은 제외)
+READ_PATTERN = re.compile(rf"\b(?:FROM|JOIN)\s+({_IDENT})(?!\s*\()", re.IGNORECASE)
+
+# WITH a AS (...), b AS (...)
+CTE_PATTERN = re.compile(
+    r"(?:\bWITH\s+(?:RECURSIVE\s+)?|,\s*)([A-Za-z_][\w$]*)\s+AS\s*(?:NOT\s+)?(?:MATERIALIZED\s+)?\(",
+    re.IGNORECASE,
+)
+
+SQL_KEYWORDS = {
+    "select", "where", "set", "values", "lateral", "unnest", "only",
+}
+
+
+def strip_sql_noise(sql_text: str) -> str:
+    """
+    주석 / 문자열 리터럴 제거 (테이블명 오탐 방지)
+    """
+    s = _BLOCK_COMMENT.sub(" ", sql_text)
+    s = _LINE_COMMENT.sub(" ", s)
+    s = _STRING_LITERAL.sub("''", s)
+    return s
+
+
+def normalize_table_name(name: str) -> str:
+    """
+    "local"."A1" / local.a1 / A1 → a1
+    schema는 무시하고 마지막 이름만 사용 (의존성 판단은 보수적으로)
+    """
+    last = re.split(r"\s*\.\s*", name.strip())[-1]
+    return last.strip('"').lower()
+
+
+def extract_table_refs(sql_text: str) -> tuple[set[str], set[str]]:
+    """
+    SQL 텍스트에서 (read 테이블, write 테이블) 집합 추출
+    - CTE 이름은 read 대상에서 제외
+    - 자기 자신이 write 하는 테이블은 read 에서 제외
+    """
+    s = strip_sql_noise(sql_text)
+
+    writes = set()
+    for p in WRITE_PATTERNS:
+        for m in p.findall(s):
+            writes.add(normalize_table_name(m))
+
+    ctes = {m.lower() for m in CTE_PATTERN.findall(s)}
+
+    reads = set()
+    for m in READ_PATTERN.findall(s):
+        name = normalize_table_name(m)
+        if name in SQL_KEYWORDS or name in ctes:
+            continue
+        reads.add(name)
+
+    writes -= SQL_KEYWORDS
+    reads -= writes
+
+    return reads, writes
+
+
+def build_dependencies(items: list) -> dict:
+    """
+    items: [(key, reads, writes), ...] (실행 순서대로)
+    반환: {key: 선행되어야 하는 key 집합}
+
+    규칙 (앞 → 뒤 방향으로만 edge 생성):
+      - 앞이 write 한 테이블을 뒤가 read/write  (RAW / WAW)
+      - 앞이 read 한 테이블을 뒤가 write        (WAR)
+      - write 대상을 찾지 못한 SQL(PRAGMA/SET 등)은 barrier 취급
+    """
+    deps = {key: set() for key, _, _ in items}
+
+    for j, (key_j, reads_j, writes_j) in enumerate(items):
+        for i in range(j):
+            key_i, reads_i, writes_i = items[i]
+
+            if not writes_i or not writes_j:
+                deps[key_j].add(key_i)
+                continue
+
+            if writes_i & (reads_j | writes_j) or reads_i & writes_j:
+                deps[key_j].add(key_i)
+
+    return deps
@@ -0,0 +1,182 @@
+# file: v2/engine/sql_fusion.py
+
+import re
+from dataclasses import dataclass
+
+from v2.engine.sql_deps import strip_sql_noise
+
+# =========================================================
+# Query fusion
+#   WHERE <expr> = :p  (1곳에서만 사용)  →  WHERE <expr> IN (v1, v2, ...)
+#   SELECT 목록 앞에 <expr> AS FUSE_KEY__ 추가 → 결과를 값별 파일로 분리
+# 결과가 바뀔 수 있는 SQL (OR / 집계 / DISTINCT / GROUP BY / 집합연산 / 서브쿼리 / row 제한)은 제외
+# predicate 는 WHERE 의 최상위 AND 항일 때만 (JOIN ON / NOT / CASE / 괄호 안 / ORDER BY 순번 제외)
+# =========================================================
+FUSE_KEY = "FUSE_KEY__"
+
+_UNSAFE = re.compile(
+    r"\b(?:OR|GROUP\s+BY|DISTINCT|UNIQUE|UNION|INTERSECT|MINUS|EXCEPT|ROWNUM|LIMIT|FETCH\s+FIRST"
+    r"|CONNECT\s+BY|OVER|COUNT|SUM|AVG|MIN|MAX|LISTAGG|STRING_AGG)\b",
+    re.IGNORECASE,
+)
+_SELECT = re.compile(r"\bSELECT\b", re.IGNORECASE)
+_FROM_SINGLE = re.compile(
+    r"\bFROM\s+((?:\"[^\"]+\"|[A-Za-z_][\w$#]*)(?:\.(?:\"[^\"]+\"|[A-Za-z_][\w$#]*))*)"
+    r"(?:\s+(?:AS\s+)?([A-Za-z_][\w$#]*))?",
+    re.IGNORECASE,
+)
+_CLAUSE_WORDS = {"where", "join", "inner", "left", "right", "full", "cross", "order", "natural"}
+_MASK = re.compile(r"/\*.*?\*/|--[^\n]*|'(?:[^']|'')*'", re.DOTALL)
+_WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+_CONJ_BEFORE = re.compile(r"\b(?:WHERE|AND)\s*$", re.IGNORECASE)
+_CONJ_AFTER = re.compile(r"(?:$|;|AND\b|ORDER\s+BY\b)", re.IGNORECASE)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b(.*)$", re.IGNORECASE | re.DOTALL)
+_ORDINAL = re.compile(r"^\d+(?:\s+(?:ASC|DESC))?(?:\s+NULLS\s+(?:FIRST|LAST))?$", re.IGNORECASE)
+
+
+@dataclass
+class FusionPlan:
+    param: str
+    key_expr: str        # 예: TO_CHAR(DEPOSIT_DATE, 'YYYYMM')
+    quoted: bool         # 원래 값이 '...' 로 감싸져 있었는지
+    template: str        # predicate 자리에 {FUSE_IN} 마커, SELECT 목록 앞에 key 추가된 SQL
+
+
+def _placeholder_re(param: str) -> str:
+    p = re.escape(param)
+    return rf"(?:(?<!:):{p}\b|\$\{{{p}\}}|\{{#{p}\}})"
+
+
+def _lhs_start(sql: str, end: int) -> int:
+    """
+    '=' 앞의 좌변 식 시작 위치 (식별자 / a.b / 함수 호출 f(...))
+    """
+    i = end
+    while i > 0 and sql[i - 1].isspace():
+        i -= 1
+
+    if i > 0 and sql[i - 1] == ")":
+        depth = 0
+        while i > 0:
+            i -= 1
+            if sql[i] == ")":
+                depth += 1
+            elif sql[i] == "(":
+                depth -= 1
+                if depth == 0:
+                    break
+        if depth != 0:
+            return -1
+
+    while i > 0 and (sql[i - 1].isalnum() or sql[i - 1] in "_.$#\""):
+        i -= 1
+
+    return i
+
+
+def _mask(sql: str) -> str:
+    """
+    주석 / 문자열 리터럴을 같은 길이의 공백으로 (위치 유지)
+    """
+    return _MASK.sub(lambda m: " " * len(m.group(0)), sql)
+
+
+def _top_level_conjunct(masked: str, start: int, end: int) -> bool:
+    """
+    [start, end) 의 predicate 가 WHERE 절의 최상위 AND 항인지
+    """
+    before, after = masked[:start], masked[end:]
+    if before.count("(") != before.count(")"):
+        return False
+    where = None
+    for where in _WHERE.finditer(before):
+        pass
+    if where is None or not _CONJ_BEFORE.search(before):
+        return False
+    # WHERE ~ predicate 사이에 BETWEEN 이 있으면 'AND' 가 BETWEEN 의 일부일 수 있음
+    if re.search(r"\bBETWEEN\b", before[where.end():], re.IGNORECASE):
+        return False
+    return bool(_CONJ_AFTER.match(after.lstrip()))
+
+
+def _has_ordinal_order_by(clean: str) -> bool:
+    m = _ORDER_BY.search(clean)
+    if not m:
+        return False
+    return any(_ORDINAL.match(item.strip()) for item in m.group(1).strip().rstrip(";").split(","))
+
+
+def plan_fusion(sql_text: str, param: str) -> FusionPlan | None:
+    """
+    fusion 가능하면 FusionPlan, 아니면 None
+    """
+    ph = _placeholder_re(param)
+
+    # 파라미터는 정확히 1곳에서만 사용
+    if len(re.findall(ph, sql_text)) != 1:
+        return None
+
+    clean = strip_sql_noise(sql_text)
+    if len(_SELECT.findall(clean)) != 1 or _UNSAFE.search(clean):
+        return None
+    # ORDER BY 1 등 순번 정렬은 앞에 추가되는 FUSE_KEY__ 컬럼 기준으로 바뀜
+    if _has_ordinal_order_by(clean):
+        return None
+
+    m = re.search(rf"=\s*(')?{ph}(?(1)')", sql_text)
+    if not m:
+        return None
+
+    start = _lhs_start(sql_text, m.start())
+    key_expr = sql_text[start:m.start()].strip() if start >= 0 else ""
+    if not key_expr or key_expr[0] in "(.":
+        return None
+    if not _top_level_conjunct(_mask(sql_text), start, m.end()):
+        return None
+
+    body = sql_text[:start] + "{FUSE_IN}" + sql_text[m.end():]
+
+    # SELECT 목록 앞에 key 추가. 'SELECT *' 는 단일 테이블이면 <table>.* 로 한정
+    sel = _SELECT.search(body)
+    rest = body[sel.end():]
+    if rest.lstrip().startswith("*"):
+        fm = _FROM_SINGLE.search(body)
+        if not fm:
+            return None
+        after = strip_sql_noise(body[fm.end():]).lstrip()
+        if after.startswith(",") or re.match(r"(?:INNER|LEFT|RIGHT|FULL|CROSS|NATURAL)?\s*JOIN\b",
+                                             after, re.IGNORECASE):
+            return None
+        alias = fm.group(2)
+        qualifier = alias if alias and alias.lower() not in _CLAUSE_WORDS else fm.group(1)
+        star = rest.index("*")
+        rest = f" {key_expr} AS {FUSE_KEY}, {qualifier}.*" + rest[star + 1:]
+    else:
+        rest = f" {key_expr} AS {FUSE_KEY}," + rest
+
+    template = body[:sel.end()] + rest
+    return FusionPlan(param, key_expr, bool(m.group(1)), template)
+
+
+def _literal(value: str, quoted: bool) -> str:
+    v = str(value)
+    return "'" + v.replace("'", "''") + "'" if quoted else v
+
+
+def build_fused_sql(plan: FusionPlan, rendered_template: str, values: list) -> str:
+    """
+    rendered_template: 다른 파라미터까지 치환된 template
+    """
+    in_list = ", ".join(_literal(v, plan.quoted) for v in values)
+    return rendered_template.replace("{FUSE_IN}", f"{plan.key_expr} IN ({in_list})", 1)
+
+
+def fuse_key_str(value) -> str:
+    """
+    DB 가 돌려준 key 값 → 파라미터 문자열 (202401 / Decimal('202401') / '202401')
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y%m%d")
+    return str(value).strip()
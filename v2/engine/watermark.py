@@ -0,0 +1,194 @@
+# file: v2/engine/watermark.py
+
+import json
+import re
+import shutil
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+# =========================================================
+# watermark 기반 incremental export
+#   SQL 헤더:  --@watermark: UPD_DT
+#              --@key: ACCT_NO, SEQ
+#              --@partition: CLS_YYMM     (선택, full 재적재 시 교체 범위)
+#   (또는 job.yml export.incremental: {SQL 파일명: {watermark, key, partition}})
+#
+#   1회차 / full resync : 전체 export → <file>
+#   이후               : WHERE watermark >= 마지막 high watermark → <file>__delta_<ts>
+#   high watermark 는 본 query 실행 전에 조회 (export 중 갱신된 row 는 다음 delta 에 다시 포함)
+#   경계값(>=) 중복 / 재조회 row 는 load 단계에서 key 기준 merge 로 정리 (delta 파일만)
+#   full 파일 재적재는 key 단위가 아니라 partition 값 (없으면 테이블 전체) 을 한 번에 교체
+#   상태: <file>.watermark.json (sql / params 별 1개)
+# =========================================================
+WATERMARK_HEADER = re.compile(r"^\s*--\s*@watermark:\s*(\S+)\s*$", re.MULTILINE | re.IGNORECASE)
+KEY_HEADER = re.compile(r"^\s*--\s*@key:\s*(.+?)\s*$", re.MULTILINE | re.IGNORECASE)
+PARTITION_HEADER = re.compile(r"^\s*--\s*@partition:\s*(.+?)\s*$", re.MULTILINE | re.IGNORECASE)
+
+STATE_SUFFIX = ".watermark.json"
+DELTA_MARK = "__delta_"
+FULL_PENDING = "full_pending"     # full export 시작 ~ 완료 전 state (중단 시 다음 실행도 full)
+
+
+@dataclass(frozen=True)
+class IncrementalSpec:
+    column: str
+    keys: tuple
+    partition: tuple = ()
+
+
+def _split_keys(value) -> tuple:
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(k.strip() for k in (value or []) if str(k).strip())
+
+
+def parse_key_columns(sql_text: str, cfg: dict | None = None) -> tuple:
+    """
+    merge key: job.yml 설정 우선, 없으면 --@key: 헤더
+    """
+    if cfg and cfg.get("key"):
+        return _split_keys(cfg["key"])
+    m = KEY_HEADER.search(sql_text)
+    return _split_keys(m.group(1)) if m else ()
+
+
+def parse_partition_columns(sql_text: str, cfg: dict | None = None) -> tuple:
+    """
+    full 재적재 교체 범위 컬럼: job.yml 설정 우선, 없으면 --@partition: 헤더
+    """
+    if cfg and cfg.get("partition"):
+        return _split_keys(cfg["partition"])
+    m = PARTITION_HEADER.search(sql_text)
+    return _split_keys(m.group(1)) if m else ()
+
+
+def parse_incremental_spec(sql_text: str, cfg: dict | None = None) -> IncrementalSpec | None:
+    column = (cfg or {}).get("watermark")
+    if not column:
+        m = WATERMARK_HEADER.search(sql_text)
+        column = m.group(1) if m else None
+    if not column:
+        return None
+    keys = parse_key_columns(sql_text, cfg)
+    if not keys:
+        # delta 는 경계값(>=) row 를 다시 포함 → key merge 없이 적재하면 매번 중복
+        raise ValueError(f"incremental watermark '{column}' requires merge key (key: / --@key:)")
+    return IncrementalSpec(column, keys, parse_partition_columns(sql_text, cfg))
+
+
+def check_incremental_specs(sql_files, cfg_map: dict) -> dict:
+    """
+    stage 시작 시 검증. 반환: {SQL stem: IncrementalSpec}
+    key 없는 watermark 설정이 있으면 SQL 파일명과 함께 ValueError
+    """
+    specs = {}
+    for p in sql_files:
+        try:
+            spec = parse_incremental_spec(p.read_text(encoding="utf-8"), cfg_map.get(p.stem))
+        except ValueError as e:
+            raise ValueError(f"{p.name}: {e}") from None
+        if spec:
+            specs[p.stem] = spec
+    return specs
+
+
+# ---------------------------
+# State
+# ---------------------------
+def state_path(out_file: Path) -> Path:
+    return out_file.with_name(out_file.name + STATE_SUFFIX)
+
+
+def read_state(out_file: Path) -> dict | None:
+    p = state_path(out_file)
+    if not p.exists():
+        return None
+    try:
+        with open(p, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_state(out_file: Path, state: dict):
+    p = state_path(out_file)
+    tmp = p.with_name(p.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(dict(state, updated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                  f, indent=2, ensure_ascii=False)
+    tmp.replace(p)
+
+
+def encode_watermark(value) -> dict | None:
+    """
+    DB 값 → {"type", "value"} (다음 delta SQL literal 용)
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return {"type": "timestamp", "value": value.isoformat(sep=" ")}
+    if isinstance(value, date):
+        return {"type": "date", "value": value.isoformat()}
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return {"type": "number", "value": str(value)}
+    return {"type": "string", "value": str(value)}
+
+
+def watermark_literal(wm: dict) -> str:
+    v = wm["value"]
+    if wm["type"] == "timestamp":
+        return f"TIMESTAMP '{v}'"
+    if wm["type"] == "date":
+        return f"DATE '{v}'"
+    if wm["type"] == "number":
+        return v
+    return "'" + v.replace("'", "''") + "'"
+
+
+# ---------------------------
+# SQL
+# ---------------------------
+def high_watermark_sql(sql: str, column: str) -> str:
+    return f"SELECT MAX(wm_q.{column}) FROM (\n{sql}\n) wm_q"
+
+
+def delta_sql(sql: str, column: str, wm: dict) -> str:
+    return f"SELECT * FROM (\n{sql}\n) wm_q WHERE wm_q.{column} >= {watermark_literal(wm)}"
+
+
+def query_high_watermark(conn, sql: str) -> dict | None:
+    cur = conn.cursor()
+    try:
+        cur.execute(sql)
+        row = cur.fetchone()
+    finally:
+        cur.close()
+    return encode_watermark(row[0] if row else None)
+
+
+# ---------------------------
+# Delta files
+# ---------------------------
+def delta_file(out_file: Path, ext: str, ts: str) -> Path:
+    base = out_file.name[: -(len(ext) + 1)]
+    return out_file.with_name(f"{base}{DELTA_MARK}{ts}.{ext}")
+
+
+def is_delta_file(path: Path) -> bool:
+    return DELTA_MARK in Path(path).name
+
+
+def archive_deltas(out_file: Path, ext: str, backup_dir: Path) -> int:
+    """
+    full resync 전 기존 delta(+manifest) 를 _backup 으로 이동
+    (오래된 delta 가 새 전체 파일 뒤에 다시 merge 되지 않도록)
+    """
+    base = out_file.name[: -(len(ext) + 1)]
+    moved = 0
+    for p in out_file.parent.glob(f"{base}{DELTA_MARK}*"):
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(p), str(backup_dir / p.name))
+        moved += p.name.endswith(ext)
+    return moved
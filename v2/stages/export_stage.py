@@ -2,17 +2,34 @@
 
 import time
 import re
+import hashlib
 import shutil
 import threading
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import product, groupby
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from v2.adapters.sources.oracle_client import init_oracle_client, get_oracle_conn
 from v2.adapters.sources.vertica_client import get_vertica_conn
 from v2.engine.path_utils import resolve_path
-from v2.engine.sql_utils import sort_sql_files
+from v2.engine.sql_utils import sort_sql_files, resolve_table_name
+from v2.engine.sql_fusion import FusionPlan, plan_fusion, build_fused_sql
 from v2.engine.runtime_state import stop_event
+from v2.engine.progress import progress_registry, StallWatchdog
+from v2.engine.metrics import metrics
+from v2.engine.profiler import profiler
+from v2.engine.process_pool import ProcessExportPool
+from v2.engine.estimators import EstimateCache, EtaTracker, estimate_cache_path
+from util.schema_registry import columns_from_description, register_export_schema
+from util.sql_hash import compute_sql_hash
+from util.manifest import read_manifest, write_manifest
+from util.source_probe import extract_probe_sql, run_probe, probe_unchanged
+from v2.engine.watermark import (
+    WATERMARK_HEADER, FULL_PENDING, parse_incremental_spec, read_state, write_state, high_watermark_sql,
+    delta_sql, query_high_watermark, delta_file, archive_deltas, check_incremental_specs,
+)
 
 
 # ---------------------------
@@ -47,9 +64,25 @@ def get_thread_connection(source_type, env_cfg, host_name):
         raise ValueError(f"Unsupported source type: {source_type}")
 
     _thread_local.conn = conn
+    metrics.inc_gauge("active_connections", 1)
     return conn
 
 
+def drop_thread_connection():
+    """
+    watchdog cancel / abort 된 connection 은 상태를 믿을 수 없으므로 폐기
+    (다음 task 가 새 connection 생성)
+    """
+    conn = getattr(_thread_local, "conn", None)
+    _thread_local.conn = None
+    if conn is not None:
+        metrics.inc_gauge("active_connections", -1)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
 # ---------------------------
 # Param expand
 # ---------------------------
@@ -96,40 +129,79 @@ def expand_range_value(value: str):
     return result
 
 
-def expand_params(params: dict):
-    from itertools import product
+def expand_param_values(params: dict) -> dict:
+    """
+    파라미터별 값 목록 (range / comma 확장). 조합(product)은 만들지 않음
+    """
     import logging
 
     logger = logging.getLogger(__name__)
 
-    multi_keys = []
-    values = []
+    values = {}
 
     for k, v in params.items():
         v_str = str(v).strip()
-        multi_keys.append(k)
 
         if ":" in v_str:
             expanded = expand_range_value(v_str)
             logger.info("Param expand | %s -> %d values", v_str, len(expanded))
-            values.append(expanded)
+            values[k] = expanded
 
         elif "," in v_str:
             split_vals = [x.strip() for x in v_str.split(",")]
             logger.info("Param expand | %s -> %d values", v_str, len(split_vals))
-            values.append(split_vals)
+            values[k] = split_vals
 
         else:
             logger.info("Param expand | %s -> 1 value", v_str)
-            values.append([v_str])
+            values[k] = [v_str]
+
+    return values
+
+
+def expand_params(params: dict):
+    values = expand_param_values(params)
+    keys = list(values)
 
     expanded = []
-    for combo in product(*values):
-        expanded.append(dict(zip(multi_keys, combo)))
+    for combo in product(*values.values()):
+        expanded.append(dict(zip(keys, combo)))
 
     return expanded
 
 
+def used_params(sql_text: str, params: dict) -> dict:
+    """
+    SQL 안에서 실제 사용하는 파라미터만 (${k} / {#k} / :k)
+    """
+    used = {}
+    for k, v in params.items():
+        if (
+            f"${{{k}}}" in sql_text
+            or f"{{#{k}}}" in sql_text
+            or re.search(rf"(?<!:):{re.escape(k)}\b", sql_text)
+        ):
+            used[k] = v
+    return used
+
+
+def build_sql_param_sets(sql_text: str, param_values: dict) -> list:
+    """
+    SQL 이 참조하는 파라미터만으로 조합 생성
+    (사용 파라미터가 없으면 [{}] → 1회 실행)
+    """
+    return list(iter_sql_param_sets(sql_text, param_values))
+
+
+def iter_sql_param_sets(sql_text: str, param_values: dict):
+    """
+    build_sql_param_sets 의 lazy 버전 (조합 전체를 list 로 만들지 않음)
+    """
+    keys = list(used_params(sql_text, param_values))
+    for combo in product(*(param_values[k] for k in keys)):
+        yield dict(zip(keys, combo))
+
+
 # ---------------------------
 # Helpers
 # ---------------------------
@@ -204,98 +276,497 @@ def build_log_prefix(sql_file: Path, params: dict) -> str:
 
 
 # ---------------------------
-# Stage entry
+# Export task (SQL 별 파라미터 조합 + 렌더링 결과 dedup)
 # ---------------------------
-def run(ctx):
-    logger = ctx.logger
-    job_cfg = ctx.job_config
-    env_cfg = ctx.env_config
+@dataclass(slots=True)
+class ExportTask:
+    sql_file: Path
+    params: dict                 # SQL 이 사용하는 파라미터만
+    rendered_sql: str
+    out_file: Path
+    copies: list = field(default_factory=list)   # [(sql_file, params, out_file)] 같은 결과를 받을 다른 파일
 
-    if ctx.mode == "plan":
-        logger.info("EXPORT stage skipped (plan mode)")
-        return
 
-    export_cfg = job_cfg.get("export")
-    if not export_cfg:
-        logger.info("EXPORT stage skipped (no config)")
-        return
+@dataclass
+class ExportTaskPlan:
+    """
+    1차 pass 결과: 렌더링 SQL 전체 대신 digest 만 보관 → task 수가 많아도 메모리 작음
+    """
+    n_tasks: int = 0
+    n_files: int = 0
+    dup_index: set = field(default_factory=set)     # 다른 task 의 copy 로 처리될 조합 순번
+    copies: dict = field(default_factory=dict)      # 첫 조합 순번 -> [(sql_file, params, out_file)]
 
-    sql_dir = resolve_path(ctx, export_cfg["sql_dir"])
-    out_dir = resolve_path(ctx, export_cfg["out_dir"]) / ctx.job_name
-    out_dir.mkdir(parents=True, exist_ok=True)
 
-    source_sel = job_cfg.get("source", {})
-    source_type = source_sel.get("type", "oracle")
-    host_name = source_sel.get("host")
+def _iter_rendered(sql_files: list, param_values: dict):
+    """
+    (순번, sql_file, params, 렌더링 SQL) 을 SQL 파일 순서대로 lazy 생성
+    """
+    n = 0
+    for sql_file in sql_files:
+        sql_text = sql_file.read_text(encoding="utf-8")
+        for param_set in iter_sql_param_sets(sql_text, param_values):
+            yield n, sql_file, param_set, sanitize_sql(_render_sql(sql_text, param_set))
+            n += 1
 
-    sql_files = sort_sql_files(sql_dir)
-    if not sql_files:
-        logger.warning("No SQL files found in %s", sql_dir)
-        return
 
-    param_sets = expand_params(ctx.params)
+def plan_export_tasks(sql_files: list, param_values: dict, host_name: str,
+                      ext: str, out_dir: Path) -> ExportTaskPlan:
+    """
+    렌더링 SQL digest 로 dedup 대상만 미리 계산 (task 객체는 만들지 않음)
+    """
+    plan = ExportTaskPlan()
+    first_by_digest = {}
 
-    fmt = export_cfg.get("format", "csv")
-    compression = export_cfg.get("compression", "none")
-    overwrite = export_cfg.get("overwrite", False)
-    backup_keep = export_cfg.get("backup_keep", 10)
-    parallel_workers = export_cfg.get("parallel_workers", 1)
+    for n, sql_file, param_set, rendered_sql in _iter_rendered(sql_files, param_values):
+        plan.n_files += 1
+        digest = hashlib.blake2b(rendered_sql.encode("utf-8"), digest_size=16).digest()
 
-    ext = "csv.gz" if compression == "gzip" else "csv"
+        first = first_by_digest.setdefault(digest, n)
+        if first == n:
+            plan.n_tasks += 1
+            continue
 
-    stall_seconds = 30 * 60
+        out_file = out_dir / build_csv_name(sql_file.stem, host_name, param_set, ext)
+        plan.dup_index.add(n)
+        plan.copies.setdefault(first, []).append((sql_file, param_set, out_file))
 
-    def _export_one(sql_file, param_set, idx, total_sql, param_idx, total_param):
+    return plan
 
-        if stop_event.is_set():
-            logger.warning("Export interrupted before start")
-            return
 
-        prefix = build_log_prefix(sql_file, param_set)
+def iter_export_tasks(sql_files: list, param_values: dict, host_name: str,
+                      ext: str, out_dir: Path, plan: ExportTaskPlan | None = None):
+    """
+    - 파일명에는 SQL 이 사용하는 파라미터만 포함
+    - 렌더링 SQL 이 같으면 1회 실행, 나머지 파일명은 copies 로 연결
+    - 실행 직전에 필요한 만큼만 task 생성 (submit window 와 함께 사용)
+    """
+    if plan is None:
+        plan = plan_export_tasks(sql_files, param_values, host_name, ext, out_dir)
 
-        try:
-            conn = get_thread_connection(source_type, env_cfg, host_name)
+    for n, sql_file, param_set, rendered_sql in _iter_rendered(sql_files, param_values):
+        if n in plan.dup_index:
+            continue
+        out_file = out_dir / build_csv_name(sql_file.stem, host_name, param_set, ext)
+        yield ExportTask(sql_file, param_set, rendered_sql, out_file, plan.copies.get(n, []))
+
+
+def build_export_tasks(sql_files: list, param_values: dict, host_name: str,
+                       ext: str, out_dir: Path) -> list:
+    return list(iter_export_tasks(sql_files, param_values, host_name, ext, out_dir))
+
+
+def materialize_copy(src: Path, dst: Path, params: dict):
+    """
+    dedup 된 export 결과를 다른 파일명으로 복사 (manifest 도 params 만 바꿔 기록)
+    """
+    tmp = dst.with_name(dst.name + ".tmp")
+    shutil.copyfile(src, tmp)
+    tmp.replace(dst)
+
+    m = read_manifest(src)
+    if m:
+        write_manifest(
+            dst,
+            rows=m["rows"],
+            columns=m["columns"],
+            sha256=m["sha256"],
+            sql_hash=m.get("sql_hash", ""),
+            params=params,
+            elapsed_sec=0.0,
+        )
+
+
+# ---------------------------
+# Query fusion (opt-in)
+# ---------------------------
+@dataclass
+class FusedExportTask:
+    sql_file: Path
+    plan: FusionPlan
+    template: str                # fusion 파라미터 외 나머지 치환 완료
+    members: list                # [ExportTask] fusion 파라미터 값만 다른 task
+
+
+def build_fused_tasks(tasks, param_values: dict, fusion_cfg: dict) -> list:
+    return list(iter_fused_tasks(tasks, param_values, fusion_cfg))
+
+
+def iter_fused_tasks(tasks, param_values: dict, fusion_cfg: dict):
+    """
+    SQL 별로 값이 여러 개인 파라미터 중 fusion 가능한 것(값 개수 많은 순)을 골라
+    나머지 파라미터가 같은 task 를 max_values 단위로 묶음
+    tasks 는 sql_file 순서로 들어온다고 가정 → SQL 1개 분량만 메모리에 보관
+    """
+    allowed = set(fusion_cfg.get("params") or [])
+    max_values = int(fusion_cfg.get("max_values", 100))
+
+    exclude = set(fusion_cfg.get("exclude") or [])
+
+    for sql_file, group in groupby(tasks, key=lambda t: t.sql_file):
+        group = list(group)
+        raw = sql_file.read_text(encoding="utf-8")
+
+        # probe / watermark 가 있는 SQL 은 값별 상태를 따로 봐야 하므로 fusion 제외
+        if sql_file.stem in exclude or extract_probe_sql(raw) or WATERMARK_HEADER.search(raw):
+            yield from group
+            continue
+
+        candidates = sorted(
+            (k for k in used_params(raw, param_values)
+             if len(param_values[k]) > 1 and (not allowed or k in allowed)),
+            key=lambda k: -len(param_values[k]),
+        )
+        plan = next((p for p in (plan_fusion(raw, k) for k in candidates) if p), None)
+        if plan is None:
+            yield from group
+            continue
+
+        buckets = {}
+        for t in group:
+            others = tuple(sorted((k, v) for k, v in t.params.items() if k != plan.param))
+            buckets.setdefault(others, []).append(t)
+
+        for others, members in buckets.items():
+            template = _render_sql(plan.template, dict(others))
+            for i in range(0, len(members), max_values):
+                chunk = members[i:i + max_values]
+                if len(chunk) < 2:
+                    yield from chunk
+                else:
+                    yield FusedExportTask(sql_file, plan, template, chunk)
 
-            if source_type == "vertica":
-                from v2.adapters.sources.vertica_source import export_sql_to_csv as export_func
-            else:
-                from v2.adapters.sources.oracle_source import export_sql_to_csv as export_func
 
-            csv_name = build_csv_name(
-                sqlname=sql_file.stem,
-                host=host_name,
-                params=param_set,
-                ext=ext,
+# ---------------------------
+# Estimate 순서 (preflight cache)
+# ---------------------------
+def estimated_rows(unit, cache: EstimateCache) -> int | None:
+    """
+    preflight 예상 row 수 (fused task 는 member 합). 하나라도 모르면 None
+    """
+    members = unit.members if isinstance(unit, FusedExportTask) else [unit]
+    total = 0
+    for t in members:
+        e = cache.get(compute_sql_hash(t.rendered_sql), fresh=False)
+        if e is None or e.get("rows") is None:
+            return None
+        total += e["rows"]
+    return total
+
+
+def order_by_estimate(units, cache: EstimateCache) -> tuple[list, list]:
+    """
+    예상 row 큰 순 (LPT) 정렬. 예상치 없는 task 는 아는 값의 중앙값으로 취급
+    반환: (units, weights) 같은 순서
+    """
+    items = [(u, estimated_rows(u, cache)) for u in units]
+    known = sorted(r for _, r in items if r is not None)
+    fill = known[len(known) // 2] if known else 1
+    items = [(u, r if r is not None else fill) for u, r in items]
+    items.sort(key=lambda x: x[1], reverse=True)
+    return [u for u, _ in items], [r for _, r in items]
+
+
+# ---------------------------
+# Task runner
+# ---------------------------
+def make_schema_recorder(opts, sql_file: Path, prefix: str, logger):
+    def _record_schema(description):
+        # schema registry: job_name 을 schema 로, load 와 같은 테이블명 사용
+        try:
+            columns = columns_from_description(description, oracle=opts.source_type != "vertica")
+            _, drift = register_export_schema(
+                opts.job_name, resolve_table_name(sql_file), columns,
+                source=f"{sql_file.name}|{opts.host_name}",
             )
+            if drift:
+                logger.warning("%s TYPE DRIFT | %s", prefix, "; ".join(drift))
+        except Exception as e:
+            logger.warning("%s schema registry skipped: %s", prefix, e)
+    return _record_schema
 
-            out_file = out_dir / csv_name
 
-            if out_file.exists() and not overwrite:
-                logger.info("%s skip (already exists)", prefix)
-                return
+def prepare_export_targets(task: ExportTask, opts, logger, prefix: str,
+                           force: bool = False) -> bool:
+    """
+    실행 전 대상 파일 정리. 쿼리 실행이 필요하면 True
+      - overwrite / force(probe 변경): 기존 파일 백업 후 전부 재생성
+      - 전부 있음: skip
+      - 일부만 있음: 있는 파일에서 복사 (dedup)
+    """
+    targets = [(task.sql_file, task.params, task.out_file)] + task.copies
+
+    if opts.overwrite or force:
+        for _, _, f in targets:
+            if f.exists():
+                backup_existing_file(f, opts.out_dir / "_backup", keep=opts.backup_keep)
+        missing = targets
+    else:
+        missing = [t for t in targets if not t[2].exists()]
+
+    if not missing:
+        logger.info("%s skip (already exists)", prefix)
+        for _, _, f in targets:
+            metrics.task_end("export", f.name, "skipped", elapsed=0)
+        return False
+
+    # 이미 있는 결과 파일이 있으면 재실행 없이 복사만
+    existing = [t for t in targets if t not in missing]
+    if existing:
+        src = existing[0][2]
+        for _, params, f in missing:
+            materialize_copy(src, f, params)
+            logger.info("%s copy (dedup) -> %s", prefix, f.name)
+        return False
+
+    return True
+
+
+_sql_headers = {}
+
+
+def _sql_header(sql_file: Path) -> tuple:
+    """
+    SQL 헤더 주석 (--@probe: / --@watermark: / --@key:) 파싱 결과 (파일별 1회)
+    """
+    if sql_file not in _sql_headers:
+        raw = sql_file.read_text(encoding="utf-8")
+        _sql_headers[sql_file] = (extract_probe_sql(raw), parse_incremental_spec(raw))
+    return _sql_headers[sql_file]
+
+
+def task_probe_sql(opts, task: ExportTask) -> str | None:
+    """
+    job.yml export.probe ({SQL 파일명: probe SQL}) → 없으면 SQL 헤더 --@probe:
+    본 SQL 과 같은 파라미터로 렌더링
+    """
+    raw = opts.probes.get(task.sql_file.stem)
+    if raw is None:
+        raw = _sql_header(task.sql_file)[0]
+    return sanitize_sql(_render_sql(raw, task.params)) if raw else None
+
+
+def task_incremental(opts, task):
+    """
+    watermark 설정: job.yml export.incremental 우선, 없으면 SQL 헤더 --@watermark:
+    """
+    cfg = opts.incremental.get(task.sql_file.stem)
+    if cfg:
+        return parse_incremental_spec(task.sql_file.read_text(encoding="utf-8"), cfg)
+    return _sql_header(task.sql_file)[1]
+
+
+def incremental_mode(task: ExportTask, full_resync: bool) -> tuple:
+    """
+    반환: (마지막 watermark, full export 여부) - DB 조회 없이 state 파일만 확인 (plan 모드 공용)
+    """
+    state = read_state(task.out_file) or {}
+    last = state.get("watermark")
+    full = (full_resync or last is None or not task.out_file.exists()
+            or state.get("mode") == FULL_PENDING)
+    return last, full
+
+
+def plan_incremental(task: ExportTask, spec, opts, conn, logger, prefix: str):
+    """
+    incremental task 의 이번 실행 대상
+    반환: (실행 SQL, 출력 파일, 새 watermark, full 여부) / 새 row 없으면 None
+    """
+    last, full = incremental_mode(task, opts.full_resync)
+
+    sql = task.rendered_sql if full else delta_sql(task.rendered_sql, spec.column, last)
+
+    # high watermark 는 본 query 전에 조회 → export 중 갱신된 row 는 다음 delta 에 포함
+    new_wm = query_high_watermark(conn, high_watermark_sql(sql, spec.column))
+
+    if full:
+        # 완료 전까지 full_pending → 중단 / 실패 시 다음 실행도 full (잘린 base 뒤에 delta 만 붙지 않도록)
+        write_state(task.out_file, {
+            "sql": task.sql_file.name,
+            "params": task.params,
+            "column": spec.column,
+            "watermark": None,
+            "mode": FULL_PENDING,
+        })
+        backup_dir = opts.out_dir / "_backup"
+        if task.out_file.exists():
+            backup_existing_file(task.out_file, backup_dir, keep=opts.backup_keep)
+        archived = archive_deltas(task.out_file, opts.ext, backup_dir)
+        logger.info("%s INCREMENTAL full | %s <= %s%s", prefix, spec.column,
+                    new_wm["value"] if new_wm else "-",
+                    f" | archived deltas={archived}" if archived else "")
+        return sql, task.out_file, new_wm, True
+
+    if new_wm is None or new_wm == last:
+        logger.info("%s INCREMENTAL skip (no rows past %s=%s)", prefix, spec.column, last["value"])
+        metrics.task_end("export", task.out_file.name, "skipped", elapsed=0)
+        return None
+
+    out_file = delta_file(task.out_file, opts.ext, datetime.now().strftime("%Y%m%d_%H%M%S"))
+    logger.info("%s INCREMENTAL delta | %s >= %s (high=%s) -> %s", prefix, spec.column,
+                last["value"], new_wm["value"], out_file.name)
+    if task.copies:
+        logger.warning("%s dedup copies are refreshed on full export only", prefix)
+    return sql, out_file, new_wm, False
+
+
+def skip_if_probe_unchanged(task: ExportTask, fingerprint: str, logger, prefix: str) -> bool:
+    """
+    마지막 성공 export 의 probe 값과 같으면 skip 기록 후 True
+    """
+    others = [c[2] for c in task.copies]
+    if not probe_unchanged(task.out_file, fingerprint, others):
+        if task.out_file.exists():
+            logger.info("%s source changed (probe) -> re-export", prefix)
+        return False
+
+    logger.info("%s skip (source unchanged, probe)", prefix)
+    for f in [task.out_file] + others:
+        metrics.task_end("export", f.name, "skipped", elapsed=0)
+    return True
+
+
+def finish_export_copies(task: ExportTask, logger, prefix: str):
+    """
+    같은 렌더링 SQL 을 쓰는 다른 파일명 (SQL 파일 간 / 파라미터 조합 간 dedup)
+    """
+    if task.out_file.exists():
+        for _, c_params, c_file in task.copies:
+            materialize_copy(task.out_file, c_file, c_params)
+            logger.info("%s copy (dedup) -> %s", prefix, c_file.name)
+
+
+@dataclass
+class ExportOptions:
+    """
+    task 실행에 필요한 설정 (process worker 로 넘길 수 있도록 pickle 가능한 값만)
+    """
+    job_name: str
+    source_type: str
+    host_name: str
+    env_cfg: dict
+    out_dir: Path
+    compression: str = "none"
+    overwrite: bool = False
+    backup_keep: int = 10
+    stall_seconds: float = 30 * 60
+    probes: dict = field(default_factory=dict)      # {SQL stem: probe SQL} (job.yml export.probe)
+    incremental: dict = field(default_factory=dict) # {SQL stem: {"watermark", "key"}} (job.yml export.incremental)
+    full_resync: bool = False
+    ext: str = "csv"
+
+
+def make_task_runner(opts: ExportOptions, logger):
+    """
+    _export_one(task, idx, total) 생성. thread 실행 / process worker 가 같은 함수 사용
+    """
+    source_type = opts.source_type
+    host_name = opts.host_name
+    env_cfg = opts.env_cfg
+    out_dir = opts.out_dir
+    compression = opts.compression
+    overwrite = opts.overwrite
+    backup_keep = opts.backup_keep
+    stall_seconds = opts.stall_seconds
+
+    if source_type == "vertica":
+        from v2.adapters.sources.vertica_source import export_sql_to_csv as export_func
+    else:
+        from v2.adapters.sources.oracle_source import export_sql_to_csv as export_func
+
+    def _schema_recorder(sql_file, prefix):
+        return make_schema_recorder(opts, sql_file, prefix, logger)
+
+    def _export_one(task, idx, total):
+        metrics.inc_gauge("export_queue_depth", -1)
+
+        if stop_event.is_set():
+            logger.warning("Export interrupted before start")
+            return
+
+        if isinstance(task, FusedExportTask):
+            _export_fused(task, idx, total)
+        else:
+            _export_single(task, idx, total)
+
+    def _export_single(task, idx, total):
+        sql_file = task.sql_file
+        prefix = build_log_prefix(sql_file, task.params)
+        progress = None
+
+        try:
+            fingerprint = None
+            inc = task_incremental(opts, task)
+            sql_text = task.rendered_sql
+            out_file = task.out_file
+
+            if inc is not None:
+                # watermark incremental: 1회차 / full resync 는 전체, 이후 delta 파일
+                conn = get_thread_connection(source_type, env_cfg, host_name)
+                planned = plan_incremental(task, inc, opts, conn, logger, prefix)
+                if planned is None:
+                    return
+                sql_text, out_file, new_wm, full = planned
+            else:
+                # source 변경 probe: 값이 같으면 본 query 생략, 다르면 기존 파일 백업 후 재-export
+                probe_sql = task_probe_sql(opts, task)
+                if probe_sql:
+                    try:
+                        fingerprint = run_probe(
+                            get_thread_connection(source_type, env_cfg, host_name), probe_sql)
+                    except Exception as e:
+                        logger.warning("%s probe failed (export as usual): %s", prefix, e)
+                    if fingerprint and skip_if_probe_unchanged(task, fingerprint, logger, prefix):
+                        return
+
+                if not prepare_export_targets(task, opts, logger, prefix, force=bool(fingerprint)):
+                    return
 
-            if out_file.exists() and overwrite:
-                backup_existing_file(out_file, out_dir / "_backup", keep=backup_keep)
+            conn = get_thread_connection(source_type, env_cfg, host_name)
+            csv_name = out_file.name
 
             logger.info(
-                "%s EXPORT start [%d/%d] param[%d/%d]",
-                prefix, idx, total_sql, param_idx, total_param
+                "%s EXPORT start [%d/%d]%s",
+                prefix, idx, total,
+                f" (+{len(task.copies)} dedup)" if task.copies else "",
             )
 
-            sql_text = sql_file.read_text(encoding="utf-8")
-            rendered_sql = sanitize_sql(_render_sql(sql_text, param_set))
-
             start_time = time.time()
 
+            # watchdog 감시 대상 등록 (key = 출력 파일명)
+            progress = progress_registry.start(csv_name, conn)
+            profiler.task_begin("export", csv_name)
+
             rows = export_func(
                 conn=conn,
-                sql_text=rendered_sql,
+                sql_text=sql_text,
                 out_file=out_file,
                 logger=logger,
                 compression=compression,
                 fetch_size=10000,
                 stall_seconds=stall_seconds,
+                on_describe=_schema_recorder(sql_file, prefix),
+                manifest={"sql_hash": compute_sql_hash(sql_text), "params": task.params,
+                          "probe": fingerprint},
+                progress=progress,
             )
+            progress_registry.finish(csv_name, "done")
+
+            if inc is not None:
+                # 중단으로 일부만 기록된 경우 watermark 를 올리지 않음 (다음 실행에서 다시 조회)
+                if not stop_event.is_set():
+                    write_state(task.out_file, {
+                        "sql": sql_file.name,
+                        "params": task.params,
+                        "column": inc.column,
+                        "watermark": new_wm,
+                        "last_file": out_file.name,
+                        "mode": "full" if full else "delta",
+                    })
+                if full:
+                    finish_export_copies(task, logger, prefix)
+            else:
+                finish_export_copies(task, logger, prefix)
 
             elapsed = time.time() - start_time
             size_mb = out_file.stat().st_size / (1024 * 1024) if out_file.exists() else 0
@@ -309,28 +780,369 @@ def run(ctx):
             )
 
         except Exception as e:
+            if progress is not None:
+                progress_registry.finish(progress.key, "failed")
+                if progress.cancelled:
+                    drop_thread_connection()
+                    logger.error("%s EXPORT failed: %s", prefix, e)
+                    return
             logger.exception("%s EXPORT failed: %s", prefix, e)
 
-    logger.info("Parallel workers=%d", parallel_workers)
+        finally:
+            profiler.task_end()
+
+    def _export_fused(task, idx, total):
+        from v2.adapters.sources.fused_source import export_fused_to_csv
+
+        plan = task.plan
+        first = task.members[0]
+        prefix = build_log_prefix(task.sql_file, {k: v for k, v in first.params.items()
+                                                  if k != plan.param})
+        progress = None
+        pending = []
+        fallback = False
+
+        try:
+            # member 별: primary 파일 없으면 실행 대상, 있으면 빠진 dedup 복사만
+            for m in task.members:
+                targets = [m.out_file] + [c[2] for c in m.copies]
+                if overwrite:
+                    for f in targets:
+                        if f.exists():
+                            backup_existing_file(f, out_dir / "_backup", keep=backup_keep)
+                    pending.append(m)
+                elif not m.out_file.exists():
+                    pending.append(m)
+                else:
+                    for _, c_params, c_file in m.copies:
+                        if not c_file.exists():
+                            materialize_copy(m.out_file, c_file, c_params)
+                            logger.info("%s copy (dedup) -> %s", prefix, c_file.name)
+
+            if not pending:
+                logger.info("%s skip (already exists) | fused %s x%d",
+                            prefix, plan.param, len(task.members))
+                for m in task.members:
+                    metrics.task_end("export", m.out_file.name, "skipped", elapsed=0)
+                return
+
+            if len(pending) == 1:
+                _export_single(pending[0], idx, total)
+                return
+
+            by_value = {str(m.params[plan.param]): m for m in pending}
+            sql_text = sanitize_sql(build_fused_sql(plan, task.template, list(by_value)))
+
+            conn = get_thread_connection(source_type, env_cfg, host_name)
+
+            logger.info(
+                "%s EXPORT start [%d/%d] | fused %s IN (%s) x%d",
+                prefix, idx, total, plan.param, ", ".join(by_value), len(by_value),
+            )
+
+            start_time = time.time()
+
+            key = f"{task.sql_file.stem}__fused_{next(iter(by_value))}_x{len(by_value)}"
+            progress = progress_registry.start(key, conn)
+            profiler.task_begin("export", key)
+
+            rows_by_value = export_fused_to_csv(
+                conn=conn,
+                sql_text=sql_text,
+                out_files={v: m.out_file for v, m in by_value.items()},
+                logger=logger,
+                compression=compression,
+                fetch_size=10000,
+                oracle=source_type != "vertica",
+                on_describe=_schema_recorder(task.sql_file, prefix),
+                manifests={
+                    v: {"sql_hash": compute_sql_hash(m.rendered_sql), "params": m.params}
+                    for v, m in by_value.items()
+                },
+                progress=progress,
+            )
+            progress_registry.finish(key, "done")
+
+            for m in by_value.values():
+                for _, c_params, c_file in m.copies:
+                    materialize_copy(m.out_file, c_file, c_params)
+                    logger.info("%s copy (dedup) -> %s", prefix, c_file.name)
+
+            elapsed = time.time() - start_time
+            logger.info(
+                "%s EXPORT done (fused) rows=%d files=%d elapsed=%.2fs | %s",
+                prefix,
+                sum(rows_by_value.values()),
+                len(rows_by_value),
+                elapsed,
+                ", ".join(f"{v}={n}" for v, n in rows_by_value.items()),
+            )
+
+        except Exception as e:
+            retry = bool(pending) and not stop_event.is_set()
+            if progress is not None:
+                # fallback 하는 경우 실패 집계는 값별 단건 export 결과로
+                progress_registry.finish(progress.key, "fallback" if retry else "failed")
+                if progress.cancelled:
+                    drop_thread_connection()
+                    logger.error("%s EXPORT failed (fused): %s", prefix, e)
+                    return
+            if not retry:
+                logger.exception("%s EXPORT failed (fused): %s", prefix, e)
+                return
+            # key 정규화 불일치 등 → 값별 단건 export 로 재시도 (tmp 만 썼으므로 파일 충돌 없음)
+            logger.warning("%s EXPORT failed (fused), fallback to per-value x%d: %s",
+                           prefix, len(pending), e)
+            fallback = True
 
-    tasks = []
-    for idx, sql_file in enumerate(sql_files, 1):
-        for param_idx, param_set in enumerate(param_sets, 1):
-            tasks.append((sql_file, param_set, idx, len(sql_files), param_idx, len(param_sets)))
+        finally:
+            profiler.task_end()
 
-    if parallel_workers <= 1:
-        for t in tasks:
+        for m in (pending if fallback else []):
             if stop_event.is_set():
-                logger.warning("EXPORT stopped by user")
+                logger.warning("%s Export interrupted (fused fallback)", prefix)
                 break
-            _export_one(*t)
-    else:
-        with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-            futures = [executor.submit(_export_one, *t) for t in tasks]
-            for f in as_completed(futures):
+            _export_single(m, idx, total)
+
+    return _export_one
+
+
+# ---------------------------
+# Stage entry
+# ---------------------------
+def run(ctx):
+    logger = ctx.logger
+    job_cfg = ctx.job_config
+    env_cfg = ctx.env_config
+
+    if ctx.mode == "plan":
+        logger.info("EXPORT stage skipped (plan mode)")
+        return
+
+    export_cfg = job_cfg.get("export")
+    if not export_cfg:
+        logger.info("EXPORT stage skipped (no config)")
+        return
+
+    sql_dir = resolve_path(ctx, export_cfg["sql_dir"])
+    out_dir = resolve_path(ctx, export_cfg["out_dir"]) / ctx.job_name
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    source_sel = job_cfg.get("source", {})
+    source_type = source_sel.get("type", "oracle")
+    host_name = source_sel.get("host")
+
+    sql_files = sort_sql_files(sql_dir)
+    if not sql_files:
+        logger.warning("No SQL files found in %s", sql_dir)
+        return
+
+    param_values = expand_param_values(ctx.params)
+
+    fmt = export_cfg.get("format", "csv")
+    compression = export_cfg.get("compression", "none")
+    overwrite = export_cfg.get("overwrite", False)
+    backup_keep = export_cfg.get("backup_keep", 10)
+    parallel_workers = export_cfg.get("parallel_workers", 1)
+    executor_kind = export_cfg.get("executor", "thread")     # thread | process | async
+
+    ext = "csv.gz" if compression == "gzip" else "csv"
+
+    stall_seconds = export_cfg.get("stall_seconds", 30 * 60)
+    watchdog_interval = export_cfg.get("watchdog_interval", 5)
+
+    fusion_cfg = export_cfg.get("fusion") or {}
+    if fusion_cfg is True:
+        fusion_cfg = {"enabled": True}
+
+    # source 변경 probe / watermark incremental (SQL 헤더 보다 job.yml 우선)
+    probes = {Path(k).stem: v for k, v in (export_cfg.get("probe") or {}).items()}
+    incremental = {Path(k).stem: v for k, v in (export_cfg.get("incremental") or {}).items()}
+    check_incremental_specs(sql_files, incremental)     # merge key 없는 watermark 설정은 시작 전에 실패
+    full_resync = bool(export_cfg.get("full_resync", False))
+    if probes or incremental:
+        fusion_cfg = dict(fusion_cfg, exclude=list(fusion_cfg.get("exclude") or [])
+                          + list(probes) + list(incremental))
+    if full_resync:
+        logger.info("EXPORT full resync (incremental SQL watermark reset)")
+
+    opts = ExportOptions(
+        job_name=ctx.job_name,
+        source_type=source_type,
+        host_name=host_name,
+        env_cfg=env_cfg,
+        out_dir=out_dir,
+        compression=compression,
+        overwrite=overwrite,
+        backup_keep=backup_keep,
+        stall_seconds=stall_seconds,
+        probes=probes,
+        incremental=incremental,
+        full_resync=full_resync,
+        ext=ext,
+    )
+    _export_one = make_task_runner(opts, logger)
+
+    if executor_kind == "async":
+        from v2.engine.async_export import async_supported
+        reason = async_supported(opts)
+        if reason:
+            logger.warning("Async executor unavailable (%s) → thread executor", reason)
+            executor_kind = "thread"
+
+    logger.info("Parallel workers=%d | executor=%s", parallel_workers, executor_kind)
+
+    # SQL 별로 사용하는 파라미터만 조합 → 렌더링 결과 같은 조합은 1회 실행
+    # 1차 pass 는 digest 만 계산, task 는 submit 직전에 generator 로 생성
+    task_plan = plan_export_tasks(sql_files, param_values, host_name, ext, out_dir)
+    logger.info(
+        "EXPORT tasks=%d | files=%d | sql=%d | dedup=%d",
+        task_plan.n_tasks, task_plan.n_files, len(sql_files),
+        task_plan.n_files - task_plan.n_tasks,
+    )
+
+    def _iter_units():
+        units = iter_export_tasks(sql_files, param_values, host_name, ext, out_dir, task_plan)
+        if fusion_cfg.get("enabled"):
+            # query fusion: 파라미터 값만 다른 task → IN 목록 1회 실행 후 값별 파일 분리
+            units = iter_fused_tasks(units, param_values, fusion_cfg)
+        return units
+
+    # order: estimate → preflight 예상 row 큰 순으로 실행 (task 목록을 메모리에 올림)
+    ordered = weights = eta = None
+    if export_cfg.get("order", "sql") == "estimate":
+        cache = EstimateCache(estimate_cache_path(out_dir, job_cfg.get("preflight") or {}))
+        ordered, weights = order_by_estimate(_iter_units(), cache)
+        eta = EtaTracker(sum(weights))
+        logger.info("EXPORT order=estimate | units=%d | est_rows=%d", len(ordered), sum(weights))
+
+    def _units():
+        return iter(ordered) if ordered is not None else _iter_units()
+
+    total = task_plan.n_tasks
+    if fusion_cfg.get("enabled"):
+        total = n_fused = 0
+        for u in _units():
+            total += 1
+            n_fused += isinstance(u, FusedExportTask)
+        logger.info(
+            "EXPORT fusion | queries=%d -> %d | fused=%d",
+            task_plan.n_tasks, total, n_fused,
+        )
+
+    def _task_done(i):
+        # 예상 row 가중 ETA (order: estimate 일 때만)
+        if eta is None:
+            return
+        if i is not None:
+            eta.done(weights[i - 1])
+        eta.maybe_log(logger, total)
+        sec = eta.eta_sec()
+        if sec is not None:
+            metrics.set_gauge("export_eta_sec", round(sec, 1))
+
+    metrics.set_gauge("export_queue_depth", total)
+
+    # 동시에 submit 해 두는 task 수 상한 (나머지는 generator 에 남아 있음 → 중지 시 즉시 정리)
+    max_inflight = max(int(export_cfg.get("max_inflight") or parallel_workers * 2), parallel_workers)
+
+    # stall watchdog: 블록된 execute/fetch 를 conn.cancel() 로 해제 → worker slot 반환
+    progress_registry.clear()
+    watchdog = StallWatchdog(progress_registry, stall_seconds, log=logger,
+                             interval=watchdog_interval)
+    watchdog.start()
+    logger.info("Watchdog started | stall_seconds=%s interval=%ss", stall_seconds, watchdog_interval)
+
+    submitted = 0
+
+    try:
+        if executor_kind == "async":
+            # event loop 1개에서 수백 개 query 동시 대기 (host 별 semaphore)
+            from v2.engine.async_export import run_async_exports
+            submitted = run_async_exports(
+                _units(), total, opts, logger, export_cfg.get("async") or {}, _export_one,
+                on_done=_task_done,
+            )
+        elif parallel_workers <= 1:
+            for i, t in enumerate(_units(), 1):
                 if stop_event.is_set():
-                    logger.warning("EXPORT cancelled")
+                    logger.warning("EXPORT stopped by user")
                     break
-                f.result()
+                submitted = i
+                _export_one(t, i, total)
+                _task_done(i)
+        else:
+            logger.info("Submit window=%d", max_inflight)
+            units = enumerate(_units(), 1)
+            inflight = set()
+            index_of = {}
+            exhausted = False
+
+            if executor_kind == "process":
+                # worker 별 process (자체 connection / logger) → csv encode / gzip 이 GIL 을 나눠 쓰지 않음
+                pool = ProcessExportPool(parallel_workers, make_task_runner, opts, logger,
+                                         watchdog_interval=watchdog_interval)
+                submit = lambda t, i: pool.submit(t, i, total)
+                collect, request_stop = pool.collect, pool.request_stop
+            else:
+                pool = ThreadPoolExecutor(max_workers=parallel_workers)
+                submit = lambda t, i: pool.submit(_export_one, t, i, total)
+                collect = lambda f: f.result()
+                request_stop = lambda: None
+
+            with pool:
+                while True:
+                    # window 가 빌 때마다 채움 → task 수와 무관하게 일정한 속도로 scheduling
+                    while not exhausted and len(inflight) < max_inflight and not stop_event.is_set():
+                        nxt = next(units, None)
+                        if nxt is None:
+                            exhausted = True
+                            break
+                        i, t = nxt
+                        submitted = i
+                        f = submit(t, i)
+                        index_of[f] = i
+                        inflight.add(f)
+
+                    if not inflight:
+                        break
+
+                    if stop_event.is_set():
+                        # 아직 시작 안 한 task 는 취소, 실행 중인 task 는 watchdog 가 cancel → 종료 대기
+                        request_stop()
+                        cancelled = sum(1 for f in inflight if f.cancel())
+                        submitted -= cancelled
+                        logger.warning(
+                            "EXPORT cancelled | pending cancelled=%d running=%d",
+                            cancelled, len(inflight) - cancelled,
+                        )
+                        for f in wait(inflight).done:
+                            if not f.cancelled():
+                                collect(f)
+                        break
+
+                    done, inflight = wait(inflight, timeout=1, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        collect(f)
+                        _task_done(index_of.pop(f))
+                    if not done:
+                        _task_done(None)
+    finally:
+        watchdog.stop()
+        metrics.set_gauge("export_queue_depth", 0)
+
+    if eta is not None and eta.done_count:
+        eta.maybe_log(logger, total, force=True)
+
+    if submitted < total:
+        logger.warning("EXPORT not started tasks=%d (of %d)", total - submitted, total)
+
+    failed = [t for t in progress_registry.snapshot() if t["status"] in ("failed", "cancelled")]
+    if failed:
+        logger.warning(
+            "EXPORT failed tasks=%d | %s",
+            len(failed),
+            ", ".join(f"{t['key']}({t['status']})" for t in failed),
+        )
 
     logger.info("EXPORT stage end")
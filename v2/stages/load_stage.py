@@ -7,6 +7,10 @@ from pathlib import Path
 
 from v2.engine.path_utils import resolve_path
 from v2.engine.sql_utils import sort_sql_files, resolve_table_name, extract_sqlname_from_csv
+from util.manifest import read_manifest
+from v2.engine.watermark import check_incremental_specs, is_delta_file
+from v2.engine.metrics import metrics
+from v2.engine.profiler import profiler
 
 
 def _now_str() -> str:
@@ -69,6 +73,17 @@ def run(ctx):
     sql_files = sort_sql_files(sql_dir)
     sql_map = {p.stem: p for p in sql_files}  # stem 기준
 
+    # incremental export SQL (job.yml 우선, 없으면 --@watermark: 헤더)
+    #   delta 파일: 같은 key 의 기존 row 를 지우고 적재
+    #   full 파일 : partition 값 (없으면 테이블 전체) 을 한 번에 교체
+    inc_cfg = {Path(k).stem: v for k, v in (export_cfg.get("incremental") or {}).items()}
+    inc_map = check_incremental_specs(sql_files, inc_cfg)
+    if inc_map:
+        logger.info("LOAD incremental | %s", ", ".join(
+            f"{k}(key={','.join(v.keys) or '-'} partition={','.join(v.partition) or '-'})"
+            for k, v in inc_map.items()
+        ))
+
     tgt_type = (target_cfg.get("type") or "").strip().lower()
 
     logger.info("LOAD target type=%s | csv_count=%d", tgt_type, len(csv_files))
@@ -87,8 +102,10 @@ def run(ctx):
 
         try:
             _run_load_loop(ctx, logger, csv_files, sql_map, tgt_type,
-                           load_fn=lambda table, csv_path, file_hash:
-                               load_csv(con, ctx.job_name, table, csv_path, file_hash, ctx.mode))
+                           load_fn=lambda table, csv_path, file_hash, key_cols=None, replace_cols=None:
+                               load_csv(con, ctx.job_name, table, csv_path, file_hash, ctx.mode,
+                                        key_cols=key_cols, replace_cols=replace_cols),
+                           inc_map=inc_map)
         finally:
             con.close()
 
@@ -103,8 +120,10 @@ def run(ctx):
 
         try:
             _run_load_loop(ctx, logger, csv_files, sql_map, tgt_type,
-                           load_fn=lambda table, csv_path, file_hash:
-                               load_csv(con, ctx.job_name, table, csv_path, file_hash, ctx.mode))
+                           load_fn=lambda table, csv_path, file_hash, key_cols=None, replace_cols=None:
+                               load_csv(con, ctx.job_name, table, csv_path, file_hash, ctx.mode,
+                                        key_cols=key_cols, replace_cols=replace_cols),
+                           inc_map=inc_map)
         finally:
             con.close()
 
@@ -115,8 +134,10 @@ def run(ctx):
 
         try:
             _run_load_loop(ctx, logger, csv_files, sql_map, tgt_type,
-                           load_fn=lambda table, csv_path, file_hash:
-                               load_csv(conn, ctx.job_name, table, csv_path, file_hash, ctx.mode))
+                           load_fn=lambda table, csv_path, file_hash, key_cols=None, replace_cols=None:
+                               load_csv(conn, ctx.job_name, table, csv_path, file_hash, ctx.mode,
+                                        key_cols=key_cols, replace_cols=replace_cols),
+                           inc_map=inc_map)
         finally:
             conn.close()
 
@@ -126,11 +147,40 @@ def run(ctx):
     logger.info("LOAD stage end")
 
 
-def _run_load_loop(ctx, logger, csv_files, sql_map, tgt_type, load_fn):
+def _merge_args(spec, csv_path: Path, base_count: int, logger):
+    """
+    incremental SQL 파일 1개의 적재 방식 → (key_cols, replace_cols)
+      delta           : key 기준 merge
+      full + partition: 파일의 partition 값 범위 교체
+      full (base 1개)  : 테이블 전체 교체
+      full (base 여러개, partition 없음): 교체 범위를 알 수 없으므로 append
+    """
+    if is_delta_file(csv_path):
+        return list(spec.keys), None
+    if spec.partition:
+        return None, list(spec.partition)
+    if base_count == 1:
+        return None, []
+    logger.warning(
+        "LOAD full file appended (multiple param files, no partition columns) | %s", csv_path.name,
+    )
+    return None, None
+
+
+def _run_load_loop(ctx, logger, csv_files, sql_map, tgt_type, load_fn, inc_map=None):
     """
     공통 CSV 순회 + 적재 루프.
-    load_fn(table_name, csv_path, file_hash) -> int (row 수, -1이면 skip)
+    load_fn(table_name, csv_path, file_hash, key_cols, replace_cols) -> int (row 수, -1이면 skip)
+    export manifest 가 있으면 checksum / row 수 검증에 사용
+    inc_map: {sqlname: IncrementalSpec} 이면 full 파일 교체 → delta 파일 key merge (이름순 적용)
     """
+    inc_map = inc_map or {}
+    base_counts = {}
+    for p in csv_files:
+        if not is_delta_file(p):
+            name = extract_sqlname_from_csv(p)
+            base_counts[name] = base_counts.get(name, 0) + 1
+
     total = len(csv_files)
     loaded = 0
     skipped = 0
@@ -142,22 +192,48 @@ def _run_load_loop(ctx, logger, csv_files, sql_map, tgt_type, load_fn):
 
         if not sql_file:
             logger.warning("CSV[%d/%d] skip (sql not found): %s", i, total, csv_path.name)
+            metrics.task_end("load_local", csv_path.name, "skipped", elapsed=0)
             skipped += 1
             continue
 
         table_name = resolve_table_name(sql_file)
-        file_hash = _sha256_file(csv_path)
+
+        profiler.task_begin("load_local", csv_path.name)
+
+        # export manifest 가 유효하면 그 checksum 사용 (파일 재해시 생략)
+        with profiler.phase("hash"):
+            manifest = read_manifest(csv_path)
+            file_hash = manifest["sha256"] if manifest and manifest.get("sha256") else _sha256_file(csv_path)
 
         logger.info("LOAD [%d/%d] | table=%s | file=%s", i, total, table_name, csv_path.name)
 
+        metrics.task_start("load_local", csv_path.name)
+        nbytes = csv_path.stat().st_size
+
         try:
-            result = load_fn(table_name, csv_path, file_hash)
+            with profiler.phase("load"):
+                spec = inc_map.get(sqlname)
+                if spec is None:
+                    result = load_fn(table_name, csv_path, file_hash)
+                else:
+                    key_cols, replace_cols = _merge_args(spec, csv_path, base_counts.get(sqlname, 0), logger)
+                    result = load_fn(table_name, csv_path, file_hash, key_cols, replace_cols)
             if result == -1:
                 skipped += 1
+                metrics.task_end("load_local", csv_path.name, "skipped")
             else:
                 loaded += 1
+                metrics.task_end("load_local", csv_path.name, "done", rows=result, nbytes=nbytes)
+                if manifest and manifest.get("rows") is not None and result != manifest["rows"]:
+                    logger.warning(
+                        "LOAD row count mismatch | table=%s | file=%s | manifest=%d loaded=%d",
+                        table_name, csv_path.name, manifest["rows"], result,
+                    )
         except Exception as e:
             logger.exception("LOAD failed | table=%s | file=%s | %s", table_name, csv_path.name, e)
+            metrics.task_end("load_local", csv_path.name, "failed")
             failed += 1
+        finally:
+            profiler.task_end()
 
     logger.info("LOAD summary | loaded=%d skipped=%d failed=%d", loaded, skipped, failed)
\ No newline at end of file
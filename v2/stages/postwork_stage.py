@@ -1,5 +1,339 @@
 # file: v2/stages/postwork_stage.py
 
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from util.sql_hash import compute_sql_hash
+from v2.engine.path_utils import resolve_path
+from v2.engine.sql_utils import sort_sql_files
+from v2.engine.sql_deps import extract_table_refs, build_dependencies
+from v2.engine.runtime_state import stop_event
+from v2.engine.metrics import metrics, HISTORY_STATUS
+from v2.engine.profiler import profiler
+
+
+@dataclass
+class PostworkItem:
+    sql_file: Path
+    rel_path: str
+    sql_text: str
+    sql_hash: str
+    reads: set = field(default_factory=set)
+    writes: set = field(default_factory=set)
+    input_sig: str = ""
+
+
+# ---------------------------
+# SQL 수집 (폴더 단위 그룹)
+# ---------------------------
+def collect_sql_groups(sql_dir: Path) -> list:
+    """
+    sql_dir 바로 아래 SQL → 하위 폴더(이름순) 순서로 그룹 생성
+    그룹 간에는 barrier (01_stage 완료 후 02_mart 시작)
+    """
+    dirs = [sql_dir] + sorted(
+        (p for p in sql_dir.rglob("*") if p.is_dir() and p.name != "_backup"),
+        key=lambda p: p.relative_to(sql_dir).as_posix().lower(),
+    )
+
+    groups = []
+    for d in dirs:
+        files = sort_sql_files(d)
+        if not files:
+            continue
+
+        name = d.relative_to(sql_dir).as_posix() if d != sql_dir else "."
+        groups.append((name, files))
+
+    return groups
+
+
+def build_items(sql_dir: Path, files: list) -> list:
+    items = []
+    for f in files:
+        sql_text = f.read_text(encoding="utf-8")
+        reads, writes = extract_table_refs(sql_text)
+
+        items.append(PostworkItem(
+            sql_file=f,
+            rel_path=f.relative_to(sql_dir).as_posix(),
+            sql_text=sql_text,
+            sql_hash=compute_sql_hash(sql_text),
+            reads=reads,
+            writes=writes,
+        ))
+    return items
+
+
+# ---------------------------
+# Incremental 판단
+# ---------------------------
+def build_producers(all_items: list) -> dict:
+    """
+    {테이블명: [해당 테이블을 write 하는 postwork SQL rel_path, ...]}
+    """
+    producers = {}
+    for it in all_items:
+        for t in it.writes:
+            producers.setdefault(t, []).append(it.rel_path)
+    return producers
+
+
+def compute_input_sig(item: PostworkItem, load_versions: dict, producers: dict,
+                      producer_version) -> str:
+    """
+    read 테이블별 버전을 묶은 signature
+      - postwork SQL이 만든 테이블: 생산 SQL의 마지막 성공 (run_id, finished_at)
+      - 적재 테이블: _LOAD_HISTORY 기반 버전
+      - 그 외(외부 테이블 등): '-'
+    """
+    parts = []
+    for t in sorted(item.reads):
+        if t in producers:
+            v = "|".join(producer_version(p) for p in producers[t])
+        else:
+            v = load_versions.get(t, "-")
+        parts.append(f"{t}={v}")
+    return compute_sql_hash("\n".join(parts))
+
+
+# ---------------------------
+# 단건 실행 (worker thread)
+# ---------------------------
+def _execute_one(cur, item: PostworkItem):
+    """
+    반환: (row 수 또는 None, elapsed)
+    DuckDB는 CREATE TABLE AS / INSERT 결과로 Count 컬럼 1행을 돌려줌
+    """
+    start = time.time()
+    try:
+        cur.execute(item.sql_text)
+
+        rows = None
+        desc = cur.description
+        if desc and len(desc) == 1 and str(desc[0][0]).lower() == "count":
+            r = cur.fetchone()
+            rows = int(r[0]) if r else None
+
+        return rows, time.time() - start
+    finally:
+        try:
+            cur.close()
+        except Exception:
+            pass
+
+
+# ---------------------------
+# 그룹 실행 (의존성 그래프 기반 병렬)
+# ---------------------------
+def _run_group(ctx, con, group_name, items, workers, failed_tables, record, stats,
+               is_unchanged=None):
+    """
+    is_unchanged(item) -> bool : True면 실행하지 않고 SKIP (incremental)
+    """
+    logger = ctx.logger
+
+    deps = build_dependencies([(it.rel_path, it.reads, it.writes) for it in items])
+    by_key = {it.rel_path: it for it in items}
+    order = [it.rel_path for it in items]
+    total = len(items)
+
+    logger.info("POSTWORK group=%s | sql=%d | workers=%d", group_name, total, workers)
+    for it in items:
+        logger.debug(
+            "POSTWORK deps | %s | reads=%s writes=%s after=%s",
+            it.rel_path, sorted(it.reads), sorted(it.writes), sorted(deps[it.rel_path]),
+        )
+
+    pending = list(order)
+    finished = set()
+    running = {}
+
+    def _ready(key):
+        return deps[key] <= finished
+
+    def _skip_upstream(item, reason):
+        logger.warning("POSTWORK SKIP (%s) | %s", reason, item.rel_path)
+        failed_tables.update(item.writes)
+        record(item, "SKIP", None, 0.0, reason)
+        stats["skipped"] += 1
+
+    def _skip_unchanged(item):
+        logger.info("POSTWORK SKIP (unchanged) | %s", item.rel_path)
+        record(item, "SKIP", None, 0.0, "unchanged")
+        stats["unchanged"] += 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending or running:
+            if stop_event.is_set() and pending:
+                logger.warning("POSTWORK stopped by user | group=%s | not started=%d",
+                               group_name, len(pending))
+                pending.clear()
+
+            for key in list(pending):
+                if len(running) >= workers:
+                    break
+                if not _ready(key):
+                    continue
+
+                pending.remove(key)
+                item = by_key[key]
+
+                blocked = item.reads & failed_tables
+                if blocked:
+                    _skip_upstream(item, f"upstream failed: {','.join(sorted(blocked))}")
+                    finished.add(key)
+                    continue
+
+                if is_unchanged and is_unchanged(item):
+                    _skip_unchanged(item)
+                    finished.add(key)
+                    continue
+
+                idx = order.index(key) + 1
+                logger.info("POSTWORK [%s %d/%d] start: %s", group_name, idx, total, key)
+                metrics.task_start("postwork", key)
+                running[executor.submit(_execute_one, con.cursor(), item)] = key
+
+            if not running:
+                # 선행 SQL은 항상 앞 순서이므로 running이 비면 pending 첫 항목은 ready
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for fut in done:
+                key = running.pop(fut)
+                item = by_key[key]
+                finished.add(key)
+
+                try:
+                    rows, elapsed = fut.result()
+                    logger.info(
+                        "POSTWORK done | %s | rows=%s | %.2fs",
+                        key, "-" if rows is None else rows, elapsed,
+                    )
+                    record(item, "OK", rows, elapsed, "")
+                    stats["ok"] += 1
+
+                except Exception as e:
+                    error_msg = str(e)[:500]
+                    logger.error("POSTWORK FAIL | %s | %s", key, error_msg)
+                    failed_tables.update(item.writes)
+                    record(item, "FAIL", None, 0.0, error_msg)
+                    stats["failed"] += 1
+
+
+# ---------------------------
+# Stage entry
+# ---------------------------
 def run(ctx):
-    ctx.logger.info("POSTWORK stage start")
-    ctx.logger.info("POSTWORK stage end")
+    logger = ctx.logger
+    job_cfg = ctx.job_config
+
+    logger.info("POSTWORK stage start")
+
+    if ctx.mode == "plan":
+        logger.info("POSTWORK stage skipped (plan mode)")
+        logger.info("POSTWORK stage end")
+        return
+
+    postwork_cfg = job_cfg.get("postwork")
+    if not postwork_cfg:
+        logger.info("POSTWORK stage skipped (no config)")
+        logger.info("POSTWORK stage end")
+        return
+
+    target_cfg = job_cfg.get("target", {})
+    tgt_type = (target_cfg.get("type") or "").strip().lower()
+    if tgt_type != "duckdb":
+        logger.warning("POSTWORK stage skipped (target type=%s, duckdb only)", tgt_type or "-")
+        logger.info("POSTWORK stage end")
+        return
+
+    sql_dir = resolve_path(ctx, postwork_cfg.get("sql_dir", "sql/postwork"))
+    if not sql_dir.exists():
+        logger.warning("POSTWORK sql dir not found: %s", sql_dir)
+        logger.info("POSTWORK stage end")
+        return
+
+    groups = collect_sql_groups(sql_dir)
+    if not groups:
+        logger.warning("No SQL files found in %s", sql_dir)
+        logger.info("POSTWORK stage end")
+        return
+
+    workers = max(1, int(postwork_cfg.get("parallel_workers", 1)))
+
+    # retry 모드는 전체 재실행 (load stage의 retry = 강제 재적재와 동일한 의미)
+    incremental = bool(postwork_cfg.get("incremental", True)) and ctx.mode != "retry"
+
+    from v2.adapters.targets.duckdb_target import (
+        connect, _ensure_postwork_history, _insert_postwork_history,
+        _last_postwork_success, _load_versions, _existing_tables,
+    )
+
+    db_path = resolve_path(ctx, target_cfg.get("db_path", "data/local/result.duckdb"))
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    con = connect(db_path)
+    _ensure_postwork_history(con)
+
+    group_items = [(name, build_items(sql_dir, files)) for name, files in groups]
+    producers = build_producers([it for _, items in group_items for it in items])
+
+    def record(item, status, rows, elapsed, error_message):
+        # history 기록은 main thread에서만 수행
+        _insert_postwork_history(
+            con, ctx.job_name, ctx.run_id, item.rel_path, item.sql_hash,
+            status, rows, round(elapsed, 2), error_message, item.input_sig,
+        )
+        metrics.task_end("postwork", item.rel_path, HISTORY_STATUS.get(status, status),
+                         rows=rows, elapsed=elapsed)
+        if status == "OK":
+            profiler.add("postwork", item.rel_path, "execute", elapsed)
+
+    def producer_version(rel_path):
+        last = _last_postwork_success(con, ctx.job_name, rel_path)
+        return f"{last[2]}@{last[3]}" if last else "-"
+
+    def is_unchanged(item):
+        # ready 시점에 계산 → 같은 실행에서 먼저 재계산된 선행 SQL 반영
+        item.input_sig = compute_input_sig(item, load_versions, producers, producer_version)
+
+        if not incremental or not item.writes:
+            return False
+
+        last = _last_postwork_success(con, ctx.job_name, item.rel_path)
+        if not last:
+            return False
+
+        return (
+            last[0] == item.sql_hash
+            and last[1] == item.input_sig
+            and item.writes <= _existing_tables(con)
+        )
+
+    stats = {"ok": 0, "unchanged": 0, "skipped": 0, "failed": 0}
+    failed_tables = set()
+
+    try:
+        load_versions = _load_versions(con)
+        logger.info("POSTWORK incremental=%s | load tables=%d", incremental, len(load_versions))
+
+        for group_name, items in group_items:
+            if stop_event.is_set():
+                logger.warning("POSTWORK stopped before group=%s", group_name)
+                break
+
+            _run_group(ctx, con, group_name, items, workers, failed_tables, record, stats,
+                       is_unchanged=is_unchanged)
+    finally:
+        con.close()
+
+    logger.info(
+        "POSTWORK summary | ok=%d unchanged=%d skipped=%d failed=%d",
+        stats["ok"], stats["unchanged"], stats["skipped"], stats["failed"],
+    )
+    logger.info("POSTWORK stage end")
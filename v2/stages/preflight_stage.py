@@ -0,0 +1,224 @@
+# file: v2/stages/preflight_stage.py
+
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from v2.adapters.sources.oracle_client import init_oracle_client, get_oracle_conn
+from v2.engine.path_utils import resolve_path
+from v2.engine.sql_utils import sort_sql_files
+from v2.engine.runtime_state import stop_event
+from v2.engine.estimators import get_estimator, EstimateCache, estimate_cache_path
+from v2.engine.planner import load_run_history, simulate_workers
+from v2.stages.export_stage import expand_param_values, plan_export_tasks, iter_export_tasks
+from util.sql_hash import compute_sql_hash
+
+# =========================================================
+# preflight: export 전에 렌더링 SQL 별 optimizer 예상치(row / cost) 수집
+#   - cache(sql_hash) 에 있으면 DB 조회 생략 (cache_ttl_hours)
+#   - export.order: estimate 이면 export stage 가 예상 row 큰 순으로 실행 + ETA 표시
+#   - 큰 결과는 parquet / partition hint 기록 (v2 export 는 csv 전용 → 표시만)
+# =========================================================
+
+DEFAULT_PARQUET_ROWS = 5_000_000
+DEFAULT_PARTITION_ROWS = 50_000_000
+
+
+def _make_connector(ctx, estimator_name: str, pf_cfg: dict):
+    """
+    estimator 별 connection 생성 함수 (thread 마다 1개)
+    """
+    env_cfg = ctx.env_config
+    host_name = ctx.job_config.get("source", {}).get("host")
+
+    if estimator_name == "duckdb":
+        import duckdb
+        db_path = resolve_path(ctx, pf_cfg.get("db_path", "data/local/result.duckdb"))
+        return lambda: duckdb.connect(str(db_path), read_only=True)
+
+    if estimator_name == "oracle":
+        oracle_cfg = env_cfg["sources"]["oracle"]
+        host_cfg = oracle_cfg["hosts"].get(host_name)
+        if not host_cfg:
+            raise RuntimeError(f"Oracle host not found: {host_name}")
+        init_oracle_client(oracle_cfg)
+        return lambda: get_oracle_conn(host_cfg)
+
+    if estimator_name == "vertica":
+        from v2.adapters.sources.vertica_client import get_vertica_conn
+        host_cfg = env_cfg["sources"]["vertica"]["hosts"].get(host_name)
+        if not host_cfg:
+            raise RuntimeError(f"Vertica host not found: {host_name}")
+        return lambda: get_vertica_conn(host_cfg)
+
+    raise ValueError(f"No connection for estimator: {estimator_name}")
+
+
+def build_hints(rows: int | None, pf_cfg: dict) -> list:
+    if rows is None:
+        return []
+    hints = []
+    if rows >= int(pf_cfg.get("parquet_rows", DEFAULT_PARQUET_ROWS)):
+        hints.append("parquet")
+    if rows >= int(pf_cfg.get("partition_rows", DEFAULT_PARTITION_ROWS)):
+        hints.append("partition")
+    return hints
+
+
+def _history_rate(out_dir) -> float | None:
+    """
+    과거 run export 처리량 (rows/sec, worker 1개 기준)
+    """
+    rows = sec = 0
+    for (stage, _), h in load_run_history(out_dir).items():
+        if stage == "export" and h.get("rows"):
+            rows += h["rows"]
+            sec += h["elapsed_sec"]
+    return rows / sec if sec > 0 else None
+
+
+def _fmt_rows(n) -> str:
+    if n is None:
+        return "?"
+    for unit, div in (("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if n >= div:
+            return f"{n / div:.1f}{unit}"
+    return str(int(n))
+
+
+# ---------------------------
+# Stage entry
+# ---------------------------
+def run(ctx):
+    logger = ctx.logger
+    job_cfg = ctx.job_config
+
+    if ctx.mode == "plan":
+        logger.info("PREFLIGHT stage skipped (plan mode)")
+        return
+
+    export_cfg = job_cfg.get("export")
+    if not export_cfg:
+        logger.info("PREFLIGHT stage skipped (no export config)")
+        return
+
+    pf_cfg = job_cfg.get("preflight", {}) or {}
+    source_sel = job_cfg.get("source", {})
+    host_name = source_sel.get("host")
+    estimator_name = pf_cfg.get("estimator") or source_sel.get("type", "oracle")
+    estimator = get_estimator(estimator_name)
+    workers = int(pf_cfg.get("workers", 4))
+
+    sql_dir = resolve_path(ctx, export_cfg["sql_dir"])
+    out_dir = resolve_path(ctx, export_cfg["out_dir"]) / ctx.job_name
+    sql_files = sort_sql_files(sql_dir)
+    if not sql_files:
+        logger.warning("No SQL files found in %s", sql_dir)
+        return
+
+    compression = export_cfg.get("compression", "none")
+    ext = "csv.gz" if compression == "gzip" else "csv"
+    overwrite = export_cfg.get("overwrite", False)
+
+    param_values = expand_param_values(ctx.params)
+    task_plan = plan_export_tasks(sql_files, param_values, host_name, ext, out_dir)
+
+    cache = EstimateCache(estimate_cache_path(out_dir, pf_cfg), pf_cfg.get("cache_ttl_hours", 24))
+
+    # export 가 실제로 실행할 task 만 (결과 파일이 모두 있으면 skip 대상)
+    todo = []
+    cached = 0
+    results = {}
+    for t in iter_export_tasks(sql_files, param_values, host_name, ext, out_dir, task_plan):
+        if not overwrite and all(f.exists() for f in [t.out_file] + [c[2] for c in t.copies]):
+            continue
+        sql_hash = compute_sql_hash(t.rendered_sql)
+        hit = cache.get(sql_hash, estimator_name)
+        if hit is not None:
+            cached += 1
+            results[t.out_file.name] = hit
+        else:
+            todo.append((t, sql_hash))
+
+    logger.info(
+        "PREFLIGHT estimator=%s | tasks=%d | cached=%d explain=%d | workers=%d",
+        estimator_name, cached + len(todo), cached, len(todo), workers,
+    )
+
+    if todo:
+        connect = _make_connector(ctx, estimator_name, pf_cfg)
+        local = threading.local()
+        conns = []
+        conns_lock = threading.Lock()
+
+        def _explain(item):
+            t, sql_hash = item
+            if stop_event.is_set():
+                return
+            conn = getattr(local, "conn", None)
+            if conn is None:
+                conn = local.conn = connect()
+                with conns_lock:
+                    conns.append(conn)
+            start = time.time()
+            try:
+                est = estimator(conn, t.rendered_sql)
+            except Exception as e:
+                first_line = (str(e).strip().splitlines() or [type(e).__name__])[0]
+                logger.warning("PREFLIGHT explain failed | %s | %s", t.out_file.name, first_line)
+                return
+            entry = dict(est, estimator=estimator_name, sql=t.sql_file.name,
+                         hints=build_hints(est.get("rows"), pf_cfg))
+            cache.put(sql_hash, entry)
+            results[t.out_file.name] = entry
+            logger.debug("PREFLIGHT %s rows=%s cost=%s (%.2fs)",
+                         t.out_file.name, est.get("rows"), est.get("cost"), time.time() - start)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_explain, todo))
+        finally:
+            for c in conns:
+                try:
+                    c.close()
+                except Exception:
+                    pass
+            cache.save()
+
+    if not results:
+        logger.info("PREFLIGHT no estimates")
+        return
+
+    # ---- summary ----
+    known = {k: e for k, e in results.items() if e.get("rows") is not None}
+    total_rows = sum(e["rows"] for e in known.values())
+    top = sorted(known.items(), key=lambda kv: kv[1]["rows"], reverse=True)[: int(pf_cfg.get("top", 5))]
+    for name, e in top:
+        logger.info(
+            "PREFLIGHT top | %s rows=%s cost=%s%s",
+            name, _fmt_rows(e["rows"]), _fmt_rows(e.get("cost")),
+            f" | hint={','.join(e['hints'])}" if e.get("hints") else "",
+        )
+
+    hinted = [k for k, e in results.items() if e.get("hints")]
+    if hinted:
+        # v2 export 는 csv 단일 파일만 지원 → hint 는 cache / 로그에만 남김
+        logger.info("PREFLIGHT hints | %d task(s) suggest parquet/partition (not applied)", len(hinted))
+
+    rate = _history_rate(out_dir)
+    parallel_workers = export_cfg.get("parallel_workers", 1)
+    if rate:
+        median_rows = statistics.median(e["rows"] for e in known.values()) if known else 0
+        durations = [(e["rows"] if e.get("rows") is not None else median_rows) / rate
+                     for e in results.values()]
+        logger.info(
+            "PREFLIGHT estimate | rows=%s (unknown=%d) | rate=%s rows/s | ETA ~%.0fs (workers=%d)",
+            _fmt_rows(total_rows), len(results) - len(known), _fmt_rows(rate),
+            simulate_workers(durations, parallel_workers), parallel_workers,
+        )
+    else:
+        logger.info(
+            "PREFLIGHT estimate | rows=%s (unknown=%d) | ETA unknown (no export history)",
+            _fmt_rows(total_rows), len(results) - len(known),
+        )
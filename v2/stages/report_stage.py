@@ -1,60 +1,344 @@
 # file: v2/stages/report_stage.py
 
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from util.sql_hash import compute_sql_hash
+from v2.engine.path_utils import resolve_path
+from v2.engine.sql_utils import sort_sql_files
+from v2.engine.sql_deps import extract_table_refs
+from v2.engine.runtime_state import stop_event
+from v2.engine.metrics import metrics, HISTORY_STATUS
+from v2.engine.profiler import profiler
+from v2.stages.export_stage import (
+    expand_params, sanitize_sql, build_csv_name, _render_sql, used_params,
+)
+from v2.stages.postwork_stage import (
+    collect_sql_groups, build_items, build_producers, compute_input_sig,
+)
 
+FETCH_SIZE = 10000
+
+
+@dataclass
+class ReportItem:
+    name: str                # sqlname 또는 sqlname__k_v (history key / Excel 시트명)
+    sql_file: Path
+    sql_text: str            # 파라미터 치환 완료
+    sql_hash: str
+    reads: set
+    out_file: Path = None
+    input_sig: str = ""
+
+
+# ---------------------------
+# 리포트 목록 생성
+# ---------------------------
+def build_report_items(sql_dir: Path, param_sets: list, out_dir: Path, ext: str) -> list:
+    """
+    SQL x 파라미터 조합 → ReportItem
+    - 파일명에는 SQL이 사용하는 파라미터만 포함
+    - 렌더링 결과가 같은 조합은 1건만 생성
+    """
+    items = []
+    for sql_file in sort_sql_files(sql_dir):
+        raw = sql_file.read_text(encoding="utf-8")
+        reads, _ = extract_table_refs(raw)
+
+        seen = set()
+        for param_set in param_sets:
+            used = used_params(raw, param_set)
+            key = tuple(sorted(used.items()))
+            if key in seen:
+                continue
+            seen.add(key)
+
+            sql_text = sanitize_sql(_render_sql(raw, used))
+            name = build_csv_name(sql_file.stem, None, used, ext)[: -len(ext) - 1]
+
+            items.append(ReportItem(
+                name=name,
+                sql_file=sql_file,
+                sql_text=sql_text,
+                sql_hash=compute_sql_hash(sql_text),
+                reads=reads,
+                out_file=out_dir / f"{name}.{ext}" if out_dir else None,
+            ))
+
+    return items
+
+
+# ---------------------------
+# DuckDB → 파일 / Excel
+# ---------------------------
+def _copy_options(fmt: str, compression: str) -> str:
+    if fmt == "parquet":
+        return "FORMAT parquet, COMPRESSION zstd"
+
+    opts = "FORMAT csv, HEADER true"
+    if compression == "gzip":
+        opts += ", COMPRESSION gzip"
+    return opts
+
+
+def _export_one(cur, item: ReportItem, copy_opts: str):
+    """
+    COPY (SELECT ...) TO 로 DuckDB가 직접 파일 기록 (python 으로 row 를 옮기지 않음)
+    tmp 파일에 쓴 뒤 rename → 실패 시 기존 결과 파일 유지
+    반환: (row 수, elapsed)
+    """
+    start = time.time()
+    tmp = item.out_file.with_name(item.out_file.name + ".tmp")
+    try:
+        path = tmp.as_posix().replace("'", "''")
+        r = cur.execute(f"COPY ({item.sql_text}) TO '{path}' ({copy_opts})").fetchone()
+        tmp.replace(item.out_file)
+        return (int(r[0]) if r else 0), time.time() - start
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+        try:
+            cur.close()
+        except Exception:
+            pass
+
+
+def iter_query_rows(con, sql_text: str, fetch_size: int = FETCH_SIZE):
+    """
+    header 1행 + data row 를 fetchmany 단위로 yield (Excel streaming writer 입력)
+    """
+    cur = con.cursor()
+    try:
+        cur.execute(sql_text)
+        yield [d[0] for d in cur.description]
+
+        while True:
+            rows = cur.fetchmany(fetch_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cur.close()
+
+
+def _write_excel(ctx, con, items: list, output: Path, use_files: bool):
+    from transform.csv_to_excel import iter_file_rows, write_excel_streaming
+
+    sheets = []
+    for it in items:
+        if use_files and it.out_file and it.out_file.exists():
+            rows = iter_file_rows(it.out_file)
+        else:
+            rows = iter_query_rows(con, it.sql_text)
+        sheets.append((it.name.upper(), rows))
+
+    start = time.time()
+    summary = write_excel_streaming(output, sheets)
+
+    ctx.logger.info(
+        "REPORT excel done | %s | sheets=%d | %.2fs",
+        output.name, len(summary), time.time() - start,
+    )
+
+
+# ---------------------------
+# Stage entry
+# ---------------------------
 def run(ctx):
     logger = ctx.logger
+    job_cfg = ctx.job_config
 
-    report_cfg = ctx.job_config.get("report")
+    report_cfg = job_cfg.get("report")
     if not report_cfg:
         logger.info("REPORT stage skipped (no config)")
         return
 
     logger.info("REPORT stage start")
 
-    # -----------------------------
-    # CSV Export (골격)
-    # -----------------------------
+    if ctx.mode == "plan":
+        logger.info("REPORT stage skipped (plan mode)")
+        logger.info("REPORT stage end")
+        return
+
+    target_cfg = job_cfg.get("target", {})
+    tgt_type = (target_cfg.get("type") or "").strip().lower()
+    if tgt_type != "duckdb":
+        logger.warning("REPORT stage skipped (target type=%s, duckdb only)", tgt_type or "-")
+        logger.info("REPORT stage end")
+        return
+
     export_csv_cfg = report_cfg.get("export_csv", {})
-    if export_csv_cfg.get("enabled", False):
+    excel_cfg = report_cfg.get("excel", {})
+    csv_enabled = export_csv_cfg.get("enabled", False)
+    excel_enabled = excel_cfg.get("enabled", False)
 
-        sql_dir = export_csv_cfg.get("sql_dir")
-        out_dir = export_csv_cfg.get("out_dir")
+    if not csv_enabled and not excel_enabled:
+        logger.info("REPORT csv / excel export skipped (disabled)")
+        logger.info("REPORT stage end")
+        return
 
-        logger.info(
-            "REPORT csv export | sql_dir=%s out_dir=%s",
-            sql_dir,
-            out_dir,
+    sql_dir_str = export_csv_cfg.get("sql_dir") or excel_cfg.get("sql_dir") or "sql/report"
+    sql_dir = resolve_path(ctx, sql_dir_str)
+    if not sql_dir.exists():
+        logger.warning("REPORT sql dir not found: %s", sql_dir)
+        logger.info("REPORT stage end")
+        return
+
+    fmt = (export_csv_cfg.get("format") or "csv").lower()
+    compression = export_csv_cfg.get("compression", "none")
+    ext = "parquet" if fmt == "parquet" else ("csv.gz" if compression == "gzip" else "csv")
+
+    out_dir = None
+    if csv_enabled:
+        out_dir = resolve_path(ctx, export_csv_cfg.get("out_dir", "data/report")) / ctx.job_name
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    items = build_report_items(sql_dir, expand_params(ctx.params), out_dir, ext)
+    if not items:
+        logger.warning("No SQL files found in %s", sql_dir)
+        logger.info("REPORT stage end")
+        return
+
+    workers = int(report_cfg.get("parallel_workers", 1))
+    incremental = bool(report_cfg.get("incremental", True)) and ctx.mode != "retry"
+
+    from v2.adapters.targets.duckdb_target import (
+        connect, _ensure_report_history, _insert_report_history, _last_report_success,
+        _ensure_postwork_history, _last_postwork_success, _load_versions,
+    )
+
+    db_path = resolve_path(ctx, target_cfg.get("db_path", "data/local/result.duckdb"))
+    if not db_path.exists():
+        logger.warning("REPORT target db not found: %s", db_path)
+        logger.info("REPORT stage end")
+        return
+
+    con = connect(db_path)
+    _ensure_report_history(con)
+    _ensure_postwork_history(con)
+
+    # 입력 테이블 버전 = _LOAD_HISTORY + 해당 테이블을 만드는 postwork SQL 의 마지막 성공
+    producers = {}
+    postwork_cfg = job_cfg.get("postwork") or {}
+    pw_dir = resolve_path(ctx, postwork_cfg.get("sql_dir", "sql/postwork"))
+    if postwork_cfg and pw_dir.exists():
+        producers = build_producers(
+            [it for _, files in collect_sql_groups(pw_dir) for it in build_items(pw_dir, files)]
         )
 
-        # TODO:
-        # 1. sql_dir 내 SQL 순차 실행
-        # 2. 결과를 CSV로 저장
-        # 3. ctx.params 치환 적용
+    def producer_version(rel_path):
+        last = _last_postwork_success(con, ctx.job_name, rel_path)
+        return f"{last[2]}@{last[3]}" if last else "-"
 
-    else:
-        logger.info("REPORT csv export skipped")
+    stats = {"ok": 0, "unchanged": 0, "failed": 0}
+    failed = set()
 
-    # -----------------------------
-    # Excel Reporting (골격)
-    # -----------------------------
-    excel_cfg = report_cfg.get("excel", {})
-    if excel_cfg.get("enabled", False):
+    try:
+        load_versions = _load_versions(con)
+
+        for it in items:
+            it.input_sig = compute_input_sig(it, load_versions, producers, producer_version)
 
-        output_xlsx = excel_cfg.get("output")
+        def is_unchanged(it):
+            if not incremental:
+                return False
+            last = _last_report_success(con, ctx.job_name, it.name)
+            if not last or last[0] != it.sql_hash or last[1] != it.input_sig:
+                return False
+            # csv 비활성(excel 전용) 이력은 out_file 이 비어 있음
+            if it.out_file:
+                return last[2] == str(it.out_file) and it.out_file.exists()
+            return not last[2]
+
+        def record(it, status, rows, elapsed, error_message=""):
+            _insert_report_history(
+                con, ctx.job_name, ctx.run_id, it.name,
+                str(it.out_file) if it.out_file else "",
+                it.sql_hash, it.input_sig, status, rows, round(elapsed, 2), error_message,
+            )
+            nbytes = it.out_file.stat().st_size if it.out_file and it.out_file.exists() else 0
+            metrics.task_end("report", it.name, HISTORY_STATUS.get(status, status),
+                             rows=rows, nbytes=nbytes, elapsed=elapsed)
+            if status == "OK":
+                profiler.add("report", it.name, "execute", elapsed)
+
+        todo = []
+        for it in items:
+            if is_unchanged(it):
+                logger.info("REPORT SKIP (unchanged) | %s", it.name)
+                stats["unchanged"] += 1
+            else:
+                todo.append(it)
 
         logger.info(
-            "REPORT excel export | output=%s",
-            output_xlsx,
+            "REPORT items=%d | run=%d | unchanged=%d | workers=%d | incremental=%s",
+            len(items), len(todo), stats["unchanged"], workers, incremental,
         )
 
-        # TODO:
-        # 1. CSV merge
-        # 2. 시트 생성
-        # 3. 저장
+        # -----------------------------
+        # CSV / Parquet Export (COPY TO, 리포트 간 병렬)
+        # -----------------------------
+        if csv_enabled and todo:
+            copy_opts = _copy_options(fmt, compression)
+
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                futures = {}
+                for it in todo:
+                    if stop_event.is_set():
+                        logger.warning("REPORT stopped by user")
+                        break
+                    futures[executor.submit(_export_one, con.cursor(), it, copy_opts)] = it
+
+                for fut in as_completed(futures):
+                    it = futures[fut]
+                    try:
+                        rows, elapsed = fut.result()
+                        logger.info(
+                            "REPORT done | %s | rows=%d | %.2fs",
+                            it.out_file.name, rows, elapsed,
+                        )
+                        record(it, "OK", rows, elapsed)
+                        stats["ok"] += 1
+                    except Exception as e:
+                        error_msg = str(e)[:500]
+                        logger.error("REPORT FAIL | %s | %s", it.name, error_msg)
+                        record(it, "FAIL", None, 0.0, error_msg)
+                        failed.add(it.name)
+                        stats["failed"] += 1
+        elif not csv_enabled:
+            logger.info("REPORT csv export skipped")
+
+        # -----------------------------
+        # Excel Reporting (streaming, 리포트 1건 = 시트 1개)
+        # -----------------------------
+        if excel_enabled:
+            output = resolve_path(ctx, excel_cfg.get("output", "data/report/report.xlsx"))
+
+            if len(todo) == len(failed) and output.exists():
+                logger.info("REPORT excel SKIP (unchanged) | %s", output.name)
+            elif stop_event.is_set():
+                logger.warning("REPORT excel skipped (stopped by user)")
+            else:
+                try:
+                    sheets = [it for it in items if it.name not in failed]
+                    _write_excel(ctx, con, sheets, output, use_files=csv_enabled)
+                    if not csv_enabled:
+                        for it in todo:
+                            record(it, "OK", None, 0.0)
+                            stats["ok"] += 1
+                except Exception as e:
+                    logger.exception("REPORT excel FAIL | %s | %s", output.name, e)
+                    stats["failed"] += 1
+        else:
+            logger.info("REPORT excel export skipped")
 
-    else:
-        logger.info("REPORT excel export skipped")
+    finally:
+        con.close()
 
+    logger.info(
+        "REPORT summary | ok=%d unchanged=%d failed=%d",
+        stats["ok"], stats["unchanged"], stats["failed"],
+    )
     logger.info("REPORT stage end")